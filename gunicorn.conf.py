@@ -0,0 +1,24 @@
+import os
+import shutil
+import tempfile
+
+# Every worker writes its Prometheus samples here so a /metrics scrape of any
+# worker covers all of them (see jobboard.metrics). Set before the app, and
+# so prometheus_client, is imported.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(tempfile.gettempdir(), "jobboard-prometheus"),
+)
+
+
+def on_starting(server):
+    # Samples from a previous run would otherwise be summed in.
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class JobboardConfig(AppConfig):
+    name = "jobboard"
+
+    def ready(self):
+        from .middleware import install_query_recorder
+
+        # Before any connection opens, so every one reports to the request metrics
+        connection_created.connect(install_query_recorder)
@@ -3,6 +3,11 @@ ASGI config for jobboard project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The Procfile's ``async`` process serves it for the async and streaming routes
+next to the WSGI ``web`` process. Async views run their queries from
+per-request threads, so that process sets ``DB_CONN_MAX_AGE=0`` rather than
+keep a connection open per thread; put a pooler (e.g. PgBouncer) in front.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -14,3 +19,13 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jobboard.settings")
 
 application = get_asgi_application()
+
+# Build the OpenAPI schema while the worker boots, not on the first docs request.
+from jobboard.schema import schema_cache  # noqa: E402
+
+schema_cache.warm()
+
+# This process serves the notification stream: a bad broker URL fails the boot.
+from jobs.broker import get_broker  # noqa: E402
+
+get_broker()
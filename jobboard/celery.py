@@ -8,3 +8,38 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+app.conf.beat_schedule = {
+    # Safety net for outbox events whose on-commit dispatch never reached the broker.
+    "drain-notification-outbox": {
+        "task": "jobs.tasks.drain_notification_outbox",
+        "schedule": 60.0,
+    },
+    "send-job-alerts": {
+        "task": "jobs.tasks.send_job_alerts",
+        "schedule": 60.0,
+    },
+    "purge-stale-resume-uploads": {
+        "task": "jobs.tasks.purge_stale_resume_uploads",
+        "schedule": 3600.0,
+    },
+    # Counters are kept in step transactionally; this only repairs drift.
+    "reconcile-job-stats": {
+        "task": "jobs.tasks.reconcile_job_stats",
+        "schedule": 86400.0,
+    },
+    # Users with new favorites or applications get fresh recommendations
+    # within minutes; the nightly full run brings new jobs to everyone else.
+    "refresh-job-recommendations": {
+        "task": "jobs.tasks.refresh_job_recommendations",
+        "schedule": 600.0,
+    },
+    "rebuild-job-recommendations": {
+        "task": "jobs.tasks.refresh_job_recommendations",
+        "schedule": 86400.0,
+        "kwargs": {"full": True},
+    },
+}
+
+# Task duration and outcome metrics are recorded through Celery signals.
+import jobboard.metrics  # noqa: E402,F401
@@ -0,0 +1,262 @@
+"""
+Prometheus metrics for the web and worker processes.
+
+Request, cache and Celery task metrics are recorded in-process as they
+happen. Database connections and Celery queue depth are read when
+``/metrics`` is scraped. With ``PROMETHEUS_MULTIPROC_DIR`` set (see
+``gunicorn.conf.py``), every worker writes its samples there and a scrape
+of any worker returns the sum of all of them. A Celery worker serving
+``CELERY_METRICS_PORT`` does the same for its pool processes.
+"""
+
+import hmac
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import redis
+from celery.signals import (
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_shutdown,
+    worker_ready,
+)
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+    values,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+# -------------------------------
+# HTTP
+# -------------------------------
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requests handled, by route and status.",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Wall time from the first middleware to the response.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements run per request.",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+HTTP_DB_TIME = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL per request.",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+def observe_request(method, route, status, elapsed, db_queries, db_time):
+    """Record one request; ``route`` is the URL name, so cardinality stays bounded."""
+    route = route or "unmatched"
+    HTTP_REQUESTS.labels(method, route, str(status)).inc()
+    HTTP_LATENCY.labels(method, route).observe(elapsed)
+    HTTP_DB_QUERIES.labels(route).observe(db_queries)
+    HTTP_DB_TIME.labels(route).observe(db_time)
+
+
+# -------------------------------
+# Cache
+# -------------------------------
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache reads by cache and result (hit or miss).",
+    ["cache", "result"],
+)
+
+
+def observe_cache(cache_name, hit):
+    CACHE_LOOKUPS.labels(cache_name, "hit" if hit else "miss").inc()
+
+
+# -------------------------------
+# Celery
+# -------------------------------
+
+CELERY_TASKS = Counter(
+    "celery_tasks_total", "Tasks finished, by task and state.", ["task", "state"]
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Task run time, from prerun to postrun.",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+
+_task_started = {}
+_task_lock = threading.Lock()
+
+
+@task_prerun.connect
+def _task_prerun(task_id=None, **kwargs):
+    with _task_lock:
+        _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _task_postrun(task_id=None, task=None, state=None, **kwargs):
+    with _task_lock:
+        started = _task_started.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_DURATION.labels(task.name).observe(time.perf_counter() - started)
+    CELERY_TASKS.labels(task.name, state or "UNKNOWN").inc()
+
+
+# Where a worker serving CELERY_METRICS_PORT keeps its pool's samples, unless
+# it shares PROMETHEUS_MULTIPROC_DIR with the web workers.
+CELERY_MULTIPROC_DIR = os.path.join(tempfile.gettempdir(), "jobboard-celery-prometheus")
+
+
+@worker_init.connect
+def _prepare_worker_metrics(**kwargs):
+    # Prefork pool processes run the tasks while the metrics server runs in
+    # the parent, so the pool writes its samples to files the parent sums.
+    # This fires in the parent before the pool forks, but after this module
+    # was imported, so the value class is switched here as well.
+    if not settings.CELERY_METRICS_PORT or "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        return
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = CELERY_MULTIPROC_DIR
+    shutil.rmtree(CELERY_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(CELERY_MULTIPROC_DIR)
+    values.ValueClass = values.MultiProcessValue()
+
+
+@worker_process_shutdown.connect
+def _mark_worker_process_dead(pid=None, **kwargs):
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+@worker_ready.connect
+def _serve_worker_metrics(**kwargs):
+    # Task samples are not in the web workers' PROMETHEUS_MULTIPROC_DIR unless
+    # shared; expose the pool's on a port of the worker's own.
+    if settings.CELERY_METRICS_PORT:
+        start_http_server(settings.CELERY_METRICS_PORT, registry=build_registry())
+
+
+# -------------------------------
+# Scrape-time collectors
+# -------------------------------
+
+
+class DatabaseCollector:
+    """Server-side connection usage, read from ``pg_stat_activity``."""
+
+    def collect(self):
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT coalesce(state, 'unknown'), count(*) FROM pg_stat_activity "
+                "WHERE datname = current_database() GROUP BY 1"
+            )
+            rows = cursor.fetchall()
+            cursor.execute("SHOW max_connections")
+            max_connections = int(cursor.fetchone()[0])
+
+        connections = GaugeMetricFamily(
+            "db_connections",
+            "Connections to this database, by state.",
+            labels=["state"],
+        )
+        for state, count in rows:
+            connections.add_metric([state], count)
+        yield connections
+        yield GaugeMetricFamily(
+            "db_max_connections",
+            "The server's max_connections.",
+            value=max_connections,
+        )
+
+
+class CeleryQueueCollector:
+    """Messages waiting in the Redis broker, per queue."""
+
+    def collect(self):
+        url = settings.CELERY_BROKER_URL
+        if not url.startswith(("redis://", "rediss://")):
+            return
+        queues = settings.METRICS_CELERY_QUEUES
+        client = redis.Redis.from_url(url, socket_timeout=0.5)
+        try:
+            depths = [client.llen(queue) for queue in queues]
+        except redis.RedisError:
+            return
+        finally:
+            client.close()
+        depth = GaugeMetricFamily(
+            "celery_queue_length",
+            "Messages waiting in the broker.",
+            labels=["queue"],
+        )
+        for queue, length in zip(queues, depths):
+            depth.add_metric([queue], length)
+        yield depth
+
+
+SCRAPE_COLLECTORS = (DatabaseCollector(), CeleryQueueCollector())
+
+
+class _Forward:
+    """Expose another registry's metrics through a per-scrape registry."""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def collect(self):
+        return self.registry.collect()
+
+
+def build_registry():
+    """The registry to expose: this process, or every worker in multiprocess mode."""
+    registry = CollectorRegistry()
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(_Forward(REGISTRY))
+    for collector in SCRAPE_COLLECTORS:
+        registry.register(collector)
+    return registry
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition; needs ``METRICS_TOKEN`` as a bearer token.
+    Without a token it is only served with ``DEBUG`` on, since it exposes
+    database connection activity and queue depths.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return HttpResponseForbidden()
+    elif not settings.DEBUG:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        generate_latest(build_registry()), content_type=CONTENT_TYPE_LATEST
+    )
@@ -0,0 +1,155 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .metrics import observe_request
+
+logger = logging.getLogger("jobboard.requests")
+
+# Statements kept per request for the slow-request log.
+MAX_RECORDED_QUERIES = 500
+
+
+class QueryRecorder:
+    """Times every SQL statement a request runs, on any connection."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = (0.0, None)
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.count += 1
+            self.total += duration
+            if duration > self.slowest[0]:
+                self.slowest = (duration, sql)
+            if len(self.queries) < MAX_RECORDED_QUERIES:
+                self.queries.append((sql, duration))
+
+
+# The recorder of the request being handled. It travels with the request's
+# context into sync_to_async threads, whose connections are not the one the
+# middleware runs on.
+current_recorder = ContextVar("current_recorder", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    ``connection_created`` receiver putting ``record_query`` on every
+    connection, in any thread. It goes first, so ``execute_wrapper`` blocks
+    open while the connection is made still pop their own wrapper.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure wall time, SQL query count, SQL time and the slowest statement of
+    every request.
+
+    The numbers go out in a ``Server-Timing`` header (when
+    ``SERVER_TIMING_HEADER`` is on), to the ``jobboard.requests`` logger and
+    to the Prometheus histograms in ``jobboard.metrics``.
+    Requests slower than ``SLOW_REQUEST_THRESHOLD_MS`` are logged as warnings
+    with every statement they ran and the ones repeated, which is what an
+    N+1 looks like. Streaming responses are measured until the response is
+    returned, not while they stream.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        token = current_recorder.set(recorder)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        self.record(request, response, recorder, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        token = current_recorder.set(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        self.record(request, response, recorder, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, recorder, elapsed):
+        if settings.SERVER_TIMING_HEADER:
+            response["Server-Timing"] = ", ".join(
+                [
+                    f"app;dur={_ms(elapsed - recorder.total)}",
+                    f'db;dur={_ms(recorder.total)};desc="{recorder.count} queries"',
+                    f"total;dur={_ms(elapsed)}",
+                ]
+            )
+
+        match = request.resolver_match
+        observe_request(
+            request.method,
+            match.view_name if match else None,
+            response.status_code,
+            elapsed,
+            recorder.count,
+            recorder.total,
+        )
+        entry = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "duration_ms": _ms(elapsed),
+            "db_queries": recorder.count,
+            "db_ms": _ms(recorder.total),
+            "slowest_query_ms": _ms(recorder.slowest[0]),
+            "slowest_query": recorder.slowest[1],
+        }
+        if entry["duration_ms"] < settings.SLOW_REQUEST_THRESHOLD_MS:
+            logger.info("request", extra=entry)
+            return
+
+        entry["queries"] = [
+            {"sql": sql, "ms": _ms(duration)} for sql, duration in recorder.queries
+        ]
+        entry["repeated_queries"] = [
+            {"sql": sql, "count": count}
+            for sql, count in Counter(sql for sql, _ in recorder.queries).most_common()
+            if count > 1
+        ]
+        logger.warning("slow request", extra=entry)
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import conditional_page
+from drf_yasg import openapi
+from drf_yasg.codecs import yaml_sane_dump
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.renderers import (
+    OpenAPIRenderer,
+    SwaggerJSONRenderer,
+    SwaggerYAMLRenderer,
+)
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+API_INFO = openapi.Info(
+    title="Job Board API",
+    default_version="v1",
+    description="API documentation for the Job Board backend",
+    terms_of_service="https://www.google.com/policies/terms/",
+    contact=openapi.Contact(email="support@jobboard.com"),
+    license=openapi.License(name="BSD License"),
+)
+
+
+class SchemaDocument:
+    """One encoding of the schema, with the ETag it is served under."""
+
+    def __init__(self, content):
+        self.content = content
+        self.etag = f'"{hashlib.md5(content).hexdigest()}"'
+
+
+def generate_schema():
+    """Walk every endpoint once and return the spec as an ordered dict."""
+    generator = OpenAPISchemaGenerator(API_INFO, url=settings.API_SCHEMA_URL or None)
+    return generator.get_schema(request=None, public=True).as_odict()
+
+
+def load_schema(path):
+    with open(path, encoding="utf-8") as schema_file:
+        return json.load(schema_file, object_pairs_hook=OrderedDict)
+
+
+def write_schema(path, spec=None):
+    spec = spec if spec is not None else generate_schema()
+    Path(path).write_text(json.dumps(spec, indent=2, ensure_ascii=False) + "\n")
+    return spec
+
+
+class SchemaCache:
+    """
+    Process-wide copy of the encoded schema.
+
+    The spec is read from ``settings.API_SCHEMA_FILE`` when that file exists
+    (see ``manage.py generate_schema``) and generated in-process otherwise.
+    Either way it happens once, not per docs request.
+    """
+
+    def __init__(self):
+        self._documents = None
+        self._lock = threading.Lock()
+
+    def get(self, fmt):
+        if self._documents is None:
+            with self._lock:
+                if self._documents is None:
+                    self._documents = self.build()
+        return self._documents[fmt]
+
+    def build(self):
+        path = settings.API_SCHEMA_FILE
+        spec = load_schema(path) if path and Path(path).exists() else generate_schema()
+        return {
+            "json": SchemaDocument(json.dumps(spec, ensure_ascii=False).encode()),
+            "yaml": SchemaDocument(yaml_sane_dump(spec, binary=True)),
+        }
+
+    def warm(self):
+        self.get("json")
+
+    def clear(self):
+        with self._lock:
+            self._documents = None
+
+
+schema_cache = SchemaCache()
+
+BaseSchemaView = get_schema_view(
+    API_INFO, public=True, permission_classes=[permissions.AllowAny]
+)
+
+
+class SchemaView(BaseSchemaView):
+    """Serve spec requests from ``schema_cache``; the UI pages stay as they are."""
+
+    def get(self, request, version="", format=None):
+        renderer = request.accepted_renderer
+        if not isinstance(
+            renderer, (OpenAPIRenderer, SwaggerJSONRenderer, SwaggerYAMLRenderer)
+        ):
+            # The UI renderers only need an empty document; the page then
+            # fetches the spec itself with ``?format=openapi``.
+            return super().get(request, version, format)
+
+        document = schema_cache.get(
+            "yaml" if isinstance(renderer, SwaggerYAMLRenderer) else "json"
+        )
+        response = HttpResponse(document.content, content_type=renderer.media_type)
+        response["ETag"] = document.etag
+        return response
+
+    @classmethod
+    def as_cached_view(cls, cache_timeout=0, cache_kwargs=None, **initkwargs):
+        view = super().as_cached_view(cache_timeout, cache_kwargs, **initkwargs)
+        # Browsers revalidate every time, which costs a 304 once the ETag matches.
+        view = cache_control(no_cache=True)(view)
+        return gzip_page(conditional_page(view))
+
+
+schema_view = SchemaView
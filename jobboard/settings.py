@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import timedelta
@@ -30,6 +31,9 @@ SECRET_KEY = os.getenv("SECRET_KEY", "unset-default-key")
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv("DEBUG", "False") == "True"
 
+# Running the test suite (manage.py test)
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "").split(",")
 
 
@@ -47,12 +51,14 @@ INSTALLED_APPS = [
     "drf_yasg",
     "corsheaders",
     "django_filters",
+    "jobboard",
     "users",
     "jobs",
 ]
 
 
 MIDDLEWARE = [
+    "jobboard.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -65,6 +71,39 @@ MIDDLEWARE = [
 
 CORS_ALLOW_ALL_ORIGINS = True
 
+# Requests slower than this many milliseconds are logged with every SQL
+# statement they ran
+SLOW_REQUEST_THRESHOLD_MS = int(os.getenv("SLOW_REQUEST_THRESHOLD_MS", 500))
+# Send per-request app/db timings to clients in a Server-Timing header
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "True") == "True"
+# Bearer token required to scrape /metrics (when empty, it is only served with
+# DEBUG on)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+# Broker queues whose depth /metrics reports
+METRICS_CELERY_QUEUES = os.getenv("METRICS_CELERY_QUEUES", "celery").split(",")
+# Port a Celery worker serves its own /metrics on (off when 0)
+CELERY_METRICS_PORT = int(os.getenv("CELERY_METRICS_PORT", 0))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "jobboard.log.JsonFormatter"},
+    },
+    "handlers": {
+        "json_console": {"class": "logging.StreamHandler", "formatter": "json"},
+    },
+    "loggers": {
+        # One structured line per request (see jobboard.middleware); only slow
+        # requests under tests, so the run's output stays readable
+        "jobboard.requests": {
+            "handlers": ["json_console"],
+            "level": os.getenv("REQUEST_LOG_LEVEL", "WARNING" if TESTING else "INFO"),
+            "propagate": False,
+        },
+    },
+}
+
 ROOT_URLCONF = "jobboard.urls"
 
 TEMPLATES = [
@@ -108,7 +147,9 @@ if os.getenv("DATABASE_URL"):
     # Use Railway PostgreSQL
     DATABASES = {
         "default": dj_database_url.config(
-            default=os.getenv("DATABASE_URL"), conn_max_age=600, ssl_require=True
+            default=os.getenv("DATABASE_URL"),
+            conn_max_age=int(os.getenv("DB_CONN_MAX_AGE", 600)),
+            ssl_require=True,
         )
     }
 else:
@@ -125,12 +166,33 @@ else:
     }
     
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+if os.getenv("REDIS_CACHE_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_CACHE_URL"),
+        }
+    }
+else:
+    # Local memory cache for development and tests
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Seconds an anonymous job list/detail response stays cached
+JOBS_RESPONSE_CACHE_TIMEOUT = int(os.getenv("JOBS_RESPONSE_CACHE_TIMEOUT", 300))
+
 # REST Framework Configuration
 # https://www.django-rest-framework.org/api-guide/settings/
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -143,8 +205,16 @@ REST_FRAMEWORK = {
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_USER_CLASS": "users.authentication.ClaimsTokenUser",
+    "TOKEN_OBTAIN_SERIALIZER": "users.authentication.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.authentication.ClaimsTokenRefreshSerializer",
 }
 
+# Seconds a user's token_version (the revocation check) is cached
+TOKEN_VERSION_CACHE_TIMEOUT = int(os.getenv("TOKEN_VERSION_CACHE_TIMEOUT", 300))
+# Seconds a full user row loaded for a token user stays in process memory
+JWT_USER_CACHE_TTL = int(os.getenv("JWT_USER_CACHE_TTL", 30))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -203,6 +273,11 @@ REDOC_SETTINGS = {
     "LAZY_RENDERING": True,
 }
 
+# Pre-built spec written by `manage.py generate_schema`; generated in-process if missing
+API_SCHEMA_FILE = os.getenv("API_SCHEMA_FILE", "")
+# Public base URL baked into the spec (host/schemes); omitted when empty
+API_SCHEMA_URL = os.getenv("API_SCHEMA_URL", "")
+
 # Celery Configuration Options
 CELERY_BROKER_URL = "redis://localhost:6379/0"
 CELERY_RESULT_BACKEND = "redis://localhost:6379/0"
@@ -212,6 +287,57 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Africa/Cairo"
 
+# Outbox events turned into notifications per transaction
+NOTIFICATION_OUTBOX_BATCH_SIZE = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", 500))
+
+# Redis URL used to fan new notifications out to SSE streams on every node
+# (the Celery broker by default, since workers create most notifications).
+# "memory://" keeps them in-process, which only reaches streams in the same
+# process; it is the default with DEBUG on and under tests
+NOTIFICATION_BROKER_URL = os.getenv(
+    "NOTIFICATION_BROKER_URL", "memory://" if DEBUG or TESTING else CELERY_BROKER_URL
+)
+# Seconds between keep-alive comments on an idle notification stream
+NOTIFICATION_STREAM_HEARTBEAT = int(os.getenv("NOTIFICATION_STREAM_HEARTBEAT", 15))
+# Streams are closed after this many seconds; clients reconnect and resume
+NOTIFICATION_STREAM_MAX_AGE = int(os.getenv("NOTIFICATION_STREAM_MAX_AGE", 300))
+
+# Chunked resume uploads are staged here until a worker validates and stores them
+RESUME_UPLOAD_STAGING_DIR = os.getenv(
+    "RESUME_UPLOAD_STAGING_DIR", os.path.join(BASE_DIR, "staging", "resumes")
+)
+RESUME_UPLOAD_MAX_SIZE = int(os.getenv("RESUME_UPLOAD_MAX_SIZE", 10 * 1024 * 1024))
+# Largest body accepted by a single chunk request
+RESUME_UPLOAD_CHUNK_SIZE = int(os.getenv("RESUME_UPLOAD_CHUNK_SIZE", 5 * 1024 * 1024))
+# Unfinished uploads idle for this long are purged
+RESUME_UPLOAD_EXPIRY_HOURS = int(os.getenv("RESUME_UPLOAD_EXPIRY_HOURS", 24))
+# Uploads still processing after this many minutes are marked failed
+RESUME_UPLOAD_PROCESSING_TIMEOUT_MINUTES = int(
+    os.getenv("RESUME_UPLOAD_PROCESSING_TIMEOUT_MINUTES", 60)
+)
+
+# Days of data aggregated by each parallel report task
+REPORT_CHUNK_DAYS = int(os.getenv("REPORT_CHUNK_DAYS", 7))
+# Longest date range a report may cover
+REPORT_MAX_DAYS = int(os.getenv("REPORT_MAX_DAYS", 731))
+# Rows kept in per-job reports (funnel, top favorited)
+REPORT_ROW_LIMIT = int(os.getenv("REPORT_ROW_LIMIT", 100))
+# Identical report requests within this many seconds reuse the stored report
+REPORT_REUSE_SECONDS = int(os.getenv("REPORT_REUSE_SECONDS", 3600))
+
+# Jobs kept in each user's precomputed recommendation list
+RECOMMENDATION_COUNT = int(os.getenv("RECOMMENDATION_COUNT", 20))
+# Seconds a recommendation list stays cached (the table keeps it regardless)
+RECOMMENDATION_CACHE_TIMEOUT = int(os.getenv("RECOMMENDATION_CACHE_TIMEOUT", 86400))
+
+# New jobs matched against saved searches per transaction
+JOB_ALERT_BATCH_SIZE = int(os.getenv("JOB_ALERT_BATCH_SIZE", 500))
+# Jobs are matched once they are this many seconds old
+JOB_ALERT_SETTLE_SECONDS = int(os.getenv("JOB_ALERT_SETTLE_SECONDS", 30))
+
+# Build job and notification list pages from values() rows instead of serializers
+FAST_LIST_SERIALIZATION = os.getenv("FAST_LIST_SERIALIZATION", "True") == "True"
+
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
 X_FRAME_OPTIONS = "DENY"
@@ -17,48 +17,37 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, re_path, include
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 from django.http import HttpResponse
 
+from .metrics import metrics_view
+from .schema import schema_view
+
 
 def home(request):
     return HttpResponse("Welcome to the Job Board API")
 
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Job Board API",
-        default_version="v1",
-        description="Swagger UI for Job Board Backend",
-        contact=openapi.Contact(email="youremail@example.com"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
-
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", home),  # Optional: A home view for the root URL
+    path("metrics", metrics_view, name="metrics"),
     # Application APIs
     path("api/users/", include("users.urls")),
     path("api/jobs/", include("jobs.urls")),
     # API Documentation (Goal: /api/docs/)
     path(
         "api/docs/",  # Corrected path
-        schema_view.with_ui("swagger", cache_timeout=0),
+        schema_view.with_ui("swagger"),
         name="schema-swagger-ui",
     ),
     re_path(
         r"api/docs/schema(?P<format>\.json|\.yaml)$",  # Corrected path
-        schema_view.without_ui(cache_timeout=0),
+        schema_view.without_ui(),
         name="schema-json",
     ),
     path(
         "api/docs/redoc/",
-        schema_view.with_ui("redoc", cache_timeout=0),
+        schema_view.with_ui("redoc"),
         name="schema-redoc",
     ),
 ]
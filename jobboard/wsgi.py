@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "jobboard.settings")
 
 application = get_wsgi_application()
+
+# Build the OpenAPI schema while the worker boots, not on the first docs request.
+from jobboard.schema import schema_cache  # noqa: E402
+
+schema_cache.warm()
@@ -0,0 +1,144 @@
+"""
+Job alerts for saved searches.
+
+Jobs created since the high-water mark in ``JobAlertMark`` are matched in
+batches against the saved searches through an inverted index. Every saved
+search is reduced to match keys (title terms, location, category and
+employment type) and filed under just one of them, its ``anchor``. A batch
+of new jobs only loads the searches anchored on a key one of those jobs
+has, so the work grows with the number of new jobs, not with the number of
+subscribers times their queries.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Job, JobAlertMark, Notification, SavedSearch
+from .notifications import create_notifications
+from .recommendations import tokenize
+
+
+def _location(location):
+    return " ".join(location.lower().split())
+
+
+def job_keys(job):
+    """Every key a job (a ``values()`` row) can be matched on."""
+    keys = {f"term:{term}" for term in tokenize(job["title"])}
+    keys.add(f"category:{job['category_id']}")
+    keys.add(f"type:{job['employment_type']}")
+    if job["location"].strip():
+        keys.add(f"location:{_location(job['location'])}")
+    return keys
+
+
+def index_saved_search(search):
+    """
+    Set ``keys`` from the search's criteria and ``anchor`` to the most
+    selective of them: the longest title term, else the location, category
+    or employment type.
+    """
+    terms = sorted(set(tokenize(search.search)), key=lambda term: (-len(term), term))
+    keys = [f"term:{term}" for term in terms]
+    if search.location.strip():
+        keys.append(f"location:{_location(search.location)}")
+    if search.category_id:
+        keys.append(f"category:{search.category_id}")
+    if search.employment_type:
+        keys.append(f"type:{search.employment_type}")
+    search.keys = keys
+    search.anchor = keys[0] if keys else ""
+
+
+def match_jobs(jobs, searches):
+    """``(search, job)`` pairs where the job has every key of the search, one per user and job."""
+    index = {}
+    for search in searches:
+        index.setdefault(search["anchor"], []).append(search)
+
+    matches = {}
+    for job in jobs:
+        keys = job_keys(job)
+        for key in keys:
+            for search in index.get(key, ()):
+                if (
+                    search["created_at"] <= job["created_at"]
+                    and search["user_id"] != job["created_by_id"]
+                    and keys.issuperset(search["keys"])
+                ):
+                    matches.setdefault((search["user_id"], job["id"]), (search, job))
+    return list(matches.values())
+
+
+def _alert(search, job):
+    label = search["name"] or search["search"] or "your saved search"
+    return Notification(
+        user_id=search["user_id"],
+        notification_type="JOB",
+        message=f"New job for {label}: {job['title']}",
+    )
+
+
+def _lock_mark():
+    mark = JobAlertMark.objects.select_for_update().first()
+    if mark is None:
+        # First run: start from the newest job rather than alerting on history.
+        latest = Job.objects.order_by("-pk").values_list("pk", flat=True).first()
+        JobAlertMark.objects.create(last_job_id=latest or 0)
+        mark = JobAlertMark.objects.select_for_update().first()
+    return mark
+
+
+def match_new_jobs(batch_size=None):
+    """
+    Announce jobs created since the mark to the saved searches they match,
+    one batch per transaction, and return the number of notifications.
+
+    Jobs younger than ``JOB_ALERT_SETTLE_SECONDS`` wait for the next run,
+    so a transaction still holding a lower id cannot be skipped.
+    """
+    batch_size = batch_size or settings.JOB_ALERT_BATCH_SIZE
+    settled = timezone.now() - datetime.timedelta(
+        seconds=settings.JOB_ALERT_SETTLE_SECONDS
+    )
+    notified = 0
+    while True:
+        with transaction.atomic():
+            mark = _lock_mark()
+            jobs = []
+            for job in (
+                Job.objects.filter(pk__gt=mark.last_job_id)
+                .order_by("pk")
+                .values(
+                    "id",
+                    "title",
+                    "category_id",
+                    "location",
+                    "employment_type",
+                    "is_active",
+                    "created_at",
+                    "created_by_id",
+                )[:batch_size]
+            ):
+                if job["created_at"] > settled:
+                    break
+                jobs.append(job)
+            if not jobs:
+                break
+
+            active = [job for job in jobs if job["is_active"]]
+            keys = set().union(*(job_keys(job) for job in active))
+            searches = SavedSearch.objects.filter(anchor__in=keys).values(
+                "user_id", "name", "search", "keys", "anchor", "created_at"
+            )
+            alerts = [
+                _alert(search, job) for search, job in match_jobs(active, searches)
+            ]
+            create_notifications(alerts)
+            mark.last_job_id = jobs[-1]["id"]
+            mark.save(update_fields=["last_job_id", "updated_at"])
+        notified += len(alerts)
+    return notified
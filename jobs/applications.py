@@ -0,0 +1,63 @@
+from django.db import transaction
+
+from .models import Application, Notification
+from .notifications import create_notifications
+from .stats import move_applications
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+
+
+def bulk_update_status(status, ids=None, job_id=None, current_status=None):
+    """
+    Move every matching application to ``status`` with a single UPDATE and
+    notify the affected candidates in one batch.
+
+    Returns ``(updated_count, results)`` where ``results`` lists
+    ``{"id", "result"}`` for each requested id (or each matched row when
+    selecting by filter).
+    """
+    queryset = Application.objects.all()
+    if ids is not None:
+        queryset = queryset.filter(id__in=ids)
+    if job_id is not None:
+        queryset = queryset.filter(job_id=job_id)
+    if current_status is not None:
+        queryset = queryset.filter(status=current_status)
+
+    label = dict(Application.STATUS_CHOICES)[status].lower()
+    with transaction.atomic():
+        rows = list(
+            queryset.select_for_update(of=("self",))
+            .order_by("id")
+            .values("id", "status", "job_id", "candidate_id", "job__title")
+        )
+        changed = [row for row in rows if row["status"] != status]
+        if changed:
+            Application.objects.filter(id__in=[row["id"] for row in changed]).update(
+                status=status
+            )
+            move_applications(
+                ((row["job_id"], row["status"]), (row["job_id"], status))
+                for row in changed
+            )
+            create_notifications(
+                [
+                    Notification(
+                        user_id=row["candidate_id"],
+                        message=f"Your application for {row['job__title']} was {label}.",
+                        notification_type="APP",
+                    )
+                    for row in changed
+                ]
+            )
+
+    outcome = {row["id"]: UNCHANGED for row in rows}
+    outcome.update({row["id"]: UPDATED for row in changed})
+    requested = ids if ids is not None else list(outcome)
+    results = [
+        {"id": application_id, "result": outcome.get(application_id, NOT_FOUND)}
+        for application_id in dict.fromkeys(requested)
+    ]
+    return len(changed), results
@@ -0,0 +1,304 @@
+"""
+Async implementations of the read-heavy endpoints.
+
+They are mounted under ``/api/jobs/async/`` and return the same payloads as
+their viewset counterparts, but run on the event loop when the project is
+served through ``jobboard.asgi``: a slow client or a long poll then waits on
+a coroutine instead of pinning a worker process. Only page-number pages are
+served; the job list rejects ``?pagination=cursor`` and ``?facets=``. Queries go through Django's
+async ORM; only building the filtered queryset (which may validate a filter
+value against the database) is handed to a thread.
+
+The Server-Sent Events notification stream lives here as well.
+"""
+
+import asyncio
+import json
+import math
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.conf import settings
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework import exceptions, pagination, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from users.authentication import ClaimsJWTAuthentication
+
+from .broker import SubscriptionOverflow, get_broker
+from .cache import job_response_cache
+from .models import Job, Notification
+from .notifications import notification_event
+from .serializers import JobSerializer, NotificationSerializer
+from .views import JobViewSet
+
+authenticator = ClaimsJWTAuthentication()
+renderer = JSONRenderer()
+
+# How long an EventSource waits before reconnecting after the stream ends.
+STREAM_RETRY_MS = 3000
+REPLAY_BATCH = 100
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    response = HttpResponse(
+        renderer.render(data), status=status, content_type=renderer.media_type
+    )
+    for name, value in (headers or {}).items():
+        response[name] = value
+    return response
+
+
+def error_response(request, exc):
+    detail = exc.detail
+    if not isinstance(detail, (dict, list)):
+        detail = {"detail": detail}
+    headers = {}
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        headers["WWW-Authenticate"] = authenticator.authenticate_header(request)
+    return json_response(detail, status=exc.status_code, headers=headers)
+
+
+def async_api_view(handler):
+    """Allow GET only and render ``APIException``/``Http404`` like DRF does."""
+
+    @require_GET
+    @wraps(handler)
+    async def view(request, *args, **kwargs):
+        try:
+            return await handler(request, *args, **kwargs)
+        except Http404 as exc:
+            return error_response(request, exceptions.NotFound(*exc.args))
+        except exceptions.APIException as exc:
+            return error_response(request, exc)
+
+    return view
+
+
+@sync_to_async
+def authenticate(request, query_token=False):
+    """
+    Return the token user, or ``None`` when no credentials were sent.
+
+    With ``query_token`` an access token in ``?token=`` is accepted too, for
+    clients such as ``EventSource`` that cannot set headers.
+    """
+    raw_token = request.GET.get("token") if query_token else None
+    if raw_token:
+        return authenticator.get_user(authenticator.get_validated_token(raw_token))
+    result = authenticator.authenticate(request)
+    return result[0] if result else None
+
+
+async def paginate(request, queryset, page_size):
+    """
+    Page-number pagination with the same envelope and links as DRF's
+    ``PageNumberPagination``, issuing ``COUNT`` and the page query async.
+    """
+    count = await queryset.acount()
+    pages = max(1, math.ceil(count / page_size))
+    page = request.query_params.get("page", 1)
+    try:
+        page = pages if page == "last" else int(page)
+    except (TypeError, ValueError):
+        raise exceptions.NotFound("Invalid page.")
+    if not 1 <= page <= pages:
+        raise exceptions.NotFound("Invalid page.")
+
+    offset = (page - 1) * page_size
+    objects = [obj async for obj in queryset[offset : offset + page_size]]
+
+    url = request.build_absolute_uri()
+    next_link = replace_query_param(url, "page", page + 1) if page < pages else None
+    if page == 1:
+        previous_link = None
+    elif page == 2:
+        previous_link = remove_query_param(url, "page")
+    else:
+        previous_link = replace_query_param(url, "page", page - 1)
+    return objects, {"count": count, "next": next_link, "previous": previous_link}
+
+
+def job_view(request, user, action):
+    """A ``JobViewSet`` bound to ``request`` for its queryset and filters."""
+    view = JobViewSet(action=action, format_kwarg=None, args=(), kwargs={})
+    view.request = Request(request, authenticators=())
+    view.request.user = user or AnonymousUser()
+    return view
+
+
+async def cached(request, user, action, render, pk=None):
+    """Serve anonymous requests from ``job_response_cache`` like the viewset."""
+    if user is not None:
+        return json_response(await render())
+
+    key = await sync_to_async(job_response_cache.make_key)(
+        Request(request), f"async-{action}", pk
+    )
+    data = await sync_to_async(job_response_cache.get)(key)
+    if data is not None:
+        return json_response(data, headers={"X-Cache": "HIT"})
+
+    data = await render()
+    await sync_to_async(job_response_cache.set)(key, data)
+    return json_response(data, headers={"X-Cache": "MISS"})
+
+
+# Job list parameters only the sync endpoint serves
+SYNC_ONLY_LIST_PARAMS = {
+    "pagination": "Cursor pagination is only served by /api/jobs/jobs/.",
+    "facets": "Facet counts are only served by /api/jobs/jobs/.",
+}
+
+
+@async_api_view
+async def job_list(request):
+    """
+    The job list as ``JobViewSet.list`` returns it, with page-number
+    pagination; the parameters in ``SYNC_ONLY_LIST_PARAMS`` are a 400.
+    """
+    unsupported = {
+        name: [message]
+        for name, message in SYNC_ONLY_LIST_PARAMS.items()
+        if name in request.GET
+    }
+    if unsupported:
+        raise exceptions.ValidationError(unsupported)
+    user = await authenticate(request)
+    view = job_view(request, user, "list")
+
+    async def render():
+        queryset = await sync_to_async(
+            lambda: view.filter_queryset(view.get_queryset())
+        )()
+        page_size = view.paginator.get_page_size(view.request)
+        jobs, envelope = await paginate(view.request, queryset, page_size)
+        context = view.get_serializer_context()
+        envelope["results"] = JobSerializer(jobs, many=True, context=context).data
+        return envelope
+
+    return await cached(request, user, "list", render)
+
+
+@async_api_view
+async def job_detail(request, pk):
+    user = await authenticate(request)
+    view = job_view(request, user, "retrieve")
+
+    async def render():
+        try:
+            job = await view.get_queryset().aget(pk=pk)
+        except Job.DoesNotExist:
+            raise Http404("No Job matches the given query.")
+        return JobSerializer(job, context=view.get_serializer_context()).data
+
+    return await cached(request, user, "retrieve", render, pk)
+
+
+@async_api_view
+async def notification_list(request):
+    user = await authenticate(request)
+    if user is None:
+        raise exceptions.NotAuthenticated()
+
+    drf_request = Request(request)
+    queryset = (
+        Notification.objects.filter(user_id=user.pk)
+        .select_related("user")
+        .order_by("-created_at")
+    )
+    page_size = pagination.PageNumberPagination().get_page_size(drf_request)
+    notifications, envelope = await paginate(drf_request, queryset, page_size)
+    envelope["results"] = NotificationSerializer(
+        notifications, many=True, context={"request": drf_request}
+    ).data
+    return json_response(envelope)
+
+
+def sse_message(event):
+    return f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
+
+
+def parse_last_event_id(request):
+    value = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise exceptions.ValidationError({"last_event_id": ["Must be an integer."]})
+
+
+async def notification_events(user, last_event_id):
+    """
+    Yield SSE messages for ``user``: first the notifications after
+    ``last_event_id`` from the database, then live ones from the broker.
+
+    The subscription is opened before the replay so nothing committed in
+    between is lost; live events already replayed are skipped by id. Idle
+    streams get a comment every ``NOTIFICATION_STREAM_HEARTBEAT`` seconds and
+    are closed after ``NOTIFICATION_STREAM_MAX_AGE``, so proxies do not cut
+    them and the client reconnects with ``Last-Event-ID``.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.NOTIFICATION_STREAM_MAX_AGE
+    subscription = await get_broker().subscribe(user.pk)
+    try:
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        while last_event_id is not None:
+            batch = [
+                notification
+                async for notification in Notification.objects.filter(
+                    user_id=user.pk, id__gt=last_event_id
+                ).order_by("id")[:REPLAY_BATCH]
+            ]
+            for notification in batch:
+                event = notification_event(notification)
+                yield sse_message({**event, "user_username": user.username})
+                last_event_id = notification.pk
+            if len(batch) < REPLAY_BATCH:
+                break
+
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.get(),
+                    min(settings.NOTIFICATION_STREAM_HEARTBEAT, remaining),
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if last_event_id is not None and event["id"] <= last_event_id:
+                continue
+            last_event_id = event["id"]
+            yield sse_message({**event, "user_username": user.username})
+    except SubscriptionOverflow:
+        # Fell behind; the client reconnects and replays from the database.
+        return
+    finally:
+        await subscription.close()
+
+
+@async_api_view
+async def notification_stream(request):
+    """
+    Server-Sent Events stream of the user's new notifications.
+
+    Serve it through ``jobboard.asgi``: under WSGI each open stream would
+    hold a worker.
+    """
+    user = await authenticate(request, query_token=True)
+    if user is None:
+        raise exceptions.NotAuthenticated()
+    last_event_id = parse_last_event_id(request)
+
+    response = StreamingHttpResponse(
+        notification_events(user, last_event_id), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
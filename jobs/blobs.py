@@ -0,0 +1,87 @@
+import hashlib
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.db.models.functions import Greatest
+
+from .models import ResumeBlob, ResumeUpload
+
+HASH_BUFFER = 64 * 1024
+
+
+def hash_file(file):
+    """Return ``(sha256, size)`` of a file object, read in bounded chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    file.seek(0)
+    for chunk in iter(lambda: file.read(HASH_BUFFER), b""):
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+    return digest.hexdigest(), size
+
+
+def blob_name(sha256, extension=""):
+    return f"resumes/{sha256[:2]}/{sha256}{extension}"
+
+
+def store_blob(file, sha256, size, extension=""):
+    """
+    Return the blob for ``sha256``, writing ``file`` to storage only when the
+    content is not stored yet.
+
+    Call inside a transaction: the blob row stays locked until commit, so it
+    cannot be reclaimed before the caller has referenced it.
+    """
+    blob = ResumeBlob.objects.select_for_update().filter(pk=sha256).first()
+    if blob is not None:
+        return blob
+
+    name = default_storage.save(blob_name(sha256, extension), file)
+    blob, created = ResumeBlob.objects.get_or_create(
+        sha256=sha256, defaults={"file": name, "size": size}
+    )
+    if not created:
+        # Another request stored the same content first.
+        default_storage.delete(name)
+    return blob
+
+
+def add_references(sha256, count=1):
+    ResumeBlob.objects.filter(pk=sha256).update(ref_count=F("ref_count") + count)
+
+
+def release_references(sha256, count=1):
+    ResumeBlob.objects.filter(pk=sha256).update(
+        ref_count=Greatest(F("ref_count") - count, 0)
+    )
+    reclaim_blobs(ResumeBlob.objects.filter(pk=sha256))
+
+
+def reclaim_blobs(queryset=None):
+    """
+    Delete unreferenced blobs and, after commit, their files.
+
+    Rows are claimed with ``SKIP LOCKED`` so a blob an application is being
+    attached to right now is left for the next pass. Returns the number of
+    blobs reclaimed.
+    """
+    queryset = ResumeBlob.objects.all() if queryset is None else queryset
+    with transaction.atomic():
+        rows = list(
+            queryset.filter(ref_count=0)
+            .filter(~Exists(ResumeUpload.objects.filter(blob=OuterRef("pk"))))
+            .select_for_update(skip_locked=True)
+            .values_list("sha256", "file")
+        )
+        if not rows:
+            return 0
+        ResumeBlob.objects.filter(pk__in=[sha256 for sha256, _ in rows]).delete()
+        transaction.on_commit(lambda: delete_files([name for _, name in rows]))
+    return len(rows)
+
+
+def delete_files(names):
+    for name in names:
+        default_storage.delete(name)
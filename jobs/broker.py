@@ -0,0 +1,155 @@
+"""
+Fan-out of new notifications to open SSE streams.
+
+``publish`` is called from ordinary (sync) code once a notification is
+committed; ``subscribe`` is awaited by a stream and yields the events for one
+user. ``RedisBroker`` goes through Redis pub/sub so notifications created by
+Celery workers or other web nodes arrive too; it is the default.
+``InProcessBroker`` (``NOTIFICATION_BROKER_URL=memory://``) only reaches
+streams in the same process, which is enough for development and tests.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+
+import redis
+import redis.asyncio
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+IN_PROCESS_URL = "memory://"
+
+# Events buffered per stream before it is closed as too slow; the client then
+# reconnects with ``Last-Event-ID`` and catches up from the database.
+SUBSCRIPTION_BUFFER = 256
+
+
+class SubscriptionOverflow(Exception):
+    """The stream fell behind and missed events."""
+
+
+class InProcessSubscription:
+    def __init__(self, broker, user_id):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=SUBSCRIPTION_BUFFER)
+        self.overflowed = False
+
+    def put(self, event):
+        """Hand ``event`` to the stream's event loop; safe from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The loop is gone; the stream is being torn down.
+            pass
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self):
+        if self.overflowed and self.queue.empty():
+            raise SubscriptionOverflow()
+        return await self.queue.get()
+
+    async def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    def __init__(self):
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def publish(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            subscription.put(event)
+
+    async def subscribe(self, user_id):
+        subscription = InProcessSubscription(self, user_id)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.user_id, None)
+
+
+def _channel(user_id):
+    return f"jobs:notifications:{user_id}"
+
+
+class RedisSubscription:
+    def __init__(self, client, pubsub):
+        self.client = client
+        self.pubsub = pubsub
+
+    async def get(self):
+        while True:
+            message = await self.pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=None
+            )
+            if message is not None:
+                return json.loads(message["data"])
+
+    async def close(self):
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+class RedisBroker:
+    def __init__(self, url):
+        self.url = url
+        self._client = None
+
+    def publish(self, user_id, event):
+        if self._client is None:
+            self._client = redis.Redis.from_url(self.url)
+        self._client.publish(_channel(user_id), json.dumps(event))
+
+    async def subscribe(self, user_id):
+        client = redis.asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(_channel(user_id))
+        return RedisSubscription(client, pubsub)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def create_broker(url):
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBroker(url)
+    if url != IN_PROCESS_URL:
+        raise ImproperlyConfigured(
+            f"NOTIFICATION_BROKER_URL must be a Redis URL or {IN_PROCESS_URL}."
+        )
+    if not (settings.DEBUG or settings.TESTING):
+        logger.warning(
+            "Notifications are fanned out in-process: streams will not see "
+            "notifications created by Celery workers or other nodes."
+        )
+    return InProcessBroker()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = create_broker(settings.NOTIFICATION_BROKER_URL)
+    return _broker
@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+from jobboard.metrics import observe_cache
+
+JOB_GENERATION = "job"
+CATEGORY_GENERATION = "category"
+
+
+def _generation_key(name):
+    return f"jobs:generation:{name}"
+
+
+def get_generations(*names):
+    keys = [_generation_key(name) for name in names]
+    found = cache.get_many(keys)
+    generations = []
+    for key in keys:
+        if key not in found:
+            # Seed from the clock so an evicted counter never restarts at a
+            # value that older cached responses were stored under.
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            found[key] = cache.get(key)
+        generations.append(found[key])
+    return generations
+
+
+def bump_generation(name):
+    key = _generation_key(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+class ResponseCache:
+    """
+    Read-through cache for anonymous GET responses.
+
+    Entries are keyed on the view action, the object id and the normalized
+    query string, and prefixed with the current generation of every model
+    the payload depends on. Bumping a generation makes all older entries
+    unreachable, so stale pages are never served; they simply expire.
+    """
+
+    def __init__(self, namespace, generations, timeout=None):
+        self.namespace = namespace
+        self.generations = generations
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_timeout(self):
+        if self.timeout is not None:
+            return self.timeout
+        return settings.JOBS_RESPONSE_CACHE_TIMEOUT
+
+    def normalize_query(self, request):
+        params = []
+        for name, values in request.query_params.lists():
+            values = sorted(value for value in values if value != "")
+            if not values or (name == "page" and values == ["1"]):
+                continue
+            params.append((name, values))
+        return sorted(params)
+
+    def make_key(self, request, action, pk=None):
+        generations = ".".join(str(g) for g in get_generations(*self.generations))
+        raw = repr((request.get_host(), self.normalize_query(request)))
+        digest = hashlib.md5(raw.encode()).hexdigest()
+        return f"{self.namespace}:{action}:{generations}:{pk or ''}:{digest}"
+
+    def get(self, key):
+        data = cache.get(key)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        observe_cache(self.namespace, data is not None)
+        return data
+
+    def set(self, key, data):
+        cache.set(key, data, timeout=self.get_timeout())
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+job_response_cache = ResponseCache(
+    "jobs:response", generations=(JOB_GENERATION, CATEGORY_GENERATION)
+)
+
+
+class AnonymousResponseCacheMixin:
+    """Serve ``list`` and ``retrieve`` for anonymous users from ``response_cache``."""
+
+    response_cache = None
+
+    def list(self, request, *args, **kwargs):
+        return self._cached("list", request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached("retrieve", request, super().retrieve, *args, **kwargs)
+
+    def _cached(self, action, request, handler, *args, **kwargs):
+        if request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        key = self.response_cache.make_key(request, action, kwargs.get("pk"))
+        data = self.response_cache.get(key)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            self.response_cache.set(key, response.data)
+        response["X-Cache"] = "MISS"
+        return response
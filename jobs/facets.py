@@ -0,0 +1,96 @@
+"""
+Facet counts for the job list.
+
+All requested facets are counted by one ``GROUP BY GROUPING SETS`` query
+over the filtered job queryset, so a search page gets its counts in the
+same single round trip whatever the number of facets. Counts for the
+unfiltered list are also cached under the job and category generations.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import F
+
+from jobboard.metrics import observe_cache
+
+from .cache import CATEGORY_GENERATION, JOB_GENERATION, get_generations
+from .models import Job
+
+# Values returned per facet, most frequent first.
+FACET_LIMIT = 50
+
+# facet -> grouped columns: the value and, where it has one, a label
+FACETS = {
+    "category": {"value": F("category_id"), "label": F("category__name")},
+    "location": {"value": F("location")},
+    "employment_type": {"value": F("employment_type")},
+}
+EMPLOYMENT_TYPE_LABELS = dict(Job.EMPLOYMENT_TYPES)
+
+
+def parse_facets(raw):
+    """``"location,category"`` -> ``["category", "location"]``; ``ValueError`` on unknown names."""
+    names = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = names - FACETS.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown facet {', '.join(sorted(unknown))}; "
+            f"choose from {', '.join(FACETS)}."
+        )
+    return sorted(names)
+
+
+def facet_counts(queryset, names):
+    """``{facet: [{"value", "label"?, "count"}, ...]}`` for ``queryset``."""
+    columns = {
+        f"{name}_{part}": expression
+        for name in names
+        for part, expression in FACETS[name].items()
+    }
+    sql, params = queryset.order_by().values(**columns).query.sql_with_params()
+    grouping_sets = ", ".join(
+        "(" + ", ".join(f'"{name}_{part}"' for part in FACETS[name]) + ")"
+        for name in names
+    )
+    select = ", ".join(f'"{column}"' for column in columns)
+    grouped = ", ".join(f'GROUPING("{name}_value")' for name in names)
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            f"SELECT {select}, {grouped}, COUNT(*) FROM ({sql}) AS jobs "
+            f"GROUP BY GROUPING SETS ({grouping_sets})",
+            params,
+        )
+        rows = cursor.fetchall()
+
+    counts = {name: [] for name in names}
+    width = len(columns)
+    for row in rows:
+        values = dict(zip(columns, row))
+        # GROUPING() is 0 for the column the row was grouped by.
+        name = names[row[width : width + len(names)].index(0)]
+        entry = {"value": values[f"{name}_value"]}
+        if f"{name}_label" in values:
+            entry["label"] = values[f"{name}_label"]
+        elif name == "employment_type":
+            entry["label"] = EMPLOYMENT_TYPE_LABELS.get(entry["value"])
+        entry["count"] = row[-1]
+        counts[name].append(entry)
+    for entries in counts.values():
+        entries.sort(key=lambda entry: (-entry["count"], str(entry["value"])))
+        del entries[FACET_LIMIT:]
+    return counts
+
+
+def cached_facet_counts(queryset, names, scope):
+    """``facet_counts`` for an unfiltered list, cached until any job or category changes."""
+    generations = ".".join(
+        str(g) for g in get_generations(JOB_GENERATION, CATEGORY_GENERATION)
+    )
+    key = f"jobs:facets:{scope}:{','.join(names)}:{generations}"
+    counts = cache.get(key)
+    observe_cache("jobs:facets", counts is not None)
+    if counts is None:
+        counts = facet_counts(queryset, names)
+        cache.set(key, counts, timeout=settings.JOBS_RESPONSE_CACHE_TIMEOUT)
+    return counts
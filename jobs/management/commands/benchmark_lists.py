@@ -0,0 +1,96 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from jobs.models import Notification
+
+User = get_user_model()
+
+# The cache is cleared before every request; a private one leaves the shared
+# cache (token versions, generations, recommendations) alone.
+BENCHMARK_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "benchmark-lists",
+    }
+}
+
+# (label, path, query params, who asks) for the list pages compared
+ENDPOINTS = [
+    ("jobs", "/api/jobs/jobs/", {}, "anonymous"),
+    ("jobs cursor", "/api/jobs/jobs/", {"pagination": "cursor"}, "anonymous"),
+    ("jobs search", "/api/jobs/jobs/", {"search": "developer"}, "anonymous"),
+    ("notifications", "/api/jobs/notifications/", {}, "recipient"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare one worker's throughput on the job and notification list "
+        "pages with FAST_LIST_SERIALIZATION off (DRF serializers) and on "
+        "(values() rows + orjson), in process against the current database. "
+        "Requests go through a private local-memory cache, cleared before "
+        "each one, and both paths must return the same bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests per endpoint and mode.",
+        )
+
+    def handle(self, *args, **options):
+        total = options["requests"]
+        if total < 1:
+            raise CommandError("--requests must be positive.")
+        recipient_id = (
+            Notification.objects.order_by("user_id")
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        recipient = User.objects.filter(pk=recipient_id).first()
+
+        for label, path, params, who in ENDPOINTS:
+            client = APIClient()
+            if who == "recipient":
+                if recipient is None:
+                    self.stdout.write(f"{label}: skipped, no notifications")
+                    continue
+                client.force_authenticate(recipient)
+
+            rates, bodies = {}, {}
+            for fast in (False, True):
+                with override_settings(
+                    FAST_LIST_SERIALIZATION=fast,
+                    ALLOWED_HOSTS=["*"],
+                    CACHES=BENCHMARK_CACHES,
+                ):
+                    rates[fast], bodies[fast] = self.measure(
+                        client, path, params, total
+                    )
+            if bodies[False] != bodies[True]:
+                raise CommandError(f"{label}: the two paths returned different bodies.")
+            self.stdout.write(
+                f"{label}: {rates[False]:,.1f} -> {rates[True]:,.1f} req/s "
+                f"per worker ({rates[True] / rates[False]:.2f}x)"
+            )
+
+    def measure(self, client, path, params, total):
+        """``(requests per second, last body)`` for ``total`` sequential GETs."""
+        body = None
+        elapsed = 0.0
+        for _ in range(total):
+            cache.clear()
+            started = time.perf_counter()
+            response = client.get(path, params, HTTP_ACCEPT="application/json")
+            elapsed += time.perf_counter() - started
+            if response.status_code != 200:
+                raise CommandError(f"{path} answered {response.status_code}.")
+            body = response.content
+        return total / elapsed, body
@@ -0,0 +1,116 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from jobs.models import Notification
+from jobs.search import JobSearchFilter
+from jobs.views import (
+    ApplicationViewSet,
+    FavoriteJobViewSet,
+    JobViewSet,
+    NotificationViewSet,
+)
+
+User = get_user_model()
+
+PAGE_SIZE = 20
+
+
+def seq_scanned_tables(plan):
+    """Return the relations read with a ``Seq Scan`` anywhere in ``plan``."""
+    tables = set()
+    if plan.get("Node Type") == "Seq Scan":
+        tables.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        tables |= seq_scanned_tables(child)
+    return tables
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the hot API queries and fail on any sequential scan."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--show-plans", action="store_true", help="Print every query plan."
+        )
+
+    def handle(self, *args, **options):
+        failures = []
+        for name, queryset in self.hot_queries():
+            plan = self.explain(queryset)
+            scans = seq_scanned_tables(plan)
+            if options["show_plans"]:
+                self.stdout.write(json.dumps(plan, indent=2))
+            if scans:
+                failures.append(name)
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"{name}: sequential scan on {', '.join(sorted(scans))}"
+                    )
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{name}: ok"))
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} hot queries fall back to a sequential scan."
+            )
+
+    def explain(self, queryset):
+        # With sequential scans priced out the planner still picks one when no
+        # usable index exists, so small development tables give honest answers.
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            return json.loads(queryset.explain(format="json"))[0]["Plan"]
+
+    def build_view(self, viewset_class, user, params=None):
+        request = Request(APIRequestFactory().get("/", params or {}))
+        request.user = user
+        view = viewset_class(
+            request=request, action="list", format_kwarg=None, args=(), kwargs={}
+        )
+        return view
+
+    def hot_queries(self):
+        anonymous = Request(APIRequestFactory().get("/")).user
+        user = User(pk=1, username="explain")
+
+        jobs = self.build_view(JobViewSet, anonymous).get_queryset()
+        search_view = self.build_view(JobViewSet, anonymous, {"search": "developer"})
+        search = JobSearchFilter().filter_queryset(
+            search_view.request, jobs, search_view
+        )
+
+        return [
+            ("job feed", jobs[:PAGE_SIZE]),
+            ("job feed by category", jobs.filter(category_id=1)[:PAGE_SIZE]),
+            ("job feed by location", jobs.filter(location="Remote")[:PAGE_SIZE]),
+            (
+                "job feed by employment type",
+                jobs.filter(employment_type="FT")[:PAGE_SIZE],
+            ),
+            ("job search", search[:PAGE_SIZE]),
+            (
+                "notification list",
+                self.build_view(NotificationViewSet, user).get_queryset()[:PAGE_SIZE],
+            ),
+            (
+                "unread notifications",
+                Notification.objects.filter(user=user, is_read=False).order_by(
+                    "-created_at"
+                )[:PAGE_SIZE],
+            ),
+            (
+                "application list",
+                self.build_view(ApplicationViewSet, user).get_queryset()[:PAGE_SIZE],
+            ),
+            (
+                "favorite job list",
+                self.build_view(FavoriteJobViewSet, user).get_queryset()[:PAGE_SIZE],
+            ),
+        ]
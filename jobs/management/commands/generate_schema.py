@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from jobboard.schema import write_schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the OpenAPI schema once and write it to disk, so web workers "
+        "load it instead of walking every endpoint themselves."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=settings.API_SCHEMA_FILE or None,
+            help="Target file (defaults to API_SCHEMA_FILE).",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        if not output:
+            raise CommandError("Pass --output or set API_SCHEMA_FILE.")
+        spec = write_schema(output)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(spec['paths'])} paths to {output}.")
+        )
@@ -0,0 +1,90 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(pct / 100 * len(values)) - 1)]
+
+
+def fetch(url, headers, timeout):
+    """GET ``url`` and return ``(seconds, ok)``."""
+    started = time.perf_counter()
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
+            response.read()
+        ok = True
+    except (URLError, OSError):
+        ok = False
+    return time.perf_counter() - started, ok
+
+
+class Command(BaseCommand):
+    help = (
+        "Send concurrent GETs to a running server and report throughput and "
+        "latency. Run it once against `gunicorn jobboard.wsgi` and once "
+        "against the `async` process in the Procfile to compare the two."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "url", help="Full URL, e.g. http://localhost:8000/api/jobs/async/jobs/"
+        )
+        parser.add_argument(
+            "--requests", type=int, default=1000, help="Total requests to send."
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=50, help="Requests in flight at once."
+        )
+        parser.add_argument(
+            "--token", help="Access token sent as 'Authorization: Bearer <token>'."
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Per-request timeout in seconds.",
+        )
+
+    def handle(self, *args, **options):
+        total, concurrency = options["requests"], options["concurrency"]
+        if total < 1 or concurrency < 1:
+            raise CommandError("--requests and --concurrency must be positive.")
+
+        headers = {"Accept": "application/json"}
+        if options["token"]:
+            headers["Authorization"] = f"Bearer {options['token']}"
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(
+                pool.map(
+                    lambda _: fetch(options["url"], headers, options["timeout"]),
+                    range(total),
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(seconds * 1000 for seconds, _ in results)
+        errors = sum(1 for _, ok in results if not ok)
+        style = self.style.SUCCESS if not errors else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"{total:,} requests, {errors:,} errors in {elapsed:.2f}s "
+                f"({total / elapsed:,.1f} req/s) at concurrency {concurrency}"
+            )
+        )
+        self.stdout.write(
+            "latency ms: "
+            + ", ".join(
+                f"p{pct} {percentile(latencies, pct):.1f}" for pct in (50, 95, 99)
+            )
+            + f", max {latencies[-1]:.1f}"
+        )
@@ -0,0 +1,86 @@
+import os
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.blobs import add_references, hash_file, store_blob
+from jobs.models import Application
+
+
+def human_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Move resumes stored per application under resumes/ into the "
+        "content-addressed blob store and report the bytes saved."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Hash the files and report the savings without changing anything.",
+        )
+        parser.add_argument(
+            "--keep-files",
+            action="store_true",
+            help="Leave the original files in place after migrating them.",
+        )
+
+    def handle(self, *args, **options):
+        names = list(
+            Application.objects.filter(resume_blob=None)
+            .exclude(resume="")
+            .order_by()
+            .values_list("resume", flat=True)
+            .distinct()
+        )
+        blob_sizes = {}
+        files = missing = before = updated = 0
+
+        for name in names:
+            if not default_storage.exists(name):
+                missing += 1
+                continue
+            with default_storage.open(name, "rb") as resume:
+                sha256, size = hash_file(resume)
+                files += 1
+                before += size
+                blob_sizes[sha256] = size
+                if options["dry_run"]:
+                    continue
+                blob_name, count = self.migrate(name, resume, sha256, size)
+                updated += count
+            if not options["keep_files"] and name != blob_name:
+                default_storage.delete(name)
+
+        after = sum(blob_sizes.values())
+        verb = "Would store" if options["dry_run"] else "Stored"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {files:,} resume files as {len(blob_sizes):,} blobs: "
+                f"{human_bytes(before)} -> {human_bytes(after)}, "
+                f"saved {human_bytes(before - after)}."
+            )
+        )
+        if updated:
+            self.stdout.write(f"Updated {updated:,} applications.")
+        if missing:
+            self.stdout.write(self.style.WARNING(f"Skipped {missing:,} missing files."))
+
+    def migrate(self, name, resume, sha256, size):
+        """Point every application using ``name`` at the blob for its content."""
+        with transaction.atomic():
+            blob = store_blob(resume, sha256, size, os.path.splitext(name)[1].lower())
+            count = Application.objects.filter(resume=name, resume_blob=None).update(
+                resume_blob=blob, resume=blob.file.name
+            )
+            add_references(sha256, count)
+        return blob.file.name, count
@@ -1,15 +1,105 @@
-from django.core.management.base import BaseCommand
-from django.contrib.auth import get_user_model
-from jobs.models import Category, Job
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import accumulate
 import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from faker import Faker
+
+from jobs.cache import JOB_GENERATION, bump_generation
+from jobs.models import Application, Category, FavoriteJob, Job
+from jobs.search import update_search_vector
+from jobs.stats import reconcile_stats
 
 User = get_user_model()
 
+EMPLOYMENT_TYPE_WEIGHTS = {"FT": 60, "PT": 12, "CT": 15, "IN": 8, "TP": 5}
+INDUSTRIES = [
+    "Software",
+    "Marketing",
+    "Design",
+    "Sales",
+    "Finance",
+    "Healthcare",
+    "Education",
+    "Logistics",
+    "Legal",
+    "Hospitality",
+    "Manufacturing",
+    "Customer Support",
+    "Data Science",
+    "Human Resources",
+    "Operations",
+]
+STATUS_WEIGHTS = {"PENDING": 70, "ACCEPTED": 10, "REJECTED": 20}
+
+
+@contextmanager
+def explicit_timestamps(model, *field_names):
+    """Let ``bulk_create`` keep the timestamps we generate instead of now()."""
+    fields = [model._meta.get_field(name) for name in field_names]
+    saved = [(field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, (auto_now, auto_now_add) in zip(fields, saved):
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
 
 class Command(BaseCommand):
-    help = "Seed the database with initial categories, jobs, and users."
+    help = (
+        "Seed the database with initial categories, jobs, and users. "
+        "Pass --users/--jobs/--applications/--favorites to also bulk-load "
+        "a deterministic synthetic dataset for performance work."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=0, help="Synthetic users.")
+        parser.add_argument("--jobs", type=int, default=0, help="Synthetic jobs.")
+        parser.add_argument(
+            "--applications", type=int, default=0, help="Synthetic applications."
+        )
+        parser.add_argument(
+            "--favorites", type=int, default=0, help="Synthetic favorite jobs."
+        )
+        parser.add_argument(
+            "--categories",
+            type=int,
+            default=len(INDUSTRIES),
+            help="Categories to spread synthetic jobs over.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=None, help="Seed for reproducible data."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="Rows per INSERT."
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Spread synthetic timestamps over this many past days.",
+        )
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self._weight_tables = {}
+        self.seed_fixtures()
 
-    def handle(self, *args, **kwargs):
+        if any(
+            options[name] for name in ("users", "jobs", "applications", "favorites")
+        ):
+            self.seed_volume(options)
+
+        self.stdout.write(self.style.SUCCESS("Seeding completed!"))
+
+    def seed_fixtures(self):
         # Create superuser
         if not User.objects.filter(username="admin").exists():
             User.objects.create_superuser(
@@ -70,11 +160,211 @@ class Command(BaseCommand):
                     title=title,
                     description=description,
                     category=category,
-                    location=random.choice(locations),
-                    employment_type=random.choice(employment_types),
+                    location=self.rng.choice(locations),
+                    employment_type=self.rng.choice(employment_types),
                     created_by=admin_user,
                 )
                 if created:
                     self.stdout.write(self.style.SUCCESS(f"Job '{title}' created."))
 
-        self.stdout.write(self.style.SUCCESS("Seeding completed!"))
\ No newline at end of file
+    # -------------------------------
+    # Synthetic load data
+    # -------------------------------
+
+    def seed_volume(self, options):
+        self.fake = Faker()
+        self.fake.seed_instance(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now()
+        self.days = options["days"]
+        seed = options["seed"]
+        self.prefix = f"seed{seed if seed is not None else self.rng.getrandbits(32)}_"
+
+        category_ids = self.ensure_categories(options["categories"])
+        candidate_ids, employer_ids = self.seed_users(options["users"])
+        employer_ids = employer_ids or list(
+            User.objects.filter(is_superuser=True).values_list("id", flat=True)
+        )
+        job_ids = self.seed_jobs(options["jobs"], category_ids, employer_ids)
+        if not job_ids:
+            job_ids = list(Job.objects.values_list("id", flat=True))
+        if not candidate_ids:
+            candidate_ids = list(
+                User.objects.filter(is_superuser=False).values_list("id", flat=True)
+            )
+
+        self.seed_pairs(
+            "applications",
+            Application,
+            options["applications"],
+            candidate_ids,
+            job_ids,
+            self.build_application,
+        )
+        self.seed_pairs(
+            "favorites",
+            FavoriteJob,
+            options["favorites"],
+            candidate_ids,
+            job_ids,
+            self.build_favorite,
+        )
+
+        # bulk_create skips the signals that keep the counters in step.
+        started = time.perf_counter()
+        fixed = reconcile_stats()
+        self.report("stats reconciled", fixed, started)
+
+    def report(self, label, rows, started):
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{label}: {rows:,} rows in {elapsed:.1f}s "
+                f"({rows / elapsed:,.0f} rows/s)"
+            )
+        )
+
+    def random_timestamp(self):
+        return self.now - timedelta(seconds=self.rng.randrange(self.days * 86400))
+
+    def weighted(self, weights):
+        population, cum_weights = self._weight_tables.setdefault(
+            id(weights), (list(weights), list(accumulate(weights.values())))
+        )
+        return self.rng.choices(population, cum_weights=cum_weights)[0]
+
+    def ensure_categories(self, count):
+        names = [
+            (
+                INDUSTRIES[i]
+                if i < len(INDUSTRIES)
+                else f"{INDUSTRIES[i % len(INDUSTRIES)]} {i}"
+            )
+            for i in range(count)
+        ]
+        Category.objects.bulk_create(
+            [Category(name=name) for name in names], ignore_conflicts=True
+        )
+        return list(
+            Category.objects.filter(name__in=names).values_list("id", flat=True)
+        )
+
+    def seed_users(self, count):
+        if not count:
+            return [], []
+        if User.objects.filter(username__startswith=self.prefix).exists():
+            raise CommandError(
+                f"Users prefixed '{self.prefix}' already exist; "
+                "use another --seed or a fresh database."
+            )
+        started = time.perf_counter()
+        password = make_password("password123")
+        roles = {"candidate": 90, "employer": 10}
+        candidate_ids, employer_ids = [], []
+
+        for offset in range(0, count, self.batch_size):
+            batch = []
+            for i in range(offset, min(offset + self.batch_size, count)):
+                username = f"{self.prefix}{i}_{self.fake.user_name()}"[:150]
+                batch.append(
+                    User(
+                        username=username,
+                        email=f"{username}@example.com",
+                        first_name=self.fake.first_name(),
+                        last_name=self.fake.last_name(),
+                        password=password,
+                        role=self.weighted(roles),
+                        date_joined=self.random_timestamp(),
+                    )
+                )
+            for user in User.objects.bulk_create(batch):
+                (employer_ids if user.role == "employer" else candidate_ids).append(
+                    user.id
+                )
+
+        self.report("users", count, started)
+        return candidate_ids, employer_ids
+
+    def seed_jobs(self, count, category_ids, employer_ids):
+        if not count:
+            return []
+        started = time.perf_counter()
+        # Pools keep Faker out of the per-row loop while still giving realistic,
+        # skewed text for search and filter benchmarks.
+        titles = [self.fake.job() for _ in range(min(count, 2000))]
+        descriptions = [
+            self.fake.paragraph(nb_sentences=6) for _ in range(min(count, 5000))
+        ]
+        cities = ["Remote"] * 20 + [self.fake.city() for _ in range(300)]
+        job_ids = []
+
+        with explicit_timestamps(Job, "created_at", "updated_at"):
+            for offset in range(0, count, self.batch_size):
+                batch = []
+                for _ in range(min(self.batch_size, count - offset)):
+                    created_at = self.random_timestamp()
+                    batch.append(
+                        Job(
+                            title=self.rng.choice(titles),
+                            description=self.rng.choice(descriptions),
+                            category_id=self.rng.choice(category_ids),
+                            created_by_id=self.rng.choice(employer_ids),
+                            location=self.rng.choice(cities),
+                            employment_type=self.weighted(EMPLOYMENT_TYPE_WEIGHTS),
+                            created_at=created_at,
+                            updated_at=created_at,
+                            is_active=self.rng.random() < 0.9,
+                        )
+                    )
+                job_ids.extend(job.id for job in Job.objects.bulk_create(batch))
+        self.report("jobs", count, started)
+
+        # bulk_create skips the post_save signal, so index the new rows at once.
+        started = time.perf_counter()
+        update_search_vector(Job.objects.filter(search_vector__isnull=True))
+        self.report("job search vectors", count, started)
+        bump_generation(JOB_GENERATION)
+        return job_ids
+
+    def build_application(self, candidate_id, job_id):
+        return Application(
+            job_id=job_id,
+            candidate_id=candidate_id,
+            resume=f"resumes/{self.prefix}{candidate_id}.pdf",
+            cover_letter=self.rng.choice(self.cover_letters),
+            status=self.weighted(STATUS_WEIGHTS),
+            applied_at=self.random_timestamp(),
+        )
+
+    def build_favorite(self, user_id, job_id):
+        return FavoriteJob(
+            user_id=user_id, job_id=job_id, added_at=self.random_timestamp()
+        )
+
+    def seed_pairs(self, label, model, count, user_ids, job_ids, build):
+        """Insert ``count`` rows with a unique (user, job) pair each."""
+        if not count:
+            return
+        if not user_ids or not job_ids:
+            raise CommandError(f"Cannot seed {label} without users and jobs.")
+        per_user, extra = divmod(count, len(user_ids))
+        if per_user + (1 if extra else 0) > len(job_ids):
+            raise CommandError(
+                f"{count:,} {label} need more jobs than the {len(job_ids):,} available."
+            )
+
+        started = time.perf_counter()
+        self.cover_letters = [self.fake.paragraph(nb_sentences=3) for _ in range(500)]
+        timestamp_field = "applied_at" if model is Application else "added_at"
+        batch = []
+        with explicit_timestamps(model, timestamp_field):
+            for index, user_id in enumerate(user_ids):
+                picks = per_user + (1 if index < extra else 0)
+                for job_id in self.rng.sample(job_ids, picks):
+                    batch.append(build(user_id, job_id))
+                    if len(batch) >= self.batch_size:
+                        model.objects.bulk_create(batch, ignore_conflicts=True)
+                        batch = []
+            if batch:
+                model.objects.bulk_create(batch, ignore_conflicts=True)
+        self.report(label, count, started)
@@ -0,0 +1,72 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0004_favoritejob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="application",
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name="favoritejob",
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="link",
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="notification_type",
+            field=models.CharField(
+                choices=[
+                    ("JOB", "Job Update"),
+                    ("APP", "Application Status"),
+                    ("SYS", "System"),
+                ],
+                default="SYS",
+                max_length=3,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="application",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("ACCEPTED", "Accepted"),
+                    ("REJECTED", "Rejected"),
+                ],
+                db_index=True,
+                default="PENDING",
+                max_length=8,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="is_read",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddConstraint(
+            model_name="application",
+            constraint=models.UniqueConstraint(
+                fields=("job", "candidate"), name="unique_application"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="favoritejob",
+            constraint=models.UniqueConstraint(
+                fields=("user", "job"), name="unique_favorite_job"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:04
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def populate_search_vector(apps, schema_editor):
+    from jobs.search import update_search_vector
+
+    Job = apps.get_model("jobs", "Job")
+    update_search_vector(Job.objects.all())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0005_notification_fields_and_constraints"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="job",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="jobs_job_search_vector_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="jobs_job_title_trgm_gin",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
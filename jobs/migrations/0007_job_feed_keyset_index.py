@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0006_job_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="job",
+            options={"ordering": ["-created_at", "-id"], "verbose_name_plural": "Jobs"},
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="jobs_job_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_unread_counters(apps, schema_editor):
+    Notification = apps.get_model("jobs", "Notification")
+    NotificationCounter = apps.get_model("jobs", "NotificationCounter")
+    unread = (
+        Notification.objects.filter(is_read=False)
+        .order_by()
+        .values("user")
+        .annotate(total=Count("id"))
+    )
+    NotificationCounter.objects.bulk_create(
+        NotificationCounter(user_id=row["user"], unread_count=row["total"])
+        for row in unread
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0008_notificationevent"),
+        ("users", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationCounter",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="notification_counter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("unread_count", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "-created_at"], name="jobs_notif_user_created_idx"
+            ),
+        ),
+        migrations.RunPython(populate_unread_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0009_notificationcounter"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="job",
+            name="jobs_job_title_0e1e41_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="job",
+            name="jobs_job_locatio_8b2f8c_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="job",
+            name="jobs_job_is_acti_b6ae73_idx",
+        ),
+        migrations.AlterField(
+            model_name="job",
+            name="is_active",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="is_read",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-created_at", "-id"],
+                name="jobs_job_active_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["category", "-created_at"],
+                name="jobs_job_active_category_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["location", "-created_at"],
+                name="jobs_job_active_location_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["employment_type", "-created_at"],
+                name="jobs_job_active_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "is_read", "created_at"],
+                name="jobs_notif_user_unread_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def uploads_to_blobs(apps, schema_editor):
+    ResumeUpload = apps.get_model("jobs", "ResumeUpload")
+    ResumeBlob = apps.get_model("jobs", "ResumeBlob")
+    Application = apps.get_model("jobs", "Application")
+
+    ready = ResumeUpload.objects.filter(status="READY").exclude(file="")
+    for upload in ready.iterator():
+        blob, _ = ResumeBlob.objects.get_or_create(
+            sha256=upload.sha256,
+            defaults={"file": upload.file.name, "size": upload.size},
+        )
+        ResumeUpload.objects.filter(pk=upload.pk).update(blob=blob)
+        Application.objects.filter(resume_upload=upload).update(
+            resume_blob=blob, resume=blob.file.name
+        )
+    for blob in ResumeBlob.objects.annotate(refs=Count("applications")):
+        ResumeBlob.objects.filter(pk=blob.pk).update(ref_count=blob.refs)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0011_resumeupload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumeBlob",
+            fields=[
+                (
+                    "sha256",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("file", models.FileField(upload_to="resumes/")),
+                ("size", models.PositiveBigIntegerField()),
+                ("ref_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="application",
+            name="resume_blob",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="applications",
+                to="jobs.resumeblob",
+            ),
+        ),
+        migrations.AddField(
+            model_name="resumeupload",
+            name="blob",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="uploads",
+                to="jobs.resumeblob",
+            ),
+        ),
+        migrations.RunPython(uploads_to_blobs, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="resumeupload",
+            name="file",
+        ),
+    ]
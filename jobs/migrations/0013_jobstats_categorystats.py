@@ -0,0 +1,97 @@
+# Generated by Django 5.1.3 on 2026-10-18 20:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+STATUS_COUNTERS = {
+    "PENDING": "applications_pending",
+    "ACCEPTED": "applications_accepted",
+    "REJECTED": "applications_rejected",
+}
+
+
+def populate_stats(apps, schema_editor):
+    Application = apps.get_model("jobs", "Application")
+    Category = apps.get_model("jobs", "Category")
+    CategoryStats = apps.get_model("jobs", "CategoryStats")
+    FavoriteJob = apps.get_model("jobs", "FavoriteJob")
+    Job = apps.get_model("jobs", "Job")
+    JobStats = apps.get_model("jobs", "JobStats")
+
+    stats = {pk: JobStats(job_id=pk) for pk in Job.objects.values_list("pk", flat=True)}
+    applications = (
+        Application.objects.order_by().values("job", "status").annotate(n=Count("id"))
+    )
+    for row in applications:
+        setattr(stats[row["job"]], STATUS_COUNTERS[row["status"]], row["n"])
+    for row in FavoriteJob.objects.order_by().values("job").annotate(n=Count("id")):
+        stats[row["job"]].favorites = row["n"]
+    JobStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+    active = dict(
+        Job.objects.filter(is_active=True)
+        .order_by()
+        .values("category")
+        .annotate(n=Count("id"))
+        .values_list("category", "n")
+    )
+    CategoryStats.objects.bulk_create(
+        [
+            CategoryStats(category_id=pk, active_jobs=active.get(pk, 0))
+            for pk in Category.objects.values_list("pk", flat=True)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0012_resumeblob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryStats",
+            fields=[
+                (
+                    "category",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="jobs.category",
+                    ),
+                ),
+                ("active_jobs", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Category stats",
+            },
+        ),
+        migrations.CreateModel(
+            name="JobStats",
+            fields=[
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="jobs.job",
+                    ),
+                ),
+                ("applications_pending", models.PositiveIntegerField(default=0)),
+                ("applications_accepted", models.PositiveIntegerField(default=0)),
+                ("applications_rejected", models.PositiveIntegerField(default=0)),
+                ("favorites", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name_plural": "Job stats",
+            },
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,9 @@
+import uuid
+
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
 User = get_user_model()
 
@@ -15,12 +19,56 @@ class Notification(models.Model):
     notification_type = models.CharField(max_length=3, choices=NOTIFICATION_TYPES, default="SYS")
     link = models.URLField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    is_read = models.BooleanField(default=False, db_index=True)
+    is_read = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at"], name="jobs_notif_user_created_idx"
+            ),
+            models.Index(
+                fields=["user", "is_read", "created_at"],
+                name="jobs_notif_user_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Notification for {self.user.username}: {self.message[:20]}"
 
 
+class NotificationCounter(models.Model):
+    """Denormalized per-user unread count, kept in step by ``jobs.notifications``."""
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_counter",
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread_count} unread"
+
+
+class NotificationEvent(models.Model):
+    """Outbox row turned into ``Notification`` rows by ``drain_notification_outbox``."""
+
+    APPLICATION_CREATED = "application_created"
+    EVENT_TYPES = [
+        (APPLICATION_CREATED, "Application created"),
+    ]
+    event_type = models.CharField(max_length=32, choices=EVENT_TYPES)
+    payload = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.event_type} {self.payload}"
+
+
 class FavoriteJob(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="favorite_jobs")
     job = models.ForeignKey("Job", on_delete=models.CASCADE, related_name="favorited_by")
@@ -30,6 +78,10 @@ class FavoriteJob(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["user", "job"], name="unique_favorite_job")
         ]
+        # Reports aggregate favorites by date range, one range per chunk
+        indexes = [
+            models.Index(fields=["added_at"], name="jobs_favorite_added_idx"),
+        ]
         ordering = ["-added_at"]
 
     def __str__(self):
@@ -66,21 +118,210 @@ class Job(models.Model):
     employment_type = models.CharField(max_length=2, choices=EMPLOYMENT_TYPES)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    is_active = models.BooleanField(default=True, db_index=True)
+    is_active = models.BooleanField(default=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
+        # Anonymous traffic only ever reads active jobs, newest first, so the
+        # feed and its filters get partial indexes limited to active rows.
         indexes = [
-            models.Index(fields=["title"]),
-            models.Index(fields=["location"]),
-            models.Index(fields=["is_active"]),
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_active=True),
+                name="jobs_job_active_feed_idx",
+            ),
+            models.Index(
+                fields=["category", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="jobs_job_active_category_idx",
+            ),
+            models.Index(
+                fields=["location", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="jobs_job_active_location_idx",
+            ),
+            models.Index(
+                fields=["employment_type", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="jobs_job_active_type_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="jobs_job_search_vector_gin"),
+            GinIndex(
+                fields=["title"],
+                name="jobs_job_title_trgm_gin",
+                opclasses=["gin_trgm_ops"],
+            ),
+            models.Index(
+                fields=["-created_at", "-id"], name="jobs_job_created_id_idx"
+            ),
         ]
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
         verbose_name_plural = "Jobs"
 
     def __str__(self):
         return self.title
 
 
+class JobStats(models.Model):
+    """Denormalized per-job counters, kept in step by ``jobs.stats``."""
+
+    job = models.OneToOneField(
+        Job, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    applications_pending = models.PositiveIntegerField(default=0)
+    applications_accepted = models.PositiveIntegerField(default=0)
+    applications_rejected = models.PositiveIntegerField(default=0)
+    favorites = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Job stats"
+
+    @property
+    def applications_total(self):
+        return (
+            self.applications_pending
+            + self.applications_accepted
+            + self.applications_rejected
+        )
+
+    def __str__(self):
+        return f"{self.job_id}: {self.applications_total} applications"
+
+
+class CategoryStats(models.Model):
+    """Denormalized per-category counters, kept in step by ``jobs.stats``."""
+
+    category = models.OneToOneField(
+        Category, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    active_jobs = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Category stats"
+
+    def __str__(self):
+        return f"{self.category_id}: {self.active_jobs} active jobs"
+
+
+class Recommendation(models.Model):
+    """A user's precomputed top jobs, refreshed by ``jobs.recommendations``."""
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="recommendation"
+    )
+    job_ids = models.JSONField(default=list)
+    refreshed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.user_id}: {len(self.job_ids)} recommended jobs"
+
+
+class SavedSearch(models.Model):
+    """
+    A job query a user subscribed to. New jobs matching every given
+    criterion are announced as notifications by ``jobs.alerts``.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="saved_searches"
+    )
+    name = models.CharField(max_length=100, blank=True)
+    search = models.CharField(max_length=200, blank=True)
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="saved_searches",
+    )
+    location = models.CharField(max_length=200, blank=True)
+    employment_type = models.CharField(
+        max_length=2, choices=Job.EMPLOYMENT_TYPES, blank=True
+    )
+    # Match keys derived from the criteria, and the one the search is indexed under
+    keys = models.JSONField(default=list, editable=False)
+    anchor = models.CharField(max_length=210, db_index=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name_plural = "Saved searches"
+
+    def __str__(self):
+        return self.name or f"Saved search {self.pk}"
+
+
+class JobAlertMark(models.Model):
+    """Single row holding the id of the last job matched against saved searches."""
+
+    last_job_id = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Jobs matched up to {self.last_job_id}"
+
+
+class ResumeBlob(models.Model):
+    """
+    One stored resume file, keyed by the SHA-256 of its content.
+
+    ``ref_count`` counts the applications pointing at the blob; the blob and
+    its file are reclaimed once it drops to zero and no upload refers to it.
+    """
+
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    file = models.FileField(upload_to="resumes/")
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
+
+
+class ResumeUpload(models.Model):
+    """
+    A resumable, chunked resume upload.
+
+    Chunks are appended to a staging file; once ``received`` reaches ``size``
+    a Celery task validates the bytes and stores them as a ``ResumeBlob``.
+    """
+
+    UPLOADING = "UPLOADING"
+    PROCESSING = "PROCESSING"
+    READY = "READY"
+    FAILED = "FAILED"
+    STATUS_CHOICES = [
+        (UPLOADING, "Uploading"),
+        (PROCESSING, "Processing"),
+        (READY, "Ready"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="resume_uploads"
+    )
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    received = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=UPLOADING)
+    sha256 = models.CharField(max_length=64, blank=True, db_index=True)
+    blob = models.ForeignKey(
+        ResumeBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="uploads",
+    )
+    error = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.status})"
+
+
 class Application(models.Model):
     STATUS_CHOICES = [
         ("PENDING", "Pending"),
@@ -90,7 +331,21 @@ class Application(models.Model):
 
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="applications")
     candidate = models.ForeignKey(User, on_delete=models.CASCADE, related_name="applications")
-    resume = models.FileField(upload_to="resumes/")
+    resume = models.FileField(upload_to="resumes/", blank=True)
+    resume_upload = models.ForeignKey(
+        ResumeUpload,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="applications",
+    )
+    resume_blob = models.ForeignKey(
+        ResumeBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="applications",
+    )
     cover_letter = models.TextField(blank=True)
     status = models.CharField(max_length=8, choices=STATUS_CHOICES, default="PENDING", db_index=True)
     applied_at = models.DateTimeField(auto_now_add=True)
@@ -99,7 +354,78 @@ class Application(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["job", "candidate"], name="unique_application")
         ]
+        # Reports aggregate applications by date range, one range per chunk
+        indexes = [
+            models.Index(fields=["applied_at"], name="jobs_application_applied_idx"),
+        ]
         ordering = ["-applied_at"]
 
     def __str__(self):
         return f"{self.candidate.username} applied for {self.job.title}"
+
+
+class Report(models.Model):
+    """
+    A platform analytics report over a date range, computed in parallel
+    chunks by ``generate_report`` and kept so repeat requests are served
+    from ``result``.
+    """
+
+    JOBS_BY_CATEGORY = "jobs_by_category"
+    APPLICATION_FUNNEL = "application_funnel"
+    TOP_FAVORITED = "top_favorited"
+    REPORT_TYPES = [
+        (JOBS_BY_CATEGORY, "Jobs posted per category"),
+        (APPLICATION_FUNNEL, "Application funnel per job"),
+        (TOP_FAVORITED, "Top favorited jobs"),
+    ]
+    GRANULARITIES = [
+        ("day", "Day"),
+        ("week", "Week"),
+        ("month", "Month"),
+    ]
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    READY = "READY"
+    FAILED = "FAILED"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (READY, "Ready"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    report_type = models.CharField(max_length=32, choices=REPORT_TYPES)
+    date_from = models.DateField()
+    date_to = models.DateField()
+    granularity = models.CharField(max_length=5, choices=GRANULARITIES, default="day")
+    requested_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name="reports"
+    )
+    status = models.CharField(max_length=7, choices=STATUS_CHOICES, default=PENDING)
+    chunks = models.PositiveIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=[
+                    "report_type",
+                    "date_from",
+                    "date_to",
+                    "granularity",
+                    "-created_at",
+                ],
+                name="jobs_report_params_idx",
+            ),
+        ]
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.report_type} {self.date_from}..{self.date_to} ({self.status})"
@@ -0,0 +1,138 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Greatest
+from rest_framework.fields import DateTimeField
+
+from .broker import get_broker
+from .models import Application, Notification, NotificationCounter, NotificationEvent
+
+
+def record_event(event_type, **payload):
+    return NotificationEvent.objects.create(event_type=event_type, payload=payload)
+
+
+def build_application_created_notifications(events):
+    application_ids = [event.payload["application_id"] for event in events]
+    rows = (
+        Application.objects.filter(id__in=application_ids)
+        .order_by()
+        .values("job__title", "job__created_by_id", "candidate__username")
+    )
+    return [
+        Notification(
+            user_id=row["job__created_by_id"],
+            message=f"{row['candidate__username']} applied for {row['job__title']}",
+        )
+        for row in rows
+        # Jobs without an owner have nobody to notify.
+        if row["job__created_by_id"] is not None
+    ]
+
+
+EVENT_BUILDERS = {
+    NotificationEvent.APPLICATION_CREATED: build_application_created_notifications,
+}
+
+
+def build_notifications(events):
+    """Turn a batch of outbox events into unsaved ``Notification`` objects."""
+    by_type = {}
+    for event in events:
+        by_type.setdefault(event.event_type, []).append(event)
+
+    notifications = []
+    for event_type, typed_events in by_type.items():
+        notifications.extend(EVENT_BUILDERS[event_type](typed_events))
+    return notifications
+
+
+# -------------------------------
+# Streaming
+# -------------------------------
+
+
+def notification_event(notification):
+    """SSE payload of a notification; the stream adds ``user_username``."""
+    return {
+        "id": notification.pk,
+        "message": notification.message,
+        "created_at": DateTimeField().to_representation(notification.created_at),
+        "is_read": notification.is_read,
+    }
+
+
+def publish_notifications(notifications):
+    broker = get_broker()
+    for notification in notifications:
+        broker.publish(notification.user_id, notification_event(notification))
+
+
+# -------------------------------
+# Unread counters
+# -------------------------------
+
+
+def increment_unread(counts):
+    """Add ``{user_id: n}`` to the unread counters in a single UPDATE."""
+    counts = {user_id: n for user_id, n in counts.items() if n}
+    if not counts:
+        return
+    user_ids = sorted(counts)
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id) for user_id in user_ids],
+        ignore_conflicts=True,
+    )
+    NotificationCounter.objects.filter(user_id__in=user_ids).update(
+        unread_count=F("unread_count")
+        + Case(
+            *[
+                When(user_id=user_id, then=Value(counts[user_id]))
+                for user_id in user_ids
+            ],
+            output_field=IntegerField(),
+        )
+    )
+
+
+def decrement_unread(user_id, n):
+    if n:
+        NotificationCounter.objects.filter(user_id=user_id).update(
+            unread_count=Greatest(F("unread_count") - n, Value(0))
+        )
+
+
+def create_notifications(notifications):
+    """
+    ``bulk_create`` notifications, bump their owners' unread counters and
+    push them to open streams once committed.
+    """
+    with transaction.atomic():
+        created = Notification.objects.bulk_create(notifications)
+        increment_unread(Counter(n.user_id for n in created if not n.is_read))
+        transaction.on_commit(lambda: publish_notifications(created), robust=True)
+    return created
+
+
+def get_unread_count(user_id):
+    count = (
+        NotificationCounter.objects.filter(user_id=user_id)
+        .values_list("unread_count", flat=True)
+        .first()
+    )
+    return count or 0
+
+
+def mark_notifications_read(user_id, ids=None):
+    """
+    Mark the user's unread notifications (optionally only ``ids``) as read in
+    one UPDATE and return how many changed.
+    """
+    with transaction.atomic():
+        queryset = Notification.objects.filter(user_id=user_id, is_read=False)
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        updated = queryset.update(is_read=True)
+        decrement_unread(user_id, updated)
+    return updated
@@ -0,0 +1,57 @@
+from django.db import connections
+from rest_framework import pagination
+from rest_framework.response import Response
+
+TRUTHY = {"1", "true", "yes", "on"}
+
+
+def approximate_count(queryset):
+    """
+    Estimate the number of rows ``queryset`` would return from the planner's
+    statistics (``EXPLAIN``) instead of running ``SELECT COUNT(*)``.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class JobCursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination for the job feed, ordered like ``Job.Meta.ordering``.
+
+    Pages are fetched with ``WHERE created_at < <cursor>`` against the
+    ``(created_at, id)`` index, so no ``COUNT(*)`` is needed. DRF's cursor
+    only encodes ``created_at``: jobs sharing the boundary timestamp are
+    skipped with a small ``OFFSET`` (``id`` keeps their order stable), not by
+    key. ``?approx_count=true`` adds a planner-estimated total.
+    """
+
+    ordering = ("-created_at", "-id")
+    approximate_count_query_param = "approx_count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.approximate_count = None
+        flag = request.query_params.get(self.approximate_count_query_param, "")
+        if flag.lower() in TRUTHY:
+            self.approximate_count = approximate_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        payload = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+        }
+        if self.approximate_count is not None:
+            payload["approximate_count"] = self.approximate_count
+        payload["results"] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["approximate_count"] = {
+            "type": "integer",
+            "example": 1200,
+        }
+        return response_schema
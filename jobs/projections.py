@@ -0,0 +1,234 @@
+"""
+Serializer output built straight from ``values()`` rows.
+
+``compile_projection`` turns a read-only serializer into the columns to
+select and a plan that assembles each row into the dict the serializer
+would have returned, so list pages skip model instances and DRF's
+per-field ``to_representation`` calls. Serializers with a field it cannot
+reproduce exactly (method fields, related fields, custom formats) compile
+to ``None`` and keep the serializer.
+"""
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Field classes whose output is the column value passed through a converter.
+CONVERTERS = {
+    serializers.IntegerField: int,
+    serializers.BooleanField: bool,
+    serializers.CharField: str,
+    serializers.EmailField: str,
+    serializers.URLField: str,
+    serializers.SlugField: str,
+}
+
+# (serializer class, fields, expand) -> compiled Projection or None
+_projections = {}
+
+
+def format_datetime(value):
+    """``DateTimeField.to_representation`` for an aware datetime."""
+    value = value.astimezone(timezone.get_current_timezone()).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _choice_converter(field):
+    choices = field.choice_strings_to_values
+
+    def convert(value):
+        if value == "":
+            return value
+        return choices.get(str(value), value)
+
+    return convert
+
+
+def _converter(field):
+    """The converter reproducing ``field.to_representation``, or ``None``."""
+    if type(field) in CONVERTERS:
+        return CONVERTERS[type(field)]
+    if type(field) is serializers.ChoiceField:
+        return _choice_converter(field)
+    if (
+        type(field) is serializers.DateTimeField
+        and settings.USE_TZ
+        and str(getattr(field, "format", api_settings.DATETIME_FORMAT)).lower()
+        == ISO_8601
+        and not hasattr(field, "timezone")
+    ):
+        return format_datetime
+    return None
+
+
+def _model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _forward_relation(model, name):
+    field = _model_field(model, name)
+    if field and field.concrete and (field.many_to_one or field.one_to_one):
+        return field
+    return None
+
+
+def _plain_field(model, name):
+    field = _model_field(model, name)
+    return bool(field) and field.concrete and not field.is_relation
+
+
+def _compile_steps(serializer, prefix, columns):
+    """
+    Steps ``(key, column, convert, guard, nested)`` for ``serializer``'s
+    readable fields; ``guard`` is the foreign key column of the relation
+    the value is read through. ``None`` if a field is not supported.
+    """
+    model = serializer.Meta.model
+    steps = []
+    for field in serializer._readable_fields:
+        attrs = field.source_attrs
+        if isinstance(field, serializers.ModelSerializer):
+            relation = len(attrs) == 1 and _forward_relation(model, attrs[0])
+            if not relation:
+                return None
+            nested = _compile_steps(field, f"{prefix}{attrs[0]}__", columns)
+            if nested is None:
+                return None
+            guard = prefix + relation.attname
+            columns.append(guard)
+            steps.append((field.field_name, None, None, guard, nested))
+            continue
+
+        convert = _converter(field)
+        if convert is None or not 1 <= len(attrs) <= 2:
+            return None
+        guard = None
+        if len(attrs) == 2:
+            # DRF leaves the key out when the relation is empty.
+            relation = _forward_relation(model, attrs[0])
+            if not relation:
+                return None
+            if not _plain_field(relation.related_model, attrs[1]):
+                return None
+            guard = prefix + relation.attname
+            columns.append(guard)
+        elif not _plain_field(model, attrs[0]):
+            return None
+        column = prefix + "__".join(attrs)
+        columns.append(column)
+        steps.append((field.field_name, column, convert, guard, None))
+    return steps
+
+
+def _build(row, steps):
+    data = {}
+    for key, column, convert, guard, nested in steps:
+        if nested is not None:
+            data[key] = None if row[guard] is None else _build(row, nested)
+        elif guard is not None and row[guard] is None:
+            continue
+        else:
+            value = row[column]
+            data[key] = None if value is None else convert(value)
+    return data
+
+
+class Projection:
+    def __init__(self, columns, steps):
+        self.columns = list(dict.fromkeys(columns))
+        self.steps = steps
+
+    def values(self, queryset, extra=()):
+        """``queryset`` as rows of the needed columns, plus ``extra``."""
+        return queryset.values(*dict.fromkeys([*self.columns, *extra]))
+
+    def rows(self, values):
+        """The serializer's output for each row, as ``serializer.data`` would be."""
+        steps = self.steps
+        return [_build(row, steps) for row in values]
+
+
+def compile_projection(serializer):
+    """A ``Projection`` reproducing ``serializer`` (a single-object one), or ``None``."""
+    columns = []
+    steps = _compile_steps(serializer, "", columns)
+    if steps is None:
+        return None
+    return Projection(columns, steps)
+
+
+class ProjectedRows:
+    """
+    The projected ``values()`` rows of ``queryset`` for paginators that
+    count: slices select the projected columns, while ``count()`` runs on
+    ``queryset`` itself, without the joins those columns need.
+    """
+
+    def __init__(self, queryset, projection):
+        self.queryset = queryset
+        self.projection = projection
+
+    @property
+    def ordered(self):
+        return self.queryset.ordered
+
+    def count(self):
+        return self.queryset.count()
+
+    def __getitem__(self, key):
+        return self.projection.values(self.queryset)[key]
+
+
+class ProjectedListMixin:
+    """
+    Serve ``list`` from ``values()`` rows shaped by ``compile_projection``
+    when ``FAST_LIST_SERIALIZATION`` is on and the serializer (as built for
+    this request's context) can be reproduced; otherwise as usual.
+    """
+
+    def list(self, request, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = getattr(self.paginator, "ordering", None)
+        if ordering is None:
+            page = self.paginate_queryset(ProjectedRows(queryset, projection))
+        else:
+            # Keyset pagination reads its position from the first ordering
+            # column, so the ordering columns are selected too.
+            if isinstance(ordering, str):
+                ordering = [ordering]
+            extra = [
+                name.lstrip("-")
+                for name in [*queryset.query.order_by, *ordering]
+                if isinstance(name, str) and name != "?"
+            ]
+            page = self.paginate_queryset(projection.values(queryset, extra))
+        if page is None:
+            return Response(projection.rows(projection.values(queryset)))
+        return self.get_paginated_response(projection.rows(page))
+
+    def get_projection(self):
+        if not settings.FAST_LIST_SERIALIZATION:
+            return None
+        context = self.get_serializer_context()
+        serializer_class = self.get_serializer_class()
+        fields = context.get("fields")
+        key = (
+            serializer_class,
+            None if fields is None else tuple(sorted(fields)),
+            tuple(sorted(context.get("expand", ()))),
+        )
+        if key not in _projections:
+            _projections[key] = compile_projection(serializer_class(context=context))
+        return _projections[key]
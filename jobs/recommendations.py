@@ -0,0 +1,282 @@
+"""
+Personalized job recommendations.
+
+Every active job is scored for a user from two signals, both computed with
+sparse matrix products over the whole catalogue:
+
+* item-to-item co-occurrence: jobs favorited or applied to by the same
+  users as the user's own jobs, cosine-normalized;
+* content similarity: TF-IDF of job titles and descriptions against the
+  jobs the user engaged with.
+
+``refresh_recommendations`` stores each user's top ``RECOMMENDATION_COUNT``
+job ids in ``Recommendation`` and the cache, so serving them is a single
+key lookup. Users without signals get the most popular jobs.
+"""
+
+import re
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from scipy import sparse
+
+from jobboard.metrics import observe_cache
+
+from .models import Application, FavoriteJob, Job, JobStats, Recommendation
+
+# Interaction weights; applying says more about a user than favoriting.
+FAVORITE_WEIGHT = 1.0
+APPLICATION_WEIGHT = 2.0
+# Share of the score from co-occurrence; the rest comes from content.
+COOCCURRENCE_SHARE = 0.6
+# Users scored together; bounds the dense score matrix to batch x jobs.
+SCORING_BATCH_SIZE = 256
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or our that "
+    "the their to we will with you your".split()
+)
+
+POPULAR_KEY = "jobs:recommendations:popular"
+
+
+def _cache_key(user_id):
+    return f"jobs:recommendations:{user_id}"
+
+
+# -------------------------------
+# Serving
+# -------------------------------
+
+
+def popular_job_ids():
+    """The most applied-to and favorited active jobs, for users without signals."""
+    job_ids = cache.get(POPULAR_KEY)
+    if job_ids is None:
+        popularity = (
+            F("applications_pending")
+            + F("applications_accepted")
+            + F("applications_rejected")
+            + F("favorites")
+        )
+        job_ids = list(
+            JobStats.objects.filter(job__is_active=True)
+            .annotate(popularity=popularity)
+            .order_by("-popularity", "-job_id")
+            .values_list("job_id", flat=True)[: settings.RECOMMENDATION_COUNT]
+        )
+        cache.set(POPULAR_KEY, job_ids, timeout=settings.RECOMMENDATION_CACHE_TIMEOUT)
+    return job_ids
+
+
+def get_recommended_job_ids(user_id):
+    """A user's recommended job ids, best first."""
+    key = _cache_key(user_id)
+    job_ids = cache.get(key)
+    observe_cache("recommendations", job_ids is not None)
+    if job_ids is None:
+        job_ids = (
+            Recommendation.objects.filter(user_id=user_id)
+            .values_list("job_ids", flat=True)
+            .first()
+        ) or popular_job_ids()
+        cache.set(key, job_ids, timeout=settings.RECOMMENDATION_CACHE_TIMEOUT)
+    return job_ids
+
+
+# -------------------------------
+# Model
+# -------------------------------
+
+
+def tokenize(text):
+    return [
+        token for token in TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS
+    ]
+
+
+def tfidf_matrix(texts):
+    """Row-normalized TF-IDF (sublinear tf, smoothed idf) as a CSR matrix."""
+    vocabulary = {}
+    indices = []
+    indptr = [0]
+    for text in texts:
+        for token in tokenize(text):
+            indices.append(vocabulary.setdefault(token, len(vocabulary)))
+        indptr.append(len(indices))
+    counts = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), indices, indptr),
+        shape=(len(texts), len(vocabulary)),
+    )
+    counts.sum_duplicates()
+    counts.data = np.log1p(counts.data)
+
+    documents = np.bincount(counts.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(texts)) / (1 + documents)) + 1
+    tfidf = counts @ sparse.diags(idf.astype(np.float32))
+    return _normalize_rows(tfidf)
+
+
+def _normalize_rows(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags((1 / norms).astype(np.float32)) @ matrix
+
+
+def _row_max_scaled(scores):
+    peaks = scores.max(axis=1, keepdims=True)
+    peaks[peaks <= 0] = 1
+    return scores / peaks
+
+
+class RecommendationModel:
+    """
+    Interaction matrix, co-occurrence and TF-IDF matrices for every job.
+
+    ``latest`` maps each user with signals to the time of their newest one,
+    so a refresh can skip users whose signals predate their stored list.
+    """
+
+    def __init__(self):
+        jobs = list(
+            Job.objects.order_by("pk").values_list(
+                "pk", "title", "description", "is_active"
+            )
+        )
+        self.job_ids = np.array([job[0] for job in jobs], dtype=np.int64)
+        self.active = np.array([job[3] for job in jobs], dtype=bool)
+        # The title counts twice so it outweighs boilerplate in descriptions.
+        self.content = tfidf_matrix(
+            [f"{title} {title} {description}" for _, title, description, _ in jobs]
+        )
+
+        users, job_ids, weights = [], [], []
+        self.latest = {}
+        signals = [
+            (
+                FavoriteJob.objects.values_list("user_id", "job_id", "added_at"),
+                FAVORITE_WEIGHT,
+            ),
+            (
+                Application.objects.values_list("candidate_id", "job_id", "applied_at"),
+                APPLICATION_WEIGHT,
+            ),
+        ]
+        for rows, weight in signals:
+            for user_id, job_id, at in rows.iterator(chunk_size=10000):
+                users.append(user_id)
+                job_ids.append(job_id)
+                weights.append(weight)
+                if user_id not in self.latest or at > self.latest[user_id]:
+                    self.latest[user_id] = at
+
+        job_ids = np.array(job_ids, dtype=np.int64)
+        columns = np.searchsorted(self.job_ids, job_ids)
+        # Signals on jobs created after the job list was read are dropped.
+        known = columns < len(self.job_ids)
+        known[known] = self.job_ids[columns[known]] == job_ids[known]
+        self.user_ids, rows = np.unique(
+            np.array(users, dtype=np.int64), return_inverse=True
+        )
+        self.interactions = sparse.csr_matrix(
+            (
+                np.array(weights, dtype=np.float32)[known],
+                (rows[known], columns[known]),
+            ),
+            shape=(len(self.user_ids), len(self.job_ids)),
+        )
+        self.cooccurrence = self._cooccurrence()
+
+    def _cooccurrence(self):
+        engaged = self.interactions.copy()
+        engaged.data[:] = 1
+        counts = (engaged.T @ engaged).tocsr()
+        users_per_job = counts.diagonal()
+        counts.setdiag(0)
+        counts.eliminate_zeros()
+        scale = np.zeros_like(users_per_job)
+        scale[users_per_job > 0] = 1 / np.sqrt(users_per_job[users_per_job > 0])
+        scale = sparse.diags(scale.astype(np.float32))
+        return (scale @ counts @ scale).tocsr()
+
+    def recommend(self, user_ids, count):
+        """``{user_id: [job_id, ...]}`` with each user's top ``count`` unseen jobs."""
+        rows = np.searchsorted(self.user_ids, np.array(user_ids, dtype=np.int64))
+        recommendations = {}
+        for start in range(0, len(rows), SCORING_BATCH_SIZE):
+            batch = rows[start : start + SCORING_BATCH_SIZE]
+            scores = self._scores(self.interactions[batch])
+            for row, user_scores in zip(batch, scores):
+                recommendations[int(self.user_ids[row])] = self._top(user_scores, count)
+        return recommendations
+
+    def _scores(self, interactions):
+        cooccurrence = (interactions @ self.cooccurrence).toarray()
+        profiles = (interactions @ self.content).toarray()
+        content = (self.content @ profiles.T).T
+        scores = COOCCURRENCE_SHARE * _row_max_scaled(cooccurrence) + (
+            1 - COOCCURRENCE_SHARE
+        ) * _row_max_scaled(content)
+        scores[:, ~self.active] = 0
+        seen_rows, seen_columns = interactions.nonzero()
+        scores[seen_rows, seen_columns] = 0
+        return scores
+
+    def _top(self, scores, count):
+        count = min(count, len(scores))
+        if not count:
+            return []
+        best = np.argpartition(-scores, count - 1)[:count]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [int(job_id) for job_id in self.job_ids[best[scores[best] > 0]]]
+
+
+# -------------------------------
+# Refresh
+# -------------------------------
+
+
+def refresh_recommendations(full=False):
+    """
+    Recompute stored recommendations and return how many users were updated.
+
+    An incremental refresh only rescores users with a favorite or
+    application newer than their stored list; a full one rescores everyone
+    with signals, picking up new jobs and co-occurrences for all of them.
+    """
+    refreshed_at = timezone.now()
+    model = RecommendationModel()
+    if full:
+        user_ids = list(model.latest)
+    else:
+        refreshed = dict(Recommendation.objects.values_list("user_id", "refreshed_at"))
+        user_ids = [
+            user_id
+            for user_id, latest in model.latest.items()
+            if user_id not in refreshed or latest >= refreshed[user_id]
+        ]
+
+    recommendations = model.recommend(user_ids, settings.RECOMMENDATION_COUNT)
+    Recommendation.objects.bulk_create(
+        [
+            Recommendation(user_id=user_id, job_ids=job_ids, refreshed_at=refreshed_at)
+            for user_id, job_ids in recommendations.items()
+        ],
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=["job_ids", "refreshed_at"],
+    )
+    cache.delete(POPULAR_KEY)
+    cache.set_many(
+        {
+            _cache_key(user_id): job_ids or popular_job_ids()
+            for user_id, job_ids in recommendations.items()
+        },
+        timeout=settings.RECOMMENDATION_CACHE_TIMEOUT,
+    )
+    return len(recommendations)
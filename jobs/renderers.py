@@ -0,0 +1,40 @@
+"""
+JSON rendering with orjson.
+
+``FastJSONRenderer`` returns the same bytes as DRF's ``JSONRenderer`` for
+its default compact UTF-8 output, in a fraction of the time. Pretty-printed
+or ASCII-only output, and data orjson refuses (non-string keys, lone
+surrogates), go through ``JSONRenderer`` itself. orjson writes floats in
+its own shortest form, so it is only used by views whose payloads carry
+none.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# Datetimes and dataclasses are left to DRF's encoder, which formats them
+# differently from orjson.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escaped like JSONRenderer, to keep the output a JavaScript subset.
+        return ret.replace(LINE_SEPARATOR, b"\\u2028").replace(
+            PARAGRAPH_SEPARATOR, b"\\u2029"
+        )
@@ -0,0 +1,188 @@
+"""
+Analytics reports, computed as independent date-range chunks and merged.
+
+Every chunk returns plain ``[key..., count]`` rows so partial results can
+travel through the Celery result backend and be summed in any order; job
+titles and category names are looked up once, when the chunks are merged.
+"""
+
+import datetime
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Count
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from .models import Application, Category, FavoriteJob, Job, Report
+
+# Application.status -> funnel column
+FUNNEL_COLUMNS = {
+    "PENDING": "pending",
+    "ACCEPTED": "accepted",
+    "REJECTED": "rejected",
+}
+
+
+def report_chunks(report):
+    """Split the report's date range into ``[start, end)`` ISO datetime pairs."""
+    start = timezone.make_aware(
+        datetime.datetime.combine(report.date_from, datetime.time.min)
+    )
+    stop = timezone.make_aware(
+        datetime.datetime.combine(
+            report.date_to + datetime.timedelta(days=1), datetime.time.min
+        )
+    )
+    step = datetime.timedelta(days=settings.REPORT_CHUNK_DAYS)
+    chunks = []
+    while start < stop:
+        end = min(start + step, stop)
+        chunks.append((start.isoformat(), end.isoformat()))
+        start = end
+    return chunks
+
+
+def find_reusable_report(report_type, date_from, date_to, granularity):
+    """A recent report with the same parameters that is ready or on its way."""
+    cutoff = timezone.now() - datetime.timedelta(seconds=settings.REPORT_REUSE_SECONDS)
+    return (
+        Report.objects.filter(
+            report_type=report_type,
+            date_from=date_from,
+            date_to=date_to,
+            granularity=granularity,
+            status__in=[Report.PENDING, Report.RUNNING, Report.READY],
+            created_at__gte=cutoff,
+        )
+        .order_by("-created_at")
+        .first()
+    )
+
+
+# -------------------------------
+# Chunk aggregations
+# -------------------------------
+
+
+def _jobs_by_category(start, end, granularity):
+    rows = (
+        Job.objects.filter(created_at__gte=start, created_at__lt=end)
+        .annotate(period=Trunc("created_at", granularity))
+        .values("period", "category_id")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    return [
+        [row["period"].date().isoformat(), row["category_id"], row["n"]] for row in rows
+    ]
+
+
+def _application_funnel(start, end, granularity):
+    rows = (
+        Application.objects.filter(applied_at__gte=start, applied_at__lt=end)
+        .values("job_id", "status")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    return [[row["job_id"], row["status"], row["n"]] for row in rows]
+
+
+def _top_favorited(start, end, granularity):
+    rows = (
+        FavoriteJob.objects.filter(added_at__gte=start, added_at__lt=end)
+        .values("job_id")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    return [[row["job_id"], row["n"]] for row in rows]
+
+
+CHUNK_AGGREGATES = {
+    Report.JOBS_BY_CATEGORY: _jobs_by_category,
+    Report.APPLICATION_FUNNEL: _application_funnel,
+    Report.TOP_FAVORITED: _top_favorited,
+}
+
+
+def aggregate_chunk(report_type, granularity, start, end):
+    return CHUNK_AGGREGATES[report_type](start, end, granularity)
+
+
+# -------------------------------
+# Merging
+# -------------------------------
+
+
+def _sum_partials(partials):
+    totals = Counter()
+    for rows in partials:
+        for *key, count in rows:
+            totals[tuple(key)] += count
+    return totals
+
+
+def _job_titles(job_ids):
+    return dict(Job.objects.filter(pk__in=job_ids).values_list("pk", "title"))
+
+
+def _merge_jobs_by_category(totals):
+    names = dict(Category.objects.values_list("pk", "name"))
+    rows = [
+        {
+            "period": period,
+            "category_id": category_id,
+            "category": names.get(category_id),
+            "jobs": count,
+        }
+        for (period, category_id), count in totals.items()
+    ]
+    rows.sort(key=lambda row: (row["period"], row["category"] or ""))
+    return rows
+
+
+def _merge_application_funnel(totals):
+    funnel = {}
+    for (job_id, status), count in totals.items():
+        row = funnel.setdefault(
+            job_id, {"job_id": job_id, **dict.fromkeys(FUNNEL_COLUMNS.values(), 0)}
+        )
+        row[FUNNEL_COLUMNS[status]] += count
+    rows = sorted(
+        funnel.values(),
+        key=lambda row: (
+            -sum(row[column] for column in FUNNEL_COLUMNS.values()),
+            row["job_id"],
+        ),
+    )[: settings.REPORT_ROW_LIMIT]
+    titles = _job_titles([row["job_id"] for row in rows])
+    for row in rows:
+        row["title"] = titles.get(row["job_id"])
+        row["applications"] = sum(row[column] for column in FUNNEL_COLUMNS.values())
+        decided = row["accepted"] + row["rejected"]
+        row["acceptance_rate"] = (
+            round(row["accepted"] / decided, 4) if decided else None
+        )
+    return rows
+
+
+def _merge_top_favorited(totals):
+    top = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    top = top[: settings.REPORT_ROW_LIMIT]
+    titles = _job_titles([job_id for (job_id,), _ in top])
+    return [
+        {"job_id": job_id, "title": titles.get(job_id), "favorites": count}
+        for (job_id,), count in top
+    ]
+
+
+MERGERS = {
+    Report.JOBS_BY_CATEGORY: _merge_jobs_by_category,
+    Report.APPLICATION_FUNNEL: _merge_application_funnel,
+    Report.TOP_FAVORITED: _merge_top_favorited,
+}
+
+
+def merge_partials(report_type, partials):
+    """Sum the chunks' rows and shape them into the stored result."""
+    return {"rows": MERGERS[report_type](_sum_partials(partials))}
@@ -0,0 +1,56 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+)
+from django.db.models import F, Q
+from rest_framework import filters
+
+SEARCH_CONFIG = "english"
+
+# Weighted document used for ranking: title matches beat location matches,
+# which beat matches buried in the description.
+JOB_SEARCH_VECTOR = (
+    SearchVector("title", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("location", weight="B", config=SEARCH_CONFIG)
+    + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+)
+
+# Title similarity a typo-tolerant fallback match must exceed. ``%`` finds
+# candidates through the trigram index at the server's
+# pg_trgm.similarity_threshold (0.3 unless changed); this is applied on top.
+TRIGRAM_THRESHOLD = 0.3
+
+
+def update_search_vector(queryset):
+    """Recompute ``search_vector`` for every job in ``queryset`` in one UPDATE."""
+    return queryset.update(search_vector=JOB_SEARCH_VECTOR)
+
+
+class JobSearchFilter(filters.SearchFilter):
+    """
+    Full-text search over the stored ``Job.search_vector``.
+
+    Matches are ranked with ``SearchRank``; titles that are only a close
+    spelling of the query (``pg_trgm``) are kept as a lower-ranked fallback.
+    An explicit ``?ordering=`` still wins over relevance.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = " ".join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+
+        query = SearchQuery(terms, search_type="websearch", config=SEARCH_CONFIG)
+        return (
+            queryset.annotate(
+                rank=SearchRank(F("search_vector"), query),
+                similarity=TrigramSimilarity("title", terms),
+            )
+            .filter(
+                Q(search_vector=query)
+                | Q(title__trigram_similar=terms, similarity__gt=TRIGRAM_THRESHOLD)
+            )
+            .order_by("-rank", "-similarity", "-created_at")
+        )
@@ -1,5 +1,21 @@
+from django.conf import settings
+from django.db import transaction
 from rest_framework import serializers
-from .models import Job, Application, Category, FavoriteJob, Notification
+from .models import (
+    Job,
+    JobStats,
+    Application,
+    Category,
+    FavoriteJob,
+    Notification,
+    Report,
+    ResumeUpload,
+    SavedSearch,
+)
+from .alerts import index_saved_search
+from .blobs import hash_file, store_blob
+from .stats import get_category_stats, get_job_stats
+from .uploads import RESUME_SIGNATURES, resume_extension
 
 
 class NotificationSerializer(serializers.ModelSerializer):
@@ -20,6 +36,21 @@ class NotificationSerializer(serializers.ModelSerializer):
         }
 
 
+class NotificationMarkReadSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+
+
+class NotificationUnreadCountSerializer(serializers.Serializer):
+    unread_count = serializers.IntegerField(read_only=True)
+
+
+class NotificationMarkReadResultSerializer(serializers.Serializer):
+    marked_read = serializers.IntegerField(read_only=True)
+    unread_count = serializers.IntegerField(read_only=True)
+
+
 class FavoriteJobSerializer(serializers.ModelSerializer):
     user_username = serializers.CharField(source="user.username", read_only=True)
     job_title = serializers.CharField(source="job.title", read_only=True)
@@ -44,8 +75,37 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class CategoryStatsSerializer(serializers.ModelSerializer):
+    active_jobs = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Category
+        fields = ["id", "name", "active_jobs"]
+
+    def get_active_jobs(self, category) -> int:
+        return get_category_stats(category).active_jobs
+
+
+class JobStatsSerializer(serializers.ModelSerializer):
+    applications_total = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = JobStats
+        fields = [
+            "job_id",
+            "applications_total",
+            "applications_pending",
+            "applications_accepted",
+            "applications_rejected",
+            "favorites",
+        ]
+
+
 class JobSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
+    # Only present when the view puts "stats" in the ``expand`` context (and
+    # then selects ``stats`` with the job, so it costs no extra query).
+    stats = serializers.SerializerMethodField()
 
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(), source="category", write_only=True
@@ -67,9 +127,43 @@ class JobSerializer(serializers.ModelSerializer):
             "created_by_username",
             "created_at",
             "updated_at",
+            "stats",
         ]
         read_only_fields = ["created_by_username"]
 
+    # Readable field -> the model paths it reads, so a view can load just the
+    # columns and joins of the fields it renders.
+    field_sources = {
+        "id": ["id"],
+        "title": ["title"],
+        "description": ["description"],
+        "location": ["location"],
+        "employment_type": ["employment_type"],
+        "category": ["category"],
+        "created_by_username": ["created_by__username"],
+        "created_at": ["created_at"],
+        "updated_at": ["updated_at"],
+        "stats": ["stats"],
+    }
+    # Left out unless named in the ``expand`` context.
+    expandable_fields = ["stats"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ``fields`` in the context (None for all) prunes the readable fields.
+        selected = self.context.get("fields")
+        expand = self.context.get("expand", ())
+        for name, field in list(self.fields.items()):
+            if name in self.expandable_fields:
+                keep = name in expand
+            else:
+                keep = field.write_only or selected is None or name in selected
+            if not keep:
+                self.fields.pop(name)
+
+    def get_stats(self, job):
+        return JobStatsSerializer(get_job_stats(job)).data
+
 
 class ApplicationSerializer(serializers.ModelSerializer):
     candidate_username = serializers.StringRelatedField(
@@ -80,6 +174,12 @@ class ApplicationSerializer(serializers.ModelSerializer):
     job_id = serializers.PrimaryKeyRelatedField(
         queryset=Job.objects.all(), source="job", write_only=True
     )
+    resume_upload_id = serializers.PrimaryKeyRelatedField(
+        queryset=ResumeUpload.objects.all(),
+        source="resume_upload",
+        write_only=True,
+        required=False,
+    )
 
     class Meta:
         model = Application
@@ -89,14 +189,238 @@ class ApplicationSerializer(serializers.ModelSerializer):
             "job_title",
             "job_id",
             "resume",
+            "resume_upload_id",
             "cover_letter",
             "status",
             "applied_at",
         ]
         read_only_fields = ["status", "candidate_username", "job_title"]
 
+    def validate_resume_upload_id(self, upload):
+        request = self.context.get("request")
+        if request is None or upload.owner_id != request.user.pk:
+            raise serializers.ValidationError("Unknown resume upload.")
+        if upload.status not in (ResumeUpload.PROCESSING, ResumeUpload.READY):
+            raise serializers.ValidationError(
+                f"Resume upload is {upload.get_status_display().lower()}."
+            )
+        return upload
+
+    def validate(self, attrs):
+        upload = attrs.get("resume_upload")
+        if self.instance is None and not attrs.get("resume") and upload is None:
+            raise serializers.ValidationError(
+                {"resume": "Upload a resume or pass a resume_upload_id."}
+            )
+        if upload is not None and upload.status == ResumeUpload.READY:
+            # Reference the stored blob; no bytes are copied.
+            attrs["resume_blob"] = upload.blob
+            attrs["resume"] = upload.blob.file.name
+        return attrs
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            upload = validated_data.get("resume_upload")
+            if upload is not None and "resume_blob" not in validated_data:
+                # The upload may have finished since validation, before this
+                # row existed for attach_waiting_applications to find. The
+                # lock waits out a worker mid-finish; then read what it left.
+                upload = ResumeUpload.objects.select_for_update().get(pk=upload.pk)
+                if upload.status == ResumeUpload.READY:
+                    validated_data["resume_blob"] = upload.blob
+                    validated_data["resume"] = upload.blob.file.name
+                elif upload.status != ResumeUpload.PROCESSING:
+                    raise serializers.ValidationError(
+                        {
+                            "resume_upload_id": (
+                                f"Resume upload is "
+                                f"{upload.get_status_display().lower()}."
+                            )
+                        }
+                    )
+                validated_data["resume_upload"] = upload
+            resume = validated_data.get("resume")
+            if resume and not isinstance(resume, str):
+                # Direct multipart uploads go through the blob store too.
+                sha256, size = hash_file(resume)
+                blob = store_blob(resume, sha256, size, resume_extension(resume.name))
+                validated_data["resume_blob"] = blob
+                validated_data["resume"] = blob.file.name
+            return super().create(validated_data)
+
+
+class ResumeUploadSerializer(serializers.ModelSerializer):
+    offset = serializers.IntegerField(source="received", read_only=True)
+
+    class Meta:
+        model = ResumeUpload
+        fields = [
+            "id",
+            "filename",
+            "size",
+            "offset",
+            "status",
+            "sha256",
+            "error",
+            "created_at",
+        ]
+        read_only_fields = ["id", "status", "error", "created_at"]
+        extra_kwargs = {
+            "sha256": {
+                "required": False,
+                "help_text": (
+                    "Optional SHA-256 of the whole file. It is verified once the "
+                    "upload completes, and lets the transfer be skipped when you "
+                    "have uploaded the same file before."
+                ),
+            }
+        }
+
+    def validate_sha256(self, sha256):
+        sha256 = sha256.lower()
+        if len(sha256) != 64 or any(c not in "0123456789abcdef" for c in sha256):
+            raise serializers.ValidationError("Must be a hex SHA-256 digest.")
+        return sha256
+
+    def validate_filename(self, filename):
+        if resume_extension(filename) not in RESUME_SIGNATURES:
+            allowed = ", ".join(sorted(RESUME_SIGNATURES))
+            raise serializers.ValidationError(f"Resume must be one of: {allowed}.")
+        return filename
+
+    def validate_size(self, size):
+        if not 0 < size <= settings.RESUME_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"Resume size must be between 1 and "
+                f"{settings.RESUME_UPLOAD_MAX_SIZE} bytes."
+            )
+        return size
+
 
 class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Application
         fields = ["status"]
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv")
+
+
+class ApplicationExportQuerySerializer(ExportQuerySerializer):
+    job = serializers.IntegerField(required=False, min_value=1)
+
+
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=1000,
+    )
+    job_id = serializers.IntegerField(required=False, min_value=1)
+    current_status = serializers.ChoiceField(
+        choices=Application.STATUS_CHOICES, required=False
+    )
+    status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+
+    def validate(self, attrs):
+        if "ids" not in attrs and "job_id" not in attrs:
+            raise serializers.ValidationError(
+                "Provide a list of application ids or a job_id filter."
+            )
+        return attrs
+
+
+class ApplicationBulkStatusResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    result = serializers.ChoiceField(choices=["updated", "unchanged", "not_found"])
+
+
+class ApplicationBulkStatusResponseSerializer(serializers.Serializer):
+    updated = serializers.IntegerField()
+    results = ApplicationBulkStatusResultSerializer(many=True)
+
+
+class ReportSerializer(serializers.ModelSerializer):
+    refresh = serializers.BooleanField(
+        write_only=True,
+        default=False,
+        help_text="Compute a new report even if an identical recent one exists.",
+    )
+    duration_ms = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Report
+        fields = [
+            "id",
+            "report_type",
+            "date_from",
+            "date_to",
+            "granularity",
+            "refresh",
+            "status",
+            "chunks",
+            "duration_ms",
+            "error",
+            "result",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = [
+            "id",
+            "status",
+            "chunks",
+            "error",
+            "result",
+            "created_at",
+            "finished_at",
+        ]
+        extra_kwargs = {"granularity": {"default": "day"}}
+
+    def get_duration_ms(self, report) -> int | None:
+        if report.started_at is None or report.finished_at is None:
+            return None
+        return round((report.finished_at - report.started_at).total_seconds() * 1000)
+
+    def validate(self, attrs):
+        days = (attrs["date_to"] - attrs["date_from"]).days
+        if days < 0:
+            raise serializers.ValidationError("date_to must not be before date_from.")
+        if days >= settings.REPORT_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"Reports cover at most {settings.REPORT_MAX_DAYS} days."
+            )
+        return attrs
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedSearch
+        fields = [
+            "id",
+            "name",
+            "search",
+            "category",
+            "location",
+            "employment_type",
+            "created_at",
+        ]
+        read_only_fields = ["id", "created_at"]
+
+    def validate(self, attrs):
+        criteria = {
+            field: getattr(self.instance, field)
+            for field in ["search", "category", "location", "employment_type"]
+            if self.instance is not None
+        }
+        criteria.update(
+            (field, value) for field, value in attrs.items() if field != "name"
+        )
+        search = SavedSearch(**criteria)
+        index_saved_search(search)
+        if not search.keys:
+            raise serializers.ValidationError(
+                "Give at least one of search, category, location or employment_type."
+            )
+        return attrs
@@ -1,12 +1,157 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
-from .models import Application, Notification
+from .alerts import index_saved_search
+from .blobs import add_references, release_references
+from .cache import CATEGORY_GENERATION, JOB_GENERATION, bump_generation
+from .models import (
+    Application,
+    Category,
+    FavoriteJob,
+    Job,
+    Notification,
+    NotificationEvent,
+    SavedSearch,
+)
+from .notifications import (
+    decrement_unread,
+    increment_unread,
+    publish_notifications,
+    record_event,
+)
+from .search import update_search_vector
+from .stats import count_favorite, move_applications, move_job
+from .tasks import drain_notification_outbox
+
+SEARCH_VECTOR_SOURCE_FIELDS = {"title", "description", "location"}
 
 
 @receiver(post_save, sender=Application)
 def create_application_notification(sender, instance, created, **kwargs):
+    # Only the outbox row is written in the request transaction; the
+    # notification itself is built and inserted by a Celery worker.
+    if created:
+        record_event(NotificationEvent.APPLICATION_CREATED, application_id=instance.pk)
+        transaction.on_commit(drain_notification_outbox.delay, robust=True)
+
+
+@receiver(post_save, sender=Application)
+def reference_resume_blob(sender, instance, created, **kwargs):
+    if created and instance.resume_blob_id:
+        add_references(instance.resume_blob_id)
+
+
+@receiver(post_delete, sender=Application)
+def release_resume_blob(sender, instance, **kwargs):
+    if instance.resume_blob_id:
+        release_references(instance.resume_blob_id)
+
+
+@receiver(post_save, sender=Notification)
+def count_unread_notification(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        increment_unread({instance.user_id: 1})
+
+
+@receiver(post_save, sender=Notification)
+def publish_created_notification(sender, instance, created, **kwargs):
+    # bulk_create skips this signal; create_notifications publishes itself.
     if created:
-        Notification.objects.create(
-            user=instance.job.created_by,
-            message=f"{instance.candidate.username} applied for {instance.job.title}",
-        )
+        transaction.on_commit(lambda: publish_notifications([instance]), robust=True)
+
+
+@receiver(post_delete, sender=Notification)
+def uncount_unread_notification(sender, instance, **kwargs):
+    if not instance.is_read:
+        decrement_unread(instance.user_id, 1)
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not SEARCH_VECTOR_SOURCE_FIELDS & set(update_fields):
+        return
+    update_search_vector(Job.objects.filter(pk=instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Job)
+def invalidate_job_responses(sender, **kwargs):
+    bump_generation(JOB_GENERATION)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_responses(sender, **kwargs):
+    bump_generation(CATEGORY_GENERATION)
+
+
+@receiver(pre_save, sender=SavedSearch)
+def index_search(sender, instance, **kwargs):
+    index_saved_search(instance)
+
+
+# -------------------------------
+# Denormalized stats
+# -------------------------------
+
+
+def _previous_values(sender, instance, fields, raw, update_fields):
+    """The stored ``fields`` of an existing row about to be saved, or ``None``."""
+    if raw or instance.pk is None:
+        return None
+    if update_fields is not None and not set(update_fields) & set(fields):
+        return None
+    return sender.objects.filter(pk=instance.pk).values_list(*fields).first()
+
+
+@receiver(pre_save, sender=Application)
+def remember_application_state(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    instance._stats_previous = _previous_values(
+        sender, instance, ("job_id", "status"), raw, update_fields
+    )
+
+
+@receiver(post_save, sender=Application)
+def count_application(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    current = (instance.job_id, instance.status)
+    previous = None if created else instance._stats_previous or current
+    move_applications([(previous, current)])
+
+
+@receiver(post_delete, sender=Application)
+def uncount_application(sender, instance, **kwargs):
+    move_applications([((instance.job_id, instance.status), None)])
+
+
+@receiver(pre_save, sender=Job)
+def remember_job_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._stats_previous = _previous_values(
+        sender, instance, ("category_id", "is_active"), raw, update_fields
+    )
+
+
+@receiver(post_save, sender=Job)
+def count_active_job(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    current = (instance.category_id, instance.is_active)
+    previous = None if created else instance._stats_previous or current
+    move_job(previous, current)
+
+
+@receiver(post_delete, sender=Job)
+def uncount_active_job(sender, instance, **kwargs):
+    move_job((instance.category_id, instance.is_active), None)
+
+
+@receiver(post_save, sender=FavoriteJob)
+def count_favorite_job(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        count_favorite(instance.job_id, 1)
+
+
+@receiver(post_delete, sender=FavoriteJob)
+def uncount_favorite_job(sender, instance, **kwargs):
+    count_favorite(instance.job_id, -1)
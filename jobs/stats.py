@@ -0,0 +1,124 @@
+from collections import Counter, defaultdict
+
+from django.db.models import F, Func, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Greatest
+
+from .models import Application, Category, CategoryStats, FavoriteJob, Job, JobStats
+
+# Application.status -> JobStats counter
+STATUS_COUNTERS = {
+    "PENDING": "applications_pending",
+    "ACCEPTED": "applications_accepted",
+    "REJECTED": "applications_rejected",
+}
+
+
+def _adjust(model, pk, deltas):
+    """Apply ``{field: delta}`` to one counter row in a single UPDATE."""
+    deltas = {field: n for field, n in deltas.items() if n}
+    if not deltas:
+        return
+    changes = {field: Greatest(F(field) + n, Value(0)) for field, n in deltas.items()}
+    if model.objects.filter(pk=pk).update(**changes):
+        return
+    # Only increments create the row; a decrement for a missing row belongs
+    # to a job or category that is being deleted.
+    if any(n > 0 for n in deltas.values()):
+        model.objects.bulk_create([model(pk=pk)], ignore_conflicts=True)
+        model.objects.filter(pk=pk).update(**changes)
+
+
+def move_applications(moves):
+    """
+    Count applications moving between ``(job_id, status)`` pairs; ``None``
+    stands for created or deleted. Issues one UPDATE per affected job.
+    """
+    deltas = defaultdict(Counter)
+    for old, new in moves:
+        if old == new:
+            continue
+        if old is not None:
+            deltas[old[0]][STATUS_COUNTERS[old[1]]] -= 1
+        if new is not None:
+            deltas[new[0]][STATUS_COUNTERS[new[1]]] += 1
+    for job_id in sorted(deltas):
+        _adjust(JobStats, job_id, deltas[job_id])
+
+
+def move_job(old, new):
+    """Count a job moving between ``(category_id, is_active)`` states."""
+    if old == new:
+        return
+    if old is not None and old[1]:
+        _adjust(CategoryStats, old[0], {"active_jobs": -1})
+    if new is not None and new[1]:
+        _adjust(CategoryStats, new[0], {"active_jobs": 1})
+
+
+def count_favorite(job_id, delta):
+    _adjust(JobStats, job_id, {"favorites": delta})
+
+
+def get_job_stats(job):
+    """The job's counters (all zero when none were recorded yet)."""
+    try:
+        return job.stats
+    except JobStats.DoesNotExist:
+        return JobStats(job=job)
+
+
+def get_category_stats(category):
+    try:
+        return category.stats
+    except CategoryStats.DoesNotExist:
+        return CategoryStats(category=category)
+
+
+# -------------------------------
+# Reconciliation
+# -------------------------------
+
+
+def _count(model, **filters):
+    """Correlated ``SELECT COUNT(*)`` over ``model`` for use in an UPDATE."""
+    rows = model.objects.filter(**filters).order_by()
+    return Subquery(rows.annotate(n=Func(F("pk"), function="COUNT")).values("n"))
+
+
+def _reconcile(model, parent, expected):
+    missing = parent.objects.filter(stats__isnull=True).values_list("pk", flat=True)
+    model.objects.bulk_create(
+        [model(pk=pk) for pk in missing.iterator()],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    drift = Q()
+    for name, value in expected.items():
+        drift |= ~Q(**{name: value})
+    return model.objects.filter(drift).update(**expected)
+
+
+def reconcile_stats():
+    """
+    Recompute every counter from ``Application``, ``FavoriteJob`` and ``Job``
+    and fix the rows that drifted (e.g. after bulk loads that skip signals).
+    Returns the number of rows corrected.
+    """
+    job = OuterRef("job")
+    fixed = _reconcile(
+        JobStats,
+        Job,
+        {
+            **{
+                counter: _count(Application, job=job, status=status)
+                for status, counter in STATUS_COUNTERS.items()
+            },
+            "favorites": _count(FavoriteJob, job=job),
+        },
+    )
+    fixed += _reconcile(
+        CategoryStats,
+        Category,
+        {"active_jobs": _count(Job, category=OuterRef("category"), is_active=True)},
+    )
+    return fixed
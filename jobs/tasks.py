@@ -1,6 +1,20 @@
-from celery import shared_task
+from datetime import timedelta
+
+from celery import chord, group, shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 import time
 
+from .alerts import match_new_jobs
+from .blobs import reclaim_blobs
+from .models import NotificationEvent, Report, ResumeBlob, ResumeUpload
+from .notifications import build_notifications, create_notifications
+from .recommendations import refresh_recommendations
+from .reports import aggregate_chunk, merge_partials, report_chunks
+from .stats import reconcile_stats
+from .uploads import discard_staged, finish_upload
+
 
 @shared_task
 def send_welcome_email(user_email):
@@ -9,6 +23,141 @@ def send_welcome_email(user_email):
 
 
 @shared_task
-def generate_report(report_type):
-    time.sleep(10)  # Simulate a delay
-    return f"{report_type} report generated"
+def generate_report(report_id):
+    """
+    Fan a report out as one ``aggregate_report_chunk`` per date-range chunk
+    and merge them in ``finish_report`` once all have run (a chord), so the
+    work spreads over however many workers are consuming the queue.
+    """
+    report = Report.objects.filter(pk=report_id).first()
+    if report is None:
+        return False
+    chunks = report_chunks(report)
+    claimed = Report.objects.filter(pk=report_id, status=Report.PENDING).update(
+        status=Report.RUNNING, chunks=len(chunks), started_at=timezone.now()
+    )
+    if not claimed:
+        return False
+    header = group(
+        aggregate_report_chunk.s(report.report_type, report.granularity, start, end)
+        for start, end in chunks
+    )
+    report_id = str(report_id)
+    chord(header)(finish_report.s(report_id).on_error(fail_report.s(report_id)))
+    return True
+
+
+@shared_task
+def aggregate_report_chunk(report_type, granularity, start, end):
+    return aggregate_chunk(report_type, granularity, start, end)
+
+
+@shared_task
+def finish_report(partials, report_id):
+    report = Report.objects.get(pk=report_id)
+    Report.objects.filter(pk=report_id).update(
+        status=Report.READY,
+        result=merge_partials(report.report_type, partials),
+        finished_at=timezone.now(),
+    )
+
+
+@shared_task
+def fail_report(request, exc, traceback, report_id):
+    Report.objects.filter(pk=report_id).update(
+        status=Report.FAILED, error=str(exc)[:255], finished_at=timezone.now()
+    )
+
+
+@shared_task
+def drain_notification_outbox(batch_size=None):
+    """
+    Turn pending ``NotificationEvent`` rows into notifications, one batch per
+    transaction. Rows are claimed with ``SKIP LOCKED`` so several workers can
+    drain concurrently without double delivery.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+    processed = 0
+    while True:
+        with transaction.atomic():
+            events = list(
+                NotificationEvent.objects.select_for_update(skip_locked=True)[
+                    :batch_size
+                ]
+            )
+            if not events:
+                break
+            create_notifications(build_notifications(events))
+            NotificationEvent.objects.filter(
+                id__in=[event.id for event in events]
+            ).delete()
+        processed += len(events)
+    return processed
+
+
+@shared_task
+def process_resume_upload(upload_id):
+    """Validate, hash and store a fully received resume upload."""
+    upload = ResumeUpload.objects.filter(
+        pk=upload_id, status=ResumeUpload.PROCESSING
+    ).first()
+    if upload is None:
+        return False
+    return finish_upload(upload)
+
+
+@shared_task
+def purge_stale_resume_uploads():
+    """
+    Fail uploads stuck in processing (a worker died on them), drop uploads
+    abandoned mid-transfer (with their staged bytes) and finished uploads
+    past the expiry, then reclaim blobs nothing refers to any more.
+    """
+    now = timezone.now()
+    stuck = ResumeUpload.objects.filter(
+        status=ResumeUpload.PROCESSING,
+        updated_at__lt=now
+        - timedelta(minutes=settings.RESUME_UPLOAD_PROCESSING_TIMEOUT_MINUTES),
+    )
+    for upload in stuck:
+        discard_staged(upload)
+    stuck.update(
+        status=ResumeUpload.FAILED,
+        error="Processing did not finish; please upload it again.",
+        updated_at=now,
+    )
+
+    cutoff = now - timedelta(hours=settings.RESUME_UPLOAD_EXPIRY_HOURS)
+    stale = list(
+        ResumeUpload.objects.filter(
+            status__in=[
+                ResumeUpload.UPLOADING,
+                ResumeUpload.READY,
+                ResumeUpload.FAILED,
+            ],
+            updated_at__lt=cutoff,
+        )
+    )
+    for upload in stale:
+        discard_staged(upload)
+    ResumeUpload.objects.filter(pk__in=[upload.pk for upload in stale]).delete()
+    reclaim_blobs(ResumeBlob.objects.filter(created_at__lt=cutoff))
+    return len(stale)
+
+
+@shared_task
+def reconcile_job_stats():
+    """Correct ``JobStats``/``CategoryStats`` rows that drifted from the source rows."""
+    return reconcile_stats()
+
+
+@shared_task
+def refresh_job_recommendations(full=False):
+    """Rescore users with new signals, or everyone when ``full``."""
+    return refresh_recommendations(full=full)
+
+
+@shared_task
+def send_job_alerts():
+    """Notify saved-search owners about jobs created since the last run."""
+    return match_new_jobs()
@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from jobs.models import Application, Category, Job, Notification
+from jobs.notifications import get_unread_count
+
+User = get_user_model()
+
+
+class ApplicationBulkStatusTest(APITestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.job = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.admin,
+        )
+        self.candidates = [
+            User.objects.create_user(username=f"candidate{i}", password="pass12345")
+            for i in range(3)
+        ]
+        self.applications = [
+            Application.objects.create(
+                job=self.job, candidate=candidate, resume="resumes/cv.pdf"
+            )
+            for candidate in self.candidates
+        ]
+        self.url = reverse("application-bulk-status")
+
+    def test_bulk_status_requires_platform_admin(self):
+        self.client.force_authenticate(user=self.candidates[0])
+        response = self.client.post(
+            self.url,
+            {"ids": [self.applications[0].id], "status": "ACCEPTED"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_status_by_ids_reports_per_id_results(self):
+        self.applications[1].status = "ACCEPTED"
+        self.applications[1].save()
+        self.client.force_authenticate(user=self.admin)
+
+        ids = [self.applications[0].id, self.applications[1].id, 999999]
+        response = self.client.post(
+            self.url, {"ids": ids, "status": "ACCEPTED"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"id": ids[0], "result": "updated"},
+                {"id": ids[1], "result": "unchanged"},
+                {"id": 999999, "result": "not_found"},
+            ],
+        )
+        self.applications[0].refresh_from_db()
+        self.assertEqual(self.applications[0].status, "ACCEPTED")
+
+        notification = Notification.objects.get(user=self.candidates[0])
+        self.assertEqual(
+            notification.message,
+            "Your application for Backend Developer was accepted.",
+        )
+        self.assertEqual(get_unread_count(self.candidates[0].id), 1)
+        self.assertFalse(Notification.objects.filter(user=self.candidates[1]).exists())
+
+    def test_bulk_status_by_job_filter(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            self.url,
+            {"job_id": self.job.id, "current_status": "PENDING", "status": "REJECTED"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], 3)
+        self.assertEqual(
+            Application.objects.filter(job=self.job, status="REJECTED").count(), 3
+        )
+        self.assertEqual(
+            Notification.objects.filter(notification_type="APP").count(), 3
+        )
+
+    def test_bulk_status_requires_ids_or_filter(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(self.url, {"status": "REJECTED"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
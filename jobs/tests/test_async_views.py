@@ -0,0 +1,161 @@
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import LiveServerTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from jobs.models import Category, Job, Notification
+from users.authentication import ClaimsRefreshToken
+
+User = get_user_model()
+
+
+def bearer(user):
+    token = ClaimsRefreshToken.for_user(user).access_token
+    return {"Authorization": f"Bearer {token}"}
+
+
+class AsyncJobViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.jobs = [
+            Job.objects.create(
+                title=f"Backend Developer {i}",
+                description="Build APIs with Django",
+                location="Remote" if i % 2 else "Cairo",
+                employment_type="FT",
+                category=self.category,
+                created_by=self.admin,
+            )
+            for i in range(25)
+        ]
+        self.hidden = Job.objects.create(
+            title="Closed role",
+            description="No longer hiring",
+            location="Remote",
+            employment_type="PT",
+            category=self.category,
+            created_by=self.admin,
+            is_active=False,
+        )
+
+    async def test_list_matches_sync_endpoint(self):
+        params = {"ordering": "title", "page": "2"}
+        response = await self.async_client.get(reverse("async-job-list"), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+        expected = (await self._sync_get(reverse("job-list"), params)).json()
+        body = response.json()
+        self.assertEqual(body["count"], expected["count"])
+        self.assertEqual(body["results"], expected["results"])
+        self.assertIsNone(body["next"])
+        self.assertTrue(
+            body["previous"].startswith("http://testserver/api/jobs/async/")
+        )
+
+    async def test_field_selection_matches_sync_endpoint(self):
+        params = {"fields": "id,title"}
+        response = await self.async_client.get(reverse("async-job-list"), params)
+        expected = (await self._sync_get(reverse("job-list"), params)).json()
+        self.assertEqual(response.json()["results"], expected["results"])
+        self.assertEqual(set(expected["results"][0]), {"id", "title"})
+
+    async def test_anonymous_list_is_cached_and_hides_inactive_jobs(self):
+        url = reverse("async-job-list")
+        first = await self.async_client.get(url, {"location": "Remote"})
+        second = await self.async_client.get(url, {"location": "Remote"})
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(first.json()["count"], 12)
+
+    async def test_superuser_sees_inactive_job(self):
+        response = await self.async_client.get(
+            reverse("async-job-detail", args=[self.hidden.pk]),
+            headers=bearer(self.admin),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "Closed role")
+        self.assertFalse(response.has_header("X-Cache"))
+
+    async def test_detail_errors_are_rendered_like_drf(self):
+        missing = await self.async_client.get(
+            reverse("async-job-detail", args=[self.hidden.pk])
+        )
+        self.assertEqual(missing.status_code, 404)
+        self.assertEqual(missing.json(), {"detail": "No Job matches the given query."})
+
+        bad_filter = await self.async_client.get(
+            reverse("async-job-list"), {"category": "999"}
+        )
+        self.assertEqual(bad_filter.status_code, 400)
+        self.assertIn("category", bad_filter.json())
+
+        post = await self.async_client.post(reverse("async-job-list"))
+        self.assertEqual(post.status_code, 405)
+
+    async def test_sync_only_list_parameters_are_rejected(self):
+        for params in [{"pagination": "cursor"}, {"facets": "location"}]:
+            with self.subTest(params=params):
+                response = await self.async_client.get(
+                    reverse("async-job-list"), params
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(next(iter(params)), response.json())
+
+    def _sync_get(self, url, params):
+        return sync_to_async(APIClient().get)(url, params)
+
+
+class AsyncNotificationViewsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="candidate", password="pass12345")
+        self.other = User.objects.create_user(username="other", password="pass12345")
+        for i in range(3):
+            Notification.objects.create(user=self.user, message=f"Message {i}")
+        Notification.objects.create(user=self.other, message="Not yours")
+        self.url = reverse("async-notification-list")
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("WWW-Authenticate", response)
+
+        response = await self.async_client.get(
+            self.url, headers={"Authorization": "Bearer not-a-token"}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    async def test_lists_only_own_notifications_newest_first(self):
+        response = await self.async_client.get(self.url, headers=bearer(self.user))
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["count"], 3)
+        self.assertEqual(
+            [n["message"] for n in body["results"]],
+            ["Message 2", "Message 1", "Message 0"],
+        )
+        self.assertEqual({n["user_username"] for n in body["results"]}, {"candidate"})
+
+
+class LoadTestCommandTest(LiveServerTestCase):
+    def test_reports_throughput_and_latency(self):
+        out = StringIO()
+        call_command(
+            "loadtest",
+            f"{self.live_server_url}/api/jobs/async/jobs/",
+            requests=20,
+            concurrency=4,
+            stdout=out,
+        )
+        output = out.getvalue()
+        self.assertIn("20 requests, 0 errors", output)
+        self.assertIn("latency ms: p50", output)
@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from jobs.models import Category
+from users.authentication import ClaimsTokenUser, user_cache
+
+User = get_user_model()
+
+
+class ClaimsJWTAuthenticationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        user_cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", email="candidate@example.com", password="pass12345"
+        )
+        self.category = Category.objects.create(name="Software")
+
+    def login(self, username, password):
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": username, "password": password},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def authorize(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def users_queries(self, ctx):
+        return [q for q in ctx.captured_queries if "users_customuser" in q["sql"]]
+
+    def test_authenticated_requests_skip_the_users_table(self):
+        self.authorize(self.login("candidate", "pass12345")["access"])
+        url = reverse("notification-unread-count")
+        self.client.get(url)  # caches the token version
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.wsgi_request.user, ClaimsTokenUser)
+        self.assertEqual(self.users_queries(ctx), [])
+
+    def test_admin_claims_grant_admin_actions(self):
+        self.authorize(self.login("adminuser", "adminpassword123")["access"])
+        response = self.client.post(
+            reverse("job-list"),
+            {
+                "title": "Frontend Developer",
+                "description": "React + Django",
+                "location": "Remote",
+                "employment_type": "FT",
+                "category_id": self.category.id,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created_by_username"], "adminuser")
+
+    def test_claim_change_revokes_issued_tokens(self):
+        tokens = self.login("candidate", "pass12345")
+        self.authorize(tokens["access"])
+        self.assertEqual(
+            self.client.get(reverse("profile")).status_code, status.HTTP_200_OK
+        )
+
+        self.candidate.role = "employer"
+        self.candidate.save(update_fields=["role"])
+
+        response = self.client.get(reverse("profile"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(
+            reverse("token_refresh"), {"refresh": tokens["refresh"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.authorize(self.login("candidate", "pass12345")["access"])
+        self.assertEqual(
+            self.client.get(reverse("profile")).status_code, status.HTTP_200_OK
+        )
+
+    def test_unrelated_saves_keep_tokens_valid(self):
+        self.authorize(self.login("candidate", "pass12345")["access"])
+        self.candidate.first_name = "Ada"
+        self.candidate.save()
+
+        response = self.client.get(reverse("profile"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["email"], "candidate@example.com")
+
+    def test_deactivated_user_is_rejected(self):
+        self.authorize(self.login("candidate", "pass12345")["access"])
+        self.candidate.is_active = False
+        self.candidate.save()
+
+        response = self.client.get(reverse("notification-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_tokens_without_claims_load_the_user(self):
+        self.authorize(str(RefreshToken.for_user(self.candidate).access_token))
+        response = self.client.get(reverse("profile"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.wsgi_request.user, User)
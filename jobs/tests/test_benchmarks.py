@@ -0,0 +1,432 @@
+import datetime
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from jobs import urls as job_urls
+from jobs.models import (
+    Application,
+    Category,
+    FavoriteJob,
+    Job,
+    Notification,
+    Report,
+    ResumeUpload,
+    SavedSearch,
+)
+from jobs.search import update_search_vector
+from users import urls as user_urls
+from users.authentication import ClaimsRefreshToken
+
+User = get_user_model()
+
+BUDGET_FILE = Path(__file__).with_name("performance_budgets.json")
+ITERATIONS = int(os.getenv("PERF_ITERATIONS", 10))
+
+JOBS = 60
+CANDIDATES = 12
+APPLICATIONS_PER_CANDIDATE = 5
+FAVORITES_PER_CANDIDATE = 5
+NOTIFICATIONS = 25
+
+# Routes of jobs.urls and users.urls left out of the budgets, and why.
+UNBUDGETED_ROUTES = {
+    "api-root": "router index page",
+    "resumeupload-chunk": "needs a fresh upload and a raw body per request; "
+    "covered by test_resume_uploads",
+    "notification-stream": "an open-ended SSE stream; covered by "
+    "test_notification_stream",
+    "schema-json": "schema documents are covered by test_schema",
+    "schema-swagger-ui": "schema documents are covered by test_schema",
+    "schema-redoc": "schema documents are covered by test_schema",
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+@tag("benchmark")
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class EndpointBudgetTest(APITestCase):
+    """
+    Exercise every router endpoint of ``jobs.urls`` and ``users.urls`` against a
+    fixed dataset and compare SQL query counts and p50/p95 latency with the
+    checked-in ``performance_budgets.json``.
+
+    The response cache is cleared before every request, so the numbers are
+    for the uncached database path. Set ``PERF_REPORT=<path>`` to write the
+    measurements to a JSON file.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        cls.candidate = User.objects.create_user(
+            username="candidate", email="candidate@example.com", password="pass12345"
+        )
+        candidates = [cls.candidate] + User.objects.bulk_create(
+            [
+                User(username=f"candidate{i}", email=f"candidate{i}@example.com")
+                for i in range(CANDIDATES - 1)
+            ]
+        )
+        categories = Category.objects.bulk_create(
+            [Category(name=name) for name in ("Software", "Design", "Sales")]
+        )
+        Job.objects.bulk_create(
+            [
+                Job(
+                    title=f"Backend Developer {i}",
+                    description="Build APIs with Django and Postgres",
+                    category=categories[i % len(categories)],
+                    created_by=cls.admin,
+                    location=("Remote", "Berlin", "London")[i % 3],
+                    employment_type=("FT", "PT", "CT")[i % 3],
+                )
+                for i in range(JOBS)
+            ]
+        )
+        update_search_vector(Job.objects.all())
+        jobs = list(Job.objects.order_by("id"))
+        cls.job = jobs[0]
+        cls.category = categories[0]
+
+        Application.objects.bulk_create(
+            [
+                Application(
+                    job=jobs[(c * APPLICATIONS_PER_CANDIDATE + j) % JOBS],
+                    candidate=candidate,
+                    resume="resumes/cv.pdf",
+                )
+                for c, candidate in enumerate(candidates)
+                for j in range(APPLICATIONS_PER_CANDIDATE)
+            ]
+        )
+        FavoriteJob.objects.bulk_create(
+            [
+                FavoriteJob(job=jobs[(c + j) % JOBS], user=candidate)
+                for c, candidate in enumerate(candidates)
+                for j in range(FAVORITES_PER_CANDIDATE)
+            ]
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(user=cls.candidate, message=f"Update {i}")
+                for i in range(NOTIFICATIONS)
+            ]
+        )
+        cls.application = Application.objects.filter(candidate=cls.candidate).first()
+        cls.favorite = FavoriteJob.objects.filter(user=cls.candidate).first()
+        cls.notification = Notification.objects.filter(user=cls.candidate).first()
+        cls.report = Report.objects.create(
+            report_type=Report.JOBS_BY_CATEGORY,
+            date_from=datetime.date(2025, 1, 1),
+            date_to=datetime.date(2025, 1, 31),
+            requested_by=cls.admin,
+            status=Report.READY,
+            result={"rows": []},
+        )
+        cls.saved_search = SavedSearch.objects.create(
+            user=cls.candidate, name="Backend", search="backend developer"
+        )
+        cls.resume_upload = ResumeUpload.objects.create(
+            owner=cls.candidate, filename="cv.pdf", size=1024
+        )
+        cls.budgets = json.loads(BUDGET_FILE.read_text())
+
+    def routes(self):
+        """Every named route of ``jobs.urls`` (router included) and ``users.urls``."""
+        patterns = [
+            *job_urls.router.urls,
+            *job_urls.urlpatterns,
+            *user_urls.urlpatterns,
+        ]
+        return {pattern.name for pattern in patterns if getattr(pattern, "name", None)}
+
+    def endpoints(self):
+        refresh = str(RefreshToken.for_user(self.candidate))
+        bearer = {
+            "HTTP_AUTHORIZATION": "Bearer "
+            + str(ClaimsRefreshToken.for_user(self.candidate).access_token)
+        }
+        counter = iter(range(10**6))
+
+        def register():
+            n = next(counter)
+            return {
+                "username": f"newuser{n}",
+                "email": f"newuser{n}@example.com",
+                "password": "S3cure-pass-123",
+                "password2": "S3cure-pass-123",
+            }
+
+        # name -> (method, url, user, data[, headers])
+        return {
+            "category-list": ("get", reverse("category-list"), None, None),
+            "category-stats": ("get", reverse("category-stats"), None, None),
+            "category-detail": (
+                "get",
+                reverse("category-detail", args=[self.category.id]),
+                None,
+                None,
+            ),
+            "job-list": ("get", reverse("job-list"), None, None),
+            "job-list-filtered": (
+                "get",
+                reverse("job-list") + f"?category={self.category.id}&location=Remote",
+                None,
+                None,
+            ),
+            "job-list-search": (
+                "get",
+                reverse("job-list") + "?search=backend%20developer",
+                None,
+                None,
+            ),
+            "job-list-cursor": (
+                "get",
+                reverse("job-list") + "?pagination=cursor",
+                None,
+                None,
+            ),
+            "job-list-admin": ("get", reverse("job-list"), self.admin, None),
+            "job-detail": (
+                "get",
+                reverse("job-detail", args=[self.job.id]),
+                None,
+                None,
+            ),
+            "job-export": ("get", reverse("job-export"), self.admin, None),
+            "job-stats": (
+                "get",
+                reverse("job-stats", args=[self.job.id]),
+                self.admin,
+                None,
+            ),
+            "job-recommended": (
+                "get",
+                reverse("job-recommended"),
+                self.candidate,
+                None,
+            ),
+            "async-job-list": ("get", reverse("async-job-list"), None, None),
+            "async-job-detail": (
+                "get",
+                reverse("async-job-detail", args=[self.job.id]),
+                None,
+                None,
+            ),
+            "application-list": (
+                "get",
+                reverse("application-list"),
+                self.candidate,
+                None,
+            ),
+            "application-list-admin": (
+                "get",
+                reverse("application-list"),
+                self.admin,
+                None,
+            ),
+            "application-detail": (
+                "get",
+                reverse("application-detail", args=[self.application.id]),
+                self.candidate,
+                None,
+            ),
+            "application-export": (
+                "get",
+                reverse("application-export"),
+                self.admin,
+                None,
+            ),
+            "application-bulk-status": (
+                "post",
+                reverse("application-bulk-status"),
+                self.admin,
+                lambda: {"job_id": self.job.id, "status": "PENDING"},
+            ),
+            "favoritejob-list": (
+                "get",
+                reverse("favoritejob-list"),
+                self.candidate,
+                None,
+            ),
+            "favoritejob-detail": (
+                "get",
+                reverse("favoritejob-detail", args=[self.favorite.id]),
+                self.candidate,
+                None,
+            ),
+            "notification-list": (
+                "get",
+                reverse("notification-list"),
+                self.candidate,
+                None,
+            ),
+            "notification-detail": (
+                "get",
+                reverse("notification-detail", args=[self.notification.id]),
+                self.candidate,
+                None,
+            ),
+            "notification-unread-count": (
+                "get",
+                reverse("notification-unread-count"),
+                self.candidate,
+                None,
+            ),
+            "notification-mark-all-read": (
+                "post",
+                reverse("notification-mark-all-read"),
+                self.candidate,
+                None,
+            ),
+            "notification-mark-read": (
+                "post",
+                reverse("notification-mark-read"),
+                self.candidate,
+                lambda: {"ids": [self.notification.id]},
+            ),
+            "async-notification-list": (
+                "get",
+                reverse("async-notification-list"),
+                None,
+                None,
+                bearer,
+            ),
+            "resumeupload-list": (
+                "post",
+                reverse("resumeupload-list"),
+                self.candidate,
+                lambda: {"filename": "cv.pdf", "size": 1024},
+            ),
+            "resumeupload-detail": (
+                "get",
+                reverse("resumeupload-detail", args=[self.resume_upload.id]),
+                self.candidate,
+                None,
+            ),
+            "report-list": ("get", reverse("report-list"), self.admin, None),
+            "report-detail": (
+                "get",
+                reverse("report-detail", args=[self.report.id]),
+                self.admin,
+                None,
+            ),
+            "savedsearch-list": (
+                "get",
+                reverse("savedsearch-list"),
+                self.candidate,
+                None,
+            ),
+            "savedsearch-detail": (
+                "get",
+                reverse("savedsearch-detail", args=[self.saved_search.id]),
+                self.candidate,
+                None,
+            ),
+            "register": ("post", reverse("register"), None, register),
+            "token_obtain_pair": (
+                "post",
+                reverse("token_obtain_pair"),
+                None,
+                lambda: {"username": "candidate", "password": "pass12345"},
+            ),
+            "token_refresh": (
+                "post",
+                reverse("token_refresh"),
+                None,
+                lambda: {"refresh": refresh},
+            ),
+            "profile": ("get", reverse("profile"), self.candidate, None),
+            "user-list": ("get", reverse("user-list"), self.admin, None),
+        }
+
+    def measure(self, method, url, user, data, headers=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user=user)
+
+        latencies, queries = [], []
+        # One warm-up request, then ITERATIONS measured ones.
+        for iteration in range(ITERATIONS + 1):
+            cache.clear()
+            payload = data() if data else None
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = getattr(client, method)(
+                    url, payload, format="json", **(headers or {})
+                )
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                elapsed = (time.perf_counter() - started) * 1000
+            self.assertLess(response.status_code, 400, f"{url}: {response}")
+            if iteration:
+                latencies.append(elapsed)
+                queries.append(len(ctx.captured_queries))
+
+        return {
+            "queries": max(queries),
+            "p50_ms": round(statistics.median(latencies), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+        }
+
+    def test_every_route_is_benchmarked(self):
+        routes = self.routes()
+        self.assertLessEqual(
+            set(UNBUDGETED_ROUTES), routes, "Unbudgeted routes that no longer exist."
+        )
+        benchmarked = {
+            resolve(urlsplit(url).path).url_name
+            for _, url, *_ in self.endpoints().values()
+        }
+        self.assertEqual(
+            routes - set(UNBUDGETED_ROUTES) - benchmarked,
+            set(),
+            "New routes need an endpoint and a budget here, or an entry in "
+            "UNBUDGETED_ROUTES.",
+        )
+
+    def test_endpoints_stay_within_budget(self):
+        endpoints = self.endpoints()
+        self.assertEqual(
+            set(endpoints),
+            set(self.budgets),
+            "Every benchmarked endpoint needs a budget (and vice versa).",
+        )
+
+        results, failures = {}, []
+        for name, spec in endpoints.items():
+            result = results[name] = self.measure(*spec)
+            budget = self.budgets[name]
+            if result["queries"] > budget["max_queries"]:
+                failures.append(
+                    f"{name}: {result['queries']} queries > budget {budget['max_queries']}"
+                )
+            for key in ("p50_ms", "p95_ms"):
+                if result[key] > budget[key]:
+                    failures.append(
+                        f"{name}: {key} {result[key]} > budget {budget[key]}"
+                    )
+
+        if os.getenv("PERF_REPORT"):
+            Path(os.getenv("PERF_REPORT")).write_text(json.dumps(results, indent=2))
+        self.assertFalse(failures, "\n".join(failures))
@@ -0,0 +1,117 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from jobs.models import Application, Category, Job
+from jobs.views import ApplicationViewSet
+from users.authentication import ClaimsRefreshToken
+
+User = get_user_model()
+
+
+class ExportTest(APITestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.employer = User.objects.create_user(
+            username="employer", password="pass12345"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", email="candidate@example.com", password="pass12345"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.job = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.employer,
+        )
+        self.other_job = Job.objects.create(
+            title="Data Engineer",
+            description="Pipelines",
+            location="Berlin",
+            employment_type="CT",
+            category=self.category,
+            created_by=self.admin,
+        )
+        self.application = Application.objects.create(
+            job=self.job, candidate=self.candidate, resume="resumes/cv.pdf"
+        )
+        Application.objects.create(
+            job=self.other_job, candidate=self.candidate, resume="resumes/cv.pdf"
+        )
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_job_export_streams_csv_with_filters(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse("job-export"), {"location": "Remote"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["title"], "Backend Developer")
+        self.assertEqual(rows[0]["category__name"], "Software")
+
+    def test_job_export_requires_platform_admin(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.client.get(reverse("job-export"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_application_export_streams_ndjson_for_job_owner(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.client.get(
+            reverse("application-export"),
+            {"job": self.job.id, "export_format": "ndjson"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id"], self.application.id)
+        self.assertEqual(rows[0]["candidate__username"], "candidate")
+        # Keys follow the export fields, in the same order as the CSV columns.
+        self.assertEqual(list(rows[0]), ApplicationViewSet.export_fields)
+
+    def test_application_export_denied_for_other_jobs(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.client.get(
+            reverse("application-export"), {"job": self.other_job.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(reverse("application-export"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_admin_exports_all_applications(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse("application-export"))
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 2)
+
+    async def test_export_streams_asynchronously_over_asgi(self):
+        token = ClaimsRefreshToken.for_user(self.admin).access_token
+        response = await self.async_client.get(
+            reverse("job-export"), headers={"Authorization": f"Bearer {token}"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # A sync iterator would be drained into a list by the ASGI handler.
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+
+        rows = list(csv.DictReader(io.StringIO(content.decode())))
+        self.assertEqual(
+            [row["title"] for row in rows], ["Backend Developer", "Data Engineer"]
+        )
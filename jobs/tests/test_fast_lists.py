@@ -0,0 +1,106 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from jobs.models import Category, Job, Notification
+from jobs.projections import compile_projection
+from jobs.renderers import FastJSONRenderer
+from jobs.serializers import JobSerializer
+
+User = get_user_model()
+
+
+class FastListTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.user = User.objects.create_user(username="candidate", password="pass12345")
+        software = Category.objects.create(name="Software", description="Büro\u2028")
+        design = Category.objects.create(name="Design")
+        for i in range(25):
+            Job.objects.create(
+                title=f'Développeur {i} "senior"',
+                description="Line one\nline two\u2029\t😀",
+                category=software if i % 2 else design,
+                location="Cairo" if i % 3 else "",
+                employment_type=["FT", "PT", "CT"][i % 3],
+                is_active=i != 7,
+                # Jobs without an author leave out created_by_username.
+                created_by=self.admin if i % 4 else None,
+            )
+        for i in range(5):
+            Notification.objects.create(user=self.user, message=f"Update {i}")
+
+    def assertSameBytes(self, url, params=None, user=None):
+        bodies = []
+        for fast in (False, True):
+            cache.clear()
+            self.client.force_authenticate(user)
+            with override_settings(FAST_LIST_SERIALIZATION=fast):
+                response = self.client.get(url, params or {})
+            self.assertEqual(response.status_code, 200)
+            bodies.append(response.content)
+        self.assertEqual(bodies[0], bodies[1])
+        return bodies[1]
+
+    def test_job_pages_match_the_serializer_byte_for_byte(self):
+        url = reverse("job-list")
+        for params in [
+            {},
+            {"page": 2},
+            {"pagination": "cursor"},
+            {"pagination": "cursor", "ordering": "title"},
+            {"search": "développeur"},
+            {"fields": "id,created_by_username,category"},
+            {"employment_type": "PT", "facets": "location"},
+        ]:
+            with self.subTest(params=params):
+                self.assertSameBytes(url, params)
+        self.assertSameBytes(url, {"ordering": "-title"}, user=self.admin)
+
+    def test_notification_pages_match_the_serializer(self):
+        self.assertSameBytes(reverse("notification-list"), user=self.user)
+
+    def test_fast_path_skips_the_serializer(self):
+        with override_settings(FAST_LIST_SERIALIZATION=True), mock.patch.object(
+            JobSerializer, "to_representation", side_effect=AssertionError
+        ):
+            with self.assertNumQueries(2):
+                response = self.client.get(reverse("job-list"))
+        self.assertEqual(response.data["count"], 24)
+
+    def test_serializers_with_method_fields_keep_the_serializer(self):
+        self.assertIsNotNone(compile_projection(JobSerializer()))
+        self.assertIsNone(
+            compile_projection(JobSerializer(context={"expand": ["stats"]}))
+        )
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    def test_output_matches_json_renderer(self):
+        data = {
+            "text": "".join(chr(i) for i in range(128)) + "é\u2028\u2029😀",
+            "numbers": [0, -1, 2**40],
+            "flags": [True, False, None],
+            "when": datetime.datetime(2025, 1, 2, 3, 4, 5, 678901),
+            "nested": {"list": [], "dict": {}},
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_falls_back_to_json_renderer(self):
+        for data in [{1: "non-string key"}, {"big": 2**70}]:
+            self.assertEqual(
+                FastJSONRenderer().render(data), JSONRenderer().render(data)
+            )
+        self.assertEqual(
+            FastJSONRenderer().render({"a": 1}, "application/json; indent=2"),
+            JSONRenderer().render({"a": 1}, "application/json; indent=2"),
+        )
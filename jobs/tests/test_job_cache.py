@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from jobs.cache import job_response_cache
+from jobs.models import Category, Job
+
+User = get_user_model()
+
+
+class JobResponseCacheTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        job_response_cache.reset_stats()
+        self.client = APIClient()
+
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.job = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.admin,
+        )
+
+        self.job_url = reverse("job-detail", args=[self.job.id])
+        self.jobs_url = reverse("job-list")
+
+    def test_anonymous_list_is_served_from_cache(self):
+        first = self.client.get(self.jobs_url, {"location": "Remote", "page": "1"})
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.jobs_url, {"location": "Remote"})
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(job_response_cache.stats(), {"hits": 1, "misses": 1})
+
+    def test_job_save_invalidates_cached_detail(self):
+        self.client.get(self.job_url)
+        self.job.title = "Senior Backend Developer"
+        self.job.save()
+
+        response = self.client.get(self.job_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["title"], "Senior Backend Developer")
+
+    def test_category_save_invalidates_cached_list(self):
+        self.client.get(self.jobs_url)
+        self.category.name = "Engineering"
+        self.category.save()
+
+        response = self.client.get(self.jobs_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["category"]["name"], "Engineering")
+
+    def test_job_delete_invalidates_cached_list(self):
+        self.client.get(self.jobs_url)
+        self.job.delete()
+
+        response = self.client.get(self.jobs_url)
+        self.assertEqual(response.data["results"], [])
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.jobs_url)
+        response = self.client.get(self.jobs_url)
+        self.assertNotIn("X-Cache", response)
+        self.assertEqual(job_response_cache.stats(), {"hits": 0, "misses": 0})
@@ -0,0 +1,124 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.models import Category, Job
+
+User = get_user_model()
+
+
+class JobFacetTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.user = User.objects.create_user(username="candidate", password="pass12345")
+        self.software = Category.objects.create(name="Software")
+        self.design = Category.objects.create(name="Design")
+        for title, category, location, employment_type, is_active in [
+            ("Django Developer", self.software, "Remote", "FT", True),
+            ("Python Developer", self.software, "Cairo", "FT", True),
+            ("Frontend Developer", self.software, "Remote", "CT", True),
+            ("Product Designer", self.design, "Remote", "FT", True),
+            ("Closed Designer", self.design, "Cairo", "PT", False),
+        ]:
+            Job.objects.create(
+                title=title,
+                description="A job",
+                category=category,
+                location=location,
+                employment_type=employment_type,
+                is_active=is_active,
+                created_by=self.admin,
+            )
+        self.url = reverse("job-list")
+        self.client.force_authenticate(self.user)
+
+    def counts(self, facets):
+        return {
+            name: {entry["value"]: entry["count"] for entry in entries}
+            for name, entries in facets.items()
+        }
+
+    def test_facets_follow_the_filters_in_one_query(self):
+        params = {"location": "Remote"}
+        with CaptureQueriesContext(connection) as plain:
+            self.client.get(self.url, params)
+        with CaptureQueriesContext(connection) as faceted:
+            response = self.client.get(
+                self.url, {**params, "facets": "category,employment_type,location"}
+            )
+        self.assertEqual(len(faceted), len(plain) + 1)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            self.counts(response.data["facets"]),
+            {
+                "category": {self.software.pk: 2, self.design.pk: 1},
+                "employment_type": {"FT": 2, "CT": 1},
+                "location": {"Remote": 3},
+            },
+        )
+        self.assertEqual(
+            response.data["facets"]["category"][0],
+            {"value": self.software.pk, "label": "Software", "count": 2},
+        )
+        self.assertEqual(
+            response.data["facets"]["employment_type"][0]["label"], "Full-time"
+        )
+
+    def test_facets_with_search(self):
+        response = self.client.get(
+            self.url, {"search": "developer", "facets": "location"}
+        )
+        self.assertEqual(
+            self.counts(response.data["facets"]),
+            {"location": {"Remote": 2, "Cairo": 1}},
+        )
+
+    def test_unfiltered_facets_are_cached_until_jobs_change(self):
+        params = {"facets": "category"}
+        self.client.get(self.url, params)
+        with CaptureQueriesContext(connection) as cached:
+            response = self.client.get(self.url, params)
+        self.assertFalse(any("GROUPING SETS" in q["sql"] for q in cached))
+        self.assertEqual(
+            self.counts(response.data["facets"]),
+            {"category": {self.software.pk: 3, self.design.pk: 1}},
+        )
+
+        Job.objects.create(
+            title="Designer",
+            description="A job",
+            category=self.design,
+            location="Remote",
+        )
+        response = self.client.get(self.url, params)
+        self.assertEqual(
+            self.counts(response.data["facets"])["category"][self.design.pk], 2
+        )
+
+        # Admins also see inactive jobs, and so do their counts.
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(self.url, params)
+        self.assertEqual(
+            self.counts(response.data["facets"])["category"][self.design.pk], 3
+        )
+
+    def test_cursor_pagination_carries_facets(self):
+        response = self.client.get(
+            self.url, {"pagination": "cursor", "facets": "employment_type"}
+        )
+        self.assertEqual(
+            self.counts(response.data["facets"]),
+            {"employment_type": {"FT": 3, "CT": 1}},
+        )
+
+    def test_unknown_facets_are_rejected(self):
+        response = self.client.get(self.url, {"facets": "category,salary"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("salary", response.data["facets"])
@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.models import Category, Job
+
+User = get_user_model()
+
+
+class JobFieldSelectionTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.job = Job.objects.create(
+            title="Django Developer",
+            description="Build APIs " * 200,
+            category=self.category,
+            location="Remote",
+            created_by=self.admin,
+        )
+        self.url = reverse("job-list")
+
+    def job_query(self, params, url=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url or self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        sql = [q["sql"] for q in queries if 'FROM "jobs_job"' in q["sql"]][-1]
+        return response, sql
+
+    def test_fields_prune_the_payload_and_the_query(self):
+        response, sql = self.job_query({"fields": "id,title"})
+        self.assertEqual(
+            response.data["results"], [{"id": self.job.pk, "title": self.job.title}]
+        )
+        self.assertNotIn('"jobs_job"."description"', sql)
+        self.assertNotIn("JOIN", sql)
+
+    def test_joins_follow_the_selected_relations(self):
+        response, sql = self.job_query({"fields": "title,category"})
+        self.assertEqual(response.data["results"][0]["category"]["name"], "Software")
+        self.assertIn('JOIN "jobs_category"', sql)
+        self.assertNotIn("users_customuser", sql)
+
+        response, sql = self.job_query({"fields": "created_by_username"})
+        self.assertEqual(
+            response.data["results"][0], {"created_by_username": "adminuser"}
+        )
+        self.assertNotIn('"users_customuser"."password"', sql)
+        self.assertNotIn("jobs_category", sql)
+
+    def test_default_payload_is_unchanged(self):
+        response, sql = self.job_query({})
+        self.assertEqual(
+            set(response.data["results"][0]),
+            {
+                "id",
+                "title",
+                "description",
+                "location",
+                "employment_type",
+                "category",
+                "created_by_username",
+                "created_at",
+                "updated_at",
+            },
+        )
+        self.assertNotIn("search_vector", sql)
+
+    def test_fields_apply_to_detail_and_cursor_pages(self):
+        url = reverse("job-detail", args=[self.job.pk])
+        response, _ = self.job_query({"fields": "title"}, url)
+        self.assertEqual(response.data, {"title": self.job.title})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url, {"pagination": "cursor", "fields": "id"}
+            )
+        self.assertEqual(response.data["results"], [{"id": self.job.pk}])
+
+    def test_expand_stats_for_admins(self):
+        self.client.force_authenticate(self.admin)
+        response, sql = self.job_query({"fields": "id", "expand": "stats"})
+        self.assertEqual(set(response.data["results"][0]), {"id", "stats"})
+        self.assertIn("jobs_jobstats", sql)
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(self.url, {"fields": "title,salary"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("salary", response.data["fields"])
+
+        response = self.client.get(self.url, {"expand": "category"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
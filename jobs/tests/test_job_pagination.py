@@ -0,0 +1,58 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from jobs.models import Category, Job
+
+User = get_user_model()
+
+
+class JobCursorPaginationTest(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.category = Category.objects.create(name="Software")
+        for i in range(25):
+            Job.objects.create(
+                title=f"Developer {i}",
+                description="Build APIs with Django",
+                location="Remote",
+                employment_type="FT",
+                category=self.category,
+                created_by=self.admin,
+            )
+
+        self.jobs_url = reverse("job-list")
+
+    def test_page_number_pagination_is_the_default(self):
+        response = self.client.get(self.jobs_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 25)
+
+    def test_cursor_pagination_walks_the_feed_without_count(self):
+        response = self.client.get(self.jobs_url, {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertNotIn("approximate_count", response.data)
+        first_page = [job["id"] for job in response.data["results"]]
+        self.assertEqual(len(first_page), 20)
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        second_page = [job["id"] for job in response.data["results"]]
+        self.assertEqual(len(second_page), 5)
+        self.assertIsNone(response.data["next"])
+
+        expected = list(Job.objects.values_list("id", flat=True))
+        self.assertEqual(first_page + second_page, expected)
+
+    def test_cursor_pagination_approximate_count(self):
+        response = self.client.get(
+            self.jobs_url, {"pagination": "cursor", "approx_count": "true"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data["approximate_count"], int)
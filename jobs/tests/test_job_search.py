@@ -0,0 +1,87 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from jobs.models import Category, Job
+
+User = get_user_model()
+
+
+class JobSearchTest(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.category = Category.objects.create(name="Software")
+
+        self.backend = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.admin,
+        )
+        self.designer = Job.objects.create(
+            title="UI Designer",
+            description="Work with backend developers on the design system",
+            location="Berlin",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.admin,
+        )
+        Job.objects.create(
+            title="Sales Manager",
+            description="Lead sales team",
+            location="London",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.admin,
+        )
+
+        self.jobs_url = reverse("job-list")
+
+    def test_search_vector_is_maintained_on_save(self):
+        self.backend.refresh_from_db()
+        self.assertIsNotNone(self.backend.search_vector)
+
+        self.backend.title = "Platform Engineer"
+        self.backend.save()
+
+        response = self.client.get(self.jobs_url, {"search": "platform"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [job["title"] for job in response.data["results"]]
+        self.assertEqual(titles, ["Platform Engineer"])
+
+    def test_search_ranks_title_matches_first(self):
+        response = self.client.get(self.jobs_url, {"search": "backend developer"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [job["title"] for job in response.data["results"]]
+        self.assertEqual(titles, ["Backend Developer", "UI Designer"])
+
+    def test_search_falls_back_to_trigram_title_match(self):
+        response = self.client.get(self.jobs_url, {"search": "Bakend Develper"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [job["title"] for job in response.data["results"]]
+        self.assertEqual(titles, ["Backend Developer"])
+
+    def test_trigram_fallback_applies_the_threshold(self):
+        cache.clear()
+        with mock.patch("jobs.search.TRIGRAM_THRESHOLD", 0.9):
+            response = self.client.get(self.jobs_url, {"search": "Bakend Develper"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+
+    def test_search_respects_explicit_ordering(self):
+        response = self.client.get(
+            self.jobs_url, {"search": "backend", "ordering": "title"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [job["title"] for job in response.data["results"]]
+        self.assertEqual(titles, ["Backend Developer", "UI Designer"])
@@ -0,0 +1,176 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.applications import bulk_update_status
+from jobs.models import Application, Category, CategoryStats, FavoriteJob, Job, JobStats
+from jobs.stats import reconcile_stats
+
+User = get_user_model()
+
+
+class JobStatsTest(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidates = [
+            User.objects.create_user(username=f"candidate{i}", password="pass12345")
+            for i in range(3)
+        ]
+        self.software = Category.objects.create(name="Software")
+        self.design = Category.objects.create(name="Design")
+        self.job = self.create_job("Backend Developer")
+
+    def create_job(self, title, category=None, **kwargs):
+        return Job.objects.create(
+            title=title,
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=category or self.software,
+            created_by=self.admin,
+            **kwargs,
+        )
+
+    def job_stats(self, job=None):
+        stats = JobStats.objects.get(pk=(job or self.job).pk)
+        return (
+            stats.applications_pending,
+            stats.applications_accepted,
+            stats.applications_rejected,
+            stats.favorites,
+        )
+
+    def active_jobs(self, category):
+        return CategoryStats.objects.get(pk=category.pk).active_jobs
+
+    def test_application_counts_follow_status_changes(self):
+        applications = [
+            Application.objects.create(job=self.job, candidate=candidate)
+            for candidate in self.candidates
+        ]
+        self.assertEqual(self.job_stats(), (3, 0, 0, 0))
+
+        applications[0].status = "ACCEPTED"
+        applications[0].save()
+        bulk_update_status("REJECTED", ids=[applications[1].pk, applications[2].pk])
+        self.assertEqual(self.job_stats(), (0, 1, 2, 0))
+
+        applications[0].delete()
+        self.assertEqual(self.job_stats(), (0, 0, 2, 0))
+
+    def test_favorites_are_counted(self):
+        favorites = [
+            FavoriteJob.objects.create(user=candidate, job=self.job)
+            for candidate in self.candidates[:2]
+        ]
+        favorites[0].delete()
+        self.assertEqual(self.job_stats(), (0, 0, 0, 1))
+
+    def test_active_jobs_per_category(self):
+        closed = self.create_job("Closed role", is_active=False)
+        self.assertEqual(self.active_jobs(self.software), 1)
+
+        closed.is_active = True
+        closed.save()
+        self.job.category = self.design
+        self.job.save()
+        self.assertEqual(self.active_jobs(self.software), 1)
+        self.assertEqual(self.active_jobs(self.design), 1)
+
+        closed.delete()
+        self.assertEqual(self.active_jobs(self.software), 0)
+
+    def test_reconcile_repairs_counters_after_bulk_loads(self):
+        Application.objects.bulk_create(
+            [
+                Application(job=self.job, candidate=candidate, status="ACCEPTED")
+                for candidate in self.candidates
+            ]
+        )
+        other = Job.objects.bulk_create(
+            [
+                Job(
+                    title="Bulk loaded",
+                    description="No signals",
+                    location="Remote",
+                    employment_type="FT",
+                    category=self.design,
+                )
+            ]
+        )[0]
+        JobStats.objects.filter(pk=self.job.pk).update(favorites=5)
+
+        self.assertEqual(reconcile_stats(), 2)
+        self.assertEqual(self.job_stats(), (0, 3, 0, 0))
+        self.assertEqual(self.job_stats(other), (0, 0, 0, 0))
+        self.assertEqual(self.active_jobs(self.design), 1)
+        self.assertEqual(reconcile_stats(), 0)
+
+
+class JobStatsApiTest(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", password="pass12345"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.jobs = [
+            Job.objects.create(
+                title=f"Backend Developer {i}",
+                description="Build APIs with Django",
+                location="Remote",
+                employment_type="FT",
+                category=self.category,
+                created_by=self.admin,
+            )
+            for i in range(5)
+        ]
+        Application.objects.create(job=self.jobs[0], candidate=self.candidate)
+        FavoriteJob.objects.create(job=self.jobs[0], user=self.candidate)
+
+    def test_job_stats_endpoint_is_admin_only(self):
+        url = reverse("job-stats", args=[self.jobs[0].pk])
+        self.client.force_authenticate(self.candidate)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.admin)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["applications_total"], 1)
+        self.assertEqual(response.data["applications_pending"], 1)
+        self.assertEqual(response.data["favorites"], 1)
+
+    def test_include_stats_costs_no_extra_queries(self):
+        self.client.force_authenticate(self.admin)
+        url = reverse("job-list")
+        with CaptureQueriesContext(connection) as plain:
+            response = self.client.get(url)
+        self.assertNotIn("stats", response.data["results"][0])
+
+        with CaptureQueriesContext(connection) as with_stats:
+            response = self.client.get(url, {"include": "stats"})
+        self.assertEqual(len(with_stats), len(plain))
+        stats = {job["id"]: job["stats"] for job in response.data["results"]}
+        self.assertEqual(stats[self.jobs[0].pk]["applications_total"], 1)
+        self.assertEqual(stats[self.jobs[1].pk]["applications_total"], 0)
+
+    def test_include_stats_is_ignored_for_other_users(self):
+        response = self.client.get(reverse("job-list"), {"include": "stats"})
+        self.assertNotIn("stats", response.data["results"][0])
+
+    def test_category_stats(self):
+        Category.objects.create(name="Design")
+        response = self.client.get(reverse("category-stats"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(row["name"], row["active_jobs"]) for row in response.data["results"]],
+            [("Design", 0), ("Software", 5)],
+        )
@@ -0,0 +1,111 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY, values
+from rest_framework.test import APITestCase
+
+from jobboard import metrics
+from jobs.tasks import reconcile_job_stats
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MetricsEndpointTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_requests_and_cache_lookups_are_counted(self):
+        labels = {"method": "GET", "route": "job-list", "status": "200"}
+        requests = sample("http_requests_total", **labels)
+        latency = sample(
+            "http_request_duration_seconds_count", method="GET", route="job-list"
+        )
+        hits = sample("cache_lookups_total", cache="jobs:response", result="hit")
+
+        self.client.get(reverse("job-list"))
+        self.client.get(reverse("job-list"))
+
+        self.assertEqual(sample("http_requests_total", **labels), requests + 2)
+        self.assertEqual(
+            sample(
+                "http_request_duration_seconds_count", method="GET", route="job-list"
+            ),
+            latency + 2,
+        )
+        self.assertEqual(
+            sample("cache_lookups_total", cache="jobs:response", result="hit"),
+            hits + 1,
+        )
+
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_exposition_includes_scrape_time_collectors(self):
+        self.client.get(reverse("job-list"))
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn('http_requests_total{method="GET",route="job-list"', body)
+        self.assertIn("db_connections{", body)
+        self.assertIn("db_max_connections ", body)
+
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_token_is_required_when_configured(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_served_without_a_token_only_in_debug(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get(reverse("metrics")).status_code, 200)
+
+    def test_celery_task_durations_are_recorded(self):
+        name = reconcile_job_stats.name
+        runs = sample("celery_task_duration_seconds_count", task=name)
+        successes = sample("celery_tasks_total", task=name, state="SUCCESS")
+
+        reconcile_job_stats.apply()
+
+        self.assertEqual(
+            sample("celery_task_duration_seconds_count", task=name), runs + 1
+        )
+        self.assertEqual(
+            sample("celery_tasks_total", task=name, state="SUCCESS"), successes + 1
+        )
+
+    @override_settings(CELERY_METRICS_PORT=9808)
+    def test_worker_metrics_include_pool_processes(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        with mock.patch.dict(os.environ), mock.patch.object(
+            metrics, "CELERY_MULTIPROC_DIR", path
+        ), mock.patch.object(values, "ValueClass", values.ValueClass):
+            os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+            metrics._prepare_worker_metrics()
+
+            # A prefork pool process runs the task and exits.
+            pid = os.fork()
+            if pid == 0:
+                metrics.CELERY_TASKS.labels("pooled_task", "SUCCESS").inc()
+                os._exit(0)
+            os.waitpid(pid, 0)
+
+            registry = metrics.build_registry()
+            self.assertEqual(
+                registry.get_sample_value(
+                    "celery_tasks_total", {"task": "pooled_task", "state": "SUCCESS"}
+                ),
+                1,
+            )
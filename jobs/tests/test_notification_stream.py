@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from jobs.broker import InProcessBroker, RedisBroker, create_broker
+from jobs.models import Notification
+from jobs.notifications import create_notifications
+from users.authentication import ClaimsRefreshToken
+
+User = get_user_model()
+
+
+def parse_message(chunk):
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+    return int(fields["id"]), json.loads(fields["data"])
+
+
+class NotificationStreamTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="candidate", password="pass12345")
+        self.other = User.objects.create_user(username="other", password="pass12345")
+        self.token = str(ClaimsRefreshToken.for_user(self.user).access_token)
+        self.url = reverse("notification-stream")
+
+    async def open_stream(self, **extra):
+        response = await self.async_client.get(self.url, {"token": self.token}, **extra)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        chunks = aiter(response.streaming_content)
+        self.assertEqual(await anext(chunks), b"retry: 3000\n\n")
+        return chunks
+
+    def create_and_commit(self, notifications):
+        with self.captureOnCommitCallbacks(execute=True):
+            create_notifications(notifications)
+
+    async def test_requires_a_valid_token(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(self.url, {"token": "not-a-token"})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_replays_after_last_event_id_then_streams_live(self):
+        seen, missed = [
+            await Notification.objects.acreate(user=self.user, message=message)
+            for message in ("Seen", "Missed")
+        ]
+        await Notification.objects.acreate(user=self.other, message="Not yours")
+
+        chunks = await self.open_stream(headers={"Last-Event-ID": str(seen.pk)})
+        event_id, data = parse_message(await anext(chunks))
+        self.assertEqual(event_id, missed.pk)
+        self.assertEqual(data["message"], "Missed")
+        self.assertEqual(data["user_username"], "candidate")
+
+        await sync_to_async(self.create_and_commit)(
+            [
+                Notification(user=self.other, message="Still not yours"),
+                Notification(user=self.user, message="Live"),
+            ]
+        )
+        event_id, data = parse_message(await anext(chunks))
+        self.assertEqual(data["message"], "Live")
+        self.assertGreater(event_id, missed.pk)
+        await chunks.aclose()
+
+    @override_settings(
+        NOTIFICATION_STREAM_HEARTBEAT=0.01, NOTIFICATION_STREAM_MAX_AGE=0.1
+    )
+    async def test_idle_stream_sends_heartbeats_and_ends(self):
+        chunks = await self.open_stream()
+        rest = [chunk async for chunk in chunks]
+        self.assertTrue(rest)
+        self.assertEqual(set(rest), {b": keep-alive\n\n"})
+
+    async def test_rejects_malformed_last_event_id(self):
+        response = await self.async_client.get(
+            self.url, {"token": self.token, "last_event_id": "abc"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class InProcessBrokerTest(TestCase):
+    async def test_publish_from_another_thread_reaches_only_that_user(self):
+        broker = InProcessBroker()
+        mine = await broker.subscribe(1)
+        theirs = await broker.subscribe(2)
+
+        thread = threading.Thread(target=broker.publish, args=(1, {"id": 7}))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(await asyncio.wait_for(mine.get(), 1), {"id": 7})
+        self.assertTrue(theirs.queue.empty())
+        await mine.close()
+        await theirs.close()
+        self.assertEqual(broker._subscriptions, {})
+
+    def test_broker_follows_the_url(self):
+        self.assertIsInstance(create_broker("redis://localhost:6379/0"), RedisBroker)
+        with self.assertRaises(ImproperlyConfigured):
+            create_broker("amqp://localhost")
+
+        with self.assertNoLogs("jobs.broker"):
+            self.assertIsInstance(create_broker("memory://"), InProcessBroker)
+        with override_settings(DEBUG=False, TESTING=False), self.assertLogs(
+            "jobs.broker", "WARNING"
+        ):
+            create_broker("memory://")
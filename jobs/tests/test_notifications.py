@@ -0,0 +1,154 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from jobs.models import Application, Category, Job, Notification, NotificationEvent
+from jobs.tasks import drain_notification_outbox
+
+User = get_user_model()
+
+
+class ApplicationNotificationOutboxTest(APITestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", email="candidate@example.com", password="pass12345"
+        )
+        self.category = Category.objects.create(name="Software")
+        self.job = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=self.category,
+            created_by=self.admin,
+        )
+
+    def apply(self, job, candidate):
+        return Application.objects.create(
+            job=job, candidate=candidate, resume="resumes/cv.pdf"
+        )
+
+    def test_application_records_outbox_event_and_dispatches_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.apply(self.job, self.candidate)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(NotificationEvent.objects.count(), 1)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_drain_writes_notifications_in_batches(self):
+        for i in range(5):
+            candidate = User.objects.create_user(
+                username=f"candidate{i}", password="pass12345"
+            )
+            self.apply(self.job, candidate)
+
+        with CaptureQueriesContext(connection) as ctx:
+            processed = drain_notification_outbox(batch_size=2)
+
+        self.assertEqual(processed, 5)
+        inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "jobs_notification" ')
+        ]
+        self.assertEqual(len(inserts), 3)
+        self.assertFalse(NotificationEvent.objects.exists())
+        messages = set(
+            Notification.objects.filter(user=self.admin).values_list(
+                "message", flat=True
+            )
+        )
+        self.assertEqual(
+            messages,
+            {f"candidate{i} applied for Backend Developer" for i in range(5)},
+        )
+
+    def test_drain_skips_jobs_without_owner(self):
+        self.job.created_by = None
+        self.job.save()
+        self.apply(self.job, self.candidate)
+
+        self.assertEqual(drain_notification_outbox(), 1)
+        self.assertFalse(Notification.objects.exists())
+
+
+class NotificationUnreadCounterTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="candidate", email="candidate@example.com", password="pass12345"
+        )
+        self.other = User.objects.create_user(username="other", password="pass12345")
+        self.notifications = [
+            Notification.objects.create(user=self.user, message=f"Message {i}")
+            for i in range(3)
+        ]
+        Notification.objects.create(user=self.other, message="Not yours")
+        self.client.force_authenticate(user=self.user)
+
+    def test_unread_count_reads_only_the_counter(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("notification-unread-count"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"unread_count": 3})
+
+    def test_mark_read_updates_selected_ids(self):
+        ids = [self.notifications[0].id, self.notifications[1].id]
+        response = self.client.post(
+            reverse("notification-mark-read"), {"ids": ids}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"marked_read": 2, "unread_count": 1})
+
+        # Already-read ids are not counted twice.
+        response = self.client.post(
+            reverse("notification-mark-read"), {"ids": ids}, format="json"
+        )
+        self.assertEqual(response.data, {"marked_read": 0, "unread_count": 1})
+
+    def test_mark_read_ignores_other_users_notifications(self):
+        foreign = Notification.objects.get(user=self.other)
+        response = self.client.post(
+            reverse("notification-mark-read"), {"ids": [foreign.id]}, format="json"
+        )
+        self.assertEqual(response.data, {"marked_read": 0, "unread_count": 3})
+        foreign.refresh_from_db()
+        self.assertFalse(foreign.is_read)
+
+    def test_mark_all_read(self):
+        response = self.client.post(reverse("notification-mark-all-read"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"marked_read": 3, "unread_count": 0})
+        self.assertFalse(
+            Notification.objects.filter(user=self.user, is_read=False).exists()
+        )
+
+    def test_drained_notifications_increment_counter(self):
+        category = Category.objects.create(name="Software")
+        job = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            location="Remote",
+            employment_type="FT",
+            category=category,
+            created_by=self.user,
+        )
+        Application.objects.create(
+            job=job, candidate=self.other, resume="resumes/cv.pdf"
+        )
+        drain_notification_outbox()
+
+        response = self.client.get(reverse("notification-unread-count"))
+        self.assertEqual(response.data, {"unread_count": 4})
+
+    def test_deleting_unread_notification_decrements_counter(self):
+        self.notifications[0].delete()
+        response = self.client.get(reverse("notification-unread-count"))
+        self.assertEqual(response.data, {"unread_count": 2})
@@ -0,0 +1,12 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class QueryPlanCheckTest(TestCase):
+
+    def test_hot_queries_do_not_sequential_scan(self):
+        out = StringIO()
+        call_command("check_query_plans", stdout=out)
+        self.assertNotIn("sequential scan", out.getvalue())
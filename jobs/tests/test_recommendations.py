@@ -0,0 +1,104 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.models import Application, Category, FavoriteJob, Job, Recommendation
+from jobs.recommendations import get_recommended_job_ids, refresh_recommendations
+
+User = get_user_model()
+
+
+class RecommendationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        software = Category.objects.create(name="Software")
+        design = Category.objects.create(name="Design")
+
+        def job(title, description, category=software, **kwargs):
+            return Job.objects.create(
+                title=title,
+                description=description,
+                category=category,
+                created_by=admin,
+                **kwargs,
+            )
+
+        self.django = job("Django Developer", "Build Python APIs with Django")
+        self.backend = job("Backend Engineer", "Python services and Django REST APIs")
+        self.data = job("Data Engineer", "Spark pipelines and warehouses")
+        self.figma = job("UI Designer", "Figma prototypes for mobile apps", design)
+        self.graphic = job("Graphic Designer", "Brand design in Figma", design)
+        self.closed = job(
+            "Django Contractor", "Short Django and Python gig", is_active=False
+        )
+
+        self.alice, self.bob, self.carol, self.dave = [
+            User.objects.create_user(username=name, password="pass12345")
+            for name in ["alice", "bob", "carol", "dave"]
+        ]
+        FavoriteJob.objects.create(user=self.alice, job=self.django)
+        # Bob links the Django job to the data job, which shares no words with it.
+        FavoriteJob.objects.create(user=self.bob, job=self.django)
+        Application.objects.create(candidate=self.bob, job=self.data)
+        FavoriteJob.objects.create(user=self.bob, job=self.graphic)
+        FavoriteJob.objects.create(user=self.dave, job=self.figma)
+
+    def test_recommendations_mix_cooccurrence_and_content(self):
+        self.assertEqual(refresh_recommendations(full=True), 3)
+        alice = Recommendation.objects.get(pk=self.alice.pk).job_ids
+        # Seen and inactive jobs are never recommended.
+        self.assertNotIn(self.django.pk, alice)
+        self.assertNotIn(self.closed.pk, alice)
+        # Co-occurrence (via Bob) and content similarity both count.
+        self.assertIn(self.data.pk, alice)
+        self.assertIn(self.backend.pk, alice)
+        # Jobs with neither signal are left out rather than padded in.
+        self.assertNotIn(self.figma.pk, alice)
+
+        # Nobody else favorited Dave's job, so content alone picks for him.
+        dave = Recommendation.objects.get(pk=self.dave.pk).job_ids
+        self.assertEqual(dave, [self.graphic.pk])
+
+    def test_incremental_refresh_only_rescores_users_with_new_signals(self):
+        refresh_recommendations(full=True)
+        refreshed = Recommendation.objects.get(pk=self.alice.pk).refreshed_at
+        self.assertEqual(refresh_recommendations(), 0)
+
+        FavoriteJob.objects.create(user=self.carol, job=self.backend)
+        self.assertEqual(refresh_recommendations(), 1)
+        self.assertIn(self.django.pk, get_recommended_job_ids(self.carol.pk))
+        self.assertEqual(
+            Recommendation.objects.get(pk=self.alice.pk).refreshed_at, refreshed
+        )
+
+    def test_endpoint_serves_the_cached_list(self):
+        refresh_recommendations(full=True)
+        self.client.force_authenticate(self.alice)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("job-recommended"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [job["id"] for job in response.data],
+            Recommendation.objects.get(pk=self.alice.pk).job_ids,
+        )
+
+        cache.clear()
+        with self.assertNumQueries(2):
+            self.client.get(reverse("job-recommended"))
+
+    def test_users_without_signals_get_popular_jobs(self):
+        self.client.force_authenticate(self.carol)
+        response = self.client.get(reverse("job-recommended"))
+        self.assertEqual(
+            [job["id"] for job in response.data][:2],
+            [self.django.pk, self.graphic.pk],
+        )
+
+    def test_endpoint_requires_authentication(self):
+        response = self.client.get(reverse("job-recommended"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,195 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobboard.celery import app as celery_app
+from jobs.models import Application, Category, FavoriteJob, Job, Report
+from jobs.tasks import generate_report
+
+User = get_user_model()
+
+START = datetime.date(2026, 3, 1)
+
+
+def day(offset):
+    return timezone.make_aware(
+        datetime.datetime.combine(
+            START + datetime.timedelta(days=offset), datetime.time(12)
+        )
+    )
+
+
+class ReportTaskTest(APITestCase):
+    def setUp(self):
+        conf = celery_app.conf
+        previous = {
+            "task_always_eager": conf.task_always_eager,
+            "task_eager_propagates": conf.task_eager_propagates,
+        }
+        conf.update(task_always_eager=True, task_eager_propagates=True)
+        self.addCleanup(conf.update, previous)
+
+        admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        candidates = [
+            User.objects.create_user(username=f"candidate{i}", password="pass12345")
+            for i in range(4)
+        ]
+        software = Category.objects.create(name="Software")
+        design = Category.objects.create(name="Design")
+        self.jobs = []
+        for offset, category in [
+            (0, software),
+            (1, software),
+            (5, design),
+            (9, software),
+            (20, design),
+        ]:
+            job = Job.objects.create(
+                title=f"Job on day {offset}",
+                description="Build things",
+                category=category,
+                created_by=admin,
+            )
+            Job.objects.filter(pk=job.pk).update(created_at=day(offset))
+            self.jobs.append(job)
+
+        for job, candidate, status_, offset in [
+            (0, 0, "ACCEPTED", 0),
+            (0, 1, "REJECTED", 4),
+            (0, 2, "PENDING", 8),
+            (1, 0, "ACCEPTED", 6),
+            (2, 3, "PENDING", 30),
+        ]:
+            application = Application.objects.create(
+                job=self.jobs[job], candidate=candidates[candidate], status=status_
+            )
+            Application.objects.filter(pk=application.pk).update(applied_at=day(offset))
+
+        for job, candidate, offset in [(1, 0, 2), (1, 1, 7), (1, 2, 9), (0, 0, 3)]:
+            favorite = FavoriteJob.objects.create(
+                job=self.jobs[job], user=candidates[candidate]
+            )
+            FavoriteJob.objects.filter(pk=favorite.pk).update(added_at=day(offset))
+
+    def run_report(self, report_type, granularity="day", days=10):
+        report = Report.objects.create(
+            report_type=report_type,
+            date_from=START,
+            date_to=START + datetime.timedelta(days=days - 1),
+            granularity=granularity,
+        )
+        generate_report.delay(str(report.pk))
+        report.refresh_from_db()
+        self.assertEqual(report.status, Report.READY, report.error)
+        return report
+
+    @override_settings(REPORT_CHUNK_DAYS=3)
+    def test_jobs_by_category_is_merged_across_chunks(self):
+        report = self.run_report(Report.JOBS_BY_CATEGORY, granularity="month")
+        self.assertEqual(report.chunks, 4)
+        self.assertEqual(
+            [
+                (row["period"], row["category"], row["jobs"])
+                for row in report.result["rows"]
+            ],
+            [("2026-03-01", "Design", 1), ("2026-03-01", "Software", 3)],
+        )
+
+    @override_settings(REPORT_CHUNK_DAYS=3)
+    def test_application_funnel(self):
+        report = self.run_report(Report.APPLICATION_FUNNEL)
+        first, second = report.result["rows"]
+        self.assertEqual(first["job_id"], self.jobs[0].pk)
+        self.assertEqual(
+            (
+                first["applications"],
+                first["pending"],
+                first["accepted"],
+                first["rejected"],
+            ),
+            (3, 1, 1, 1),
+        )
+        self.assertEqual(first["acceptance_rate"], 0.5)
+        self.assertEqual(
+            (second["title"], second["acceptance_rate"]), ("Job on day 1", 1.0)
+        )
+
+    def test_chunking_does_not_change_the_result(self):
+        for report_type in [Report.APPLICATION_FUNNEL, Report.TOP_FAVORITED]:
+            with override_settings(REPORT_CHUNK_DAYS=1):
+                chunked = self.run_report(report_type)
+            with override_settings(REPORT_CHUNK_DAYS=365):
+                whole = self.run_report(report_type)
+            self.assertEqual((chunked.chunks, whole.chunks), (10, 1))
+            self.assertEqual(chunked.result, whole.result)
+
+        self.assertEqual(
+            [(row["job_id"], row["favorites"]) for row in whole.result["rows"]],
+            [(self.jobs[1].pk, 3), (self.jobs[0].pk, 1)],
+        )
+
+
+class ReportApiTest(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", password="pass12345"
+        )
+        self.url = reverse("report-list")
+        self.params = {
+            "report_type": Report.TOP_FAVORITED,
+            "date_from": "2026-03-01",
+            "date_to": "2026-03-31",
+        }
+        self.client.force_authenticate(self.admin)
+
+    def request_report(self, **extra):
+        with mock.patch("jobs.views.generate_report.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    self.url, {**self.params, **extra}, format="json"
+                )
+        return response, delay
+
+    def test_identical_requests_reuse_the_report(self):
+        response, delay = self.request_report()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], Report.PENDING)
+        delay.assert_called_once_with(str(response.data["id"]))
+
+        again, delay = self.request_report()
+        self.assertEqual(again.status_code, status.HTTP_200_OK)
+        self.assertEqual(again.data["id"], response.data["id"])
+        delay.assert_not_called()
+
+        refreshed, delay = self.request_report(refresh=True)
+        self.assertEqual(refreshed.status_code, status.HTTP_202_ACCEPTED)
+        self.assertNotEqual(refreshed.data["id"], response.data["id"])
+
+        detail = self.client.get(reverse("report-detail", args=[response.data["id"]]))
+        self.assertEqual(detail.status_code, status.HTTP_200_OK)
+        self.assertIsNone(detail.data["result"])
+
+    def test_invalid_ranges_are_rejected(self):
+        response, _ = self.request_report(date_to="2026-02-01")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response, _ = self.request_report(date_to="2030-01-01")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reports_are_admin_only(self):
+        self.client.force_authenticate(self.candidate)
+        response, _ = self.request_report()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN
+        )
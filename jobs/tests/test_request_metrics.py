@@ -0,0 +1,91 @@
+import json
+import logging
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from jobboard.log import JsonFormatter
+from jobs.models import Category, FavoriteJob, Job
+
+User = get_user_model()
+
+
+class RequestMetricsMiddlewareTest(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.user = User.objects.create_user(username="candidate", password="pass12345")
+        category = Category.objects.create(name="Software")
+        for i in range(3):
+            job = Job.objects.create(
+                title=f"Backend Developer {i}",
+                description="Build APIs with Django",
+                location="Remote",
+                employment_type="FT",
+                category=category,
+                created_by=self.admin,
+            )
+            FavoriteJob.objects.create(user=self.user, job=job)
+        self.client.force_authenticate(self.user)
+
+    def test_server_timing_header_and_request_log(self):
+        with self.assertLogs("jobboard.requests", "INFO") as logs:
+            response = self.client.get(reverse("favoritejob-list"))
+
+        record = logs.records[0]
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.view, "favoritejob-list")
+        self.assertEqual(record.status, 200)
+        self.assertGreater(record.db_queries, 0)
+        self.assertIsNotNone(record.slowest_query)
+        self.assertIn(
+            f'db;dur={record.db_ms};desc="{record.db_queries} queries"',
+            response["Server-Timing"],
+        )
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0)
+    def test_slow_request_logs_every_query(self):
+        with self.assertLogs("jobboard.requests", "WARNING") as logs:
+            self.client.get(reverse("favoritejob-list"))
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "slow request")
+        self.assertEqual(len(record.queries), record.db_queries)
+        self.assertTrue(all(query["sql"] for query in record.queries))
+        self.assertIsInstance(record.repeated_queries, list)
+
+    @override_settings(SERVER_TIMING_HEADER=False)
+    def test_header_can_be_disabled(self):
+        with self.assertLogs("jobboard.requests", "INFO"):
+            response = self.client.get(reverse("favoritejob-list"))
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    def test_async_views_are_measured(self):
+        with self.assertLogs("jobboard.requests", "INFO") as logs:
+            self.client.get(reverse("async-job-list"))
+        self.assertEqual(logs.records[0].view, "async-job-list")
+        self.assertGreater(logs.records[0].db_queries, 0)
+
+    async def test_queries_run_in_threads_are_counted_under_asgi(self):
+        cache.clear()
+        for name in ["async-job-list", "job-list", "category-list"]:
+            with self.subTest(view=name):
+                response = await self.async_client.get(reverse(name))
+                self.assertEqual(response.status_code, 200)
+                count = re.search(r'desc="(\d+) queries"', response["Server-Timing"])
+                self.assertGreater(int(count.group(1)), 0)
+
+    def test_json_formatter_includes_extra_fields(self):
+        record = logging.makeLogRecord(
+            {"name": "jobboard.requests", "msg": "request", "levelname": "INFO"}
+        )
+        record.db_queries = 4
+        line = json.loads(JsonFormatter().format(record))
+        self.assertEqual(line["message"], "request")
+        self.assertEqual(line["db_queries"], 4)
+        self.assertNotIn("levelno", line)
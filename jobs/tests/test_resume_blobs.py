@@ -0,0 +1,145 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.models import Application, Category, Job, ResumeBlob, ResumeUpload
+
+User = get_user_model()
+
+PDF = b"%PDF-1.7\n" + b"same resume " * 200
+SHA256 = hashlib.sha256(PDF).hexdigest()
+
+
+class ResumeBlobTest(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        overrides = override_settings(
+            MEDIA_ROOT=self.media_root,
+            RESUME_UPLOAD_STAGING_DIR=os.path.join(self.media_root, "staging"),
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", password="pass12345"
+        )
+        category = Category.objects.create(name="Software")
+        self.jobs = [
+            Job.objects.create(
+                title=f"Developer {i}",
+                description="Build APIs",
+                category=category,
+                created_by=self.admin,
+            )
+            for i in range(3)
+        ]
+        self.client.force_authenticate(user=self.candidate)
+
+    def apply(self, job, content=PDF):
+        response = self.client.post(
+            reverse("application-list"),
+            {"job_id": job.id, "resume": SimpleUploadedFile("cv.pdf", content)},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Application.objects.get(pk=response.data["id"])
+
+    def stored_files(self):
+        return [
+            name
+            for _, _, names in os.walk(os.path.join(self.media_root, "resumes"))
+            for name in names
+        ]
+
+    def test_identical_resumes_share_one_blob(self):
+        first, second = self.apply(self.jobs[0]), self.apply(self.jobs[1])
+
+        blob = ResumeBlob.objects.get()
+        self.assertEqual(blob.sha256, SHA256)
+        self.assertEqual(blob.ref_count, 2)
+        self.assertEqual(first.resume.name, second.resume.name)
+        self.assertEqual(len(self.stored_files()), 1)
+
+    def test_blob_is_reclaimed_with_last_application(self):
+        first, second = self.apply(self.jobs[0]), self.apply(self.jobs[1])
+
+        first.delete()
+        self.assertEqual(ResumeBlob.objects.get().ref_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(ResumeBlob.objects.exists())
+        self.assertEqual(self.stored_files(), [])
+
+    def test_known_hash_skips_the_transfer(self):
+        self.apply(self.jobs[0])
+        data = {"filename": "cv.pdf", "size": len(PDF), "sha256": SHA256}
+
+        response = self.client.post(reverse("resumeupload-list"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["status"], ResumeUpload.READY)
+        self.assertEqual(response.data["offset"], len(PDF))
+
+        response = self.client.post(
+            reverse("application-list"),
+            {"job_id": self.jobs[1].id, "resume_upload_id": response.data["id"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ResumeBlob.objects.get().ref_count, 2)
+
+    def test_known_hash_of_another_user_still_needs_the_bytes(self):
+        self.apply(self.jobs[0])
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            reverse("resumeupload-list"),
+            {"filename": "cv.pdf", "size": len(PDF), "sha256": SHA256},
+            format="json",
+        )
+        self.assertEqual(response.data["status"], ResumeUpload.UPLOADING)
+        self.assertEqual(response.data["offset"], 0)
+
+    def test_migrate_resumes_deduplicates_existing_files(self):
+        other = b"%PDF-1.4\nanother resume"
+        for name, content in (("a.pdf", PDF), ("b.pdf", PDF), ("c.pdf", other)):
+            default_storage.save(f"resumes/{name}", ContentFile(content))
+        candidates = [self.candidate] + [
+            User.objects.create_user(username=f"c{i}", password="pass12345")
+            for i in range(2)
+        ]
+        for candidate, name in zip(candidates, ("a.pdf", "b.pdf", "c.pdf")):
+            Application.objects.create(
+                job=self.jobs[0], candidate=candidate, resume=f"resumes/{name}"
+            )
+        Application.objects.create(
+            job=self.jobs[1], candidate=self.candidate, resume="resumes/gone.pdf"
+        )
+
+        out = io.StringIO()
+        call_command("migrate_resumes", stdout=out)
+
+        self.assertIn("3 resume files as 2 blobs", out.getvalue())
+        self.assertIn(f"saved {len(PDF) / 1024:,.1f} KB", out.getvalue())
+        self.assertIn("Skipped 1 missing files", out.getvalue())
+        self.assertEqual(
+            dict(ResumeBlob.objects.values_list("sha256", "ref_count")),
+            {SHA256: 2, hashlib.sha256(other).hexdigest(): 1},
+        )
+        self.assertEqual(len(self.stored_files()), 2)
+        self.assertFalse(default_storage.exists("resumes/a.pdf"))
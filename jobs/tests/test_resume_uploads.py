@@ -0,0 +1,218 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.models import Application, Category, Job, ResumeUpload
+from jobs.serializers import ApplicationSerializer
+from jobs.tasks import process_resume_upload, purge_stale_resume_uploads
+from jobs.uploads import staging_path
+
+User = get_user_model()
+
+PDF = b"%PDF-1.7\n" + b"resume body " * 500
+
+
+class ResumeUploadTest(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        overrides = override_settings(
+            MEDIA_ROOT=self.media_root,
+            RESUME_UPLOAD_STAGING_DIR=os.path.join(self.media_root, "staging"),
+            RESUME_UPLOAD_CHUNK_SIZE=4096,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.candidate = User.objects.create_user(
+            username="candidate", password="pass12345"
+        )
+        self.job = Job.objects.create(
+            title="Backend Developer",
+            description="Build APIs with Django",
+            category=Category.objects.create(name="Software"),
+            created_by=self.admin,
+        )
+        self.client.force_authenticate(user=self.candidate)
+
+    def start(self, content=PDF, filename="cv.pdf"):
+        response = self.client.post(
+            reverse("resumeupload-list"),
+            {"filename": filename, "size": len(content)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def put_chunk(self, upload_id, content, start, total=None):
+        total = total if total is not None else len(PDF)
+        return self.client.generic(
+            "PUT",
+            reverse("resumeupload-chunk", args=[upload_id]),
+            content,
+            content_type="application/octet-stream",
+            HTTP_CONTENT_RANGE=f"bytes {start}-{start + len(content) - 1}/{total}",
+        )
+
+    def upload(self, content=PDF, filename="cv.pdf"):
+        upload_id = self.start(content, filename)
+        with mock.patch("jobs.views.process_resume_upload.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                for start in range(0, len(content), 4096):
+                    response = self.put_chunk(
+                        upload_id, content[start : start + 4096], start, len(content)
+                    )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        delay.assert_called_once_with(str(upload_id))
+        return upload_id
+
+    def test_chunks_are_staged_then_stored_by_the_task(self):
+        upload_id = self.upload()
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, ResumeUpload.PROCESSING)
+        self.assertEqual(os.path.getsize(staging_path(upload)), len(PDF))
+
+        self.assertTrue(process_resume_upload(str(upload_id)))
+
+        upload.refresh_from_db()
+        sha256 = hashlib.sha256(PDF).hexdigest()
+        self.assertEqual(upload.status, ResumeUpload.READY)
+        self.assertEqual(upload.sha256, sha256)
+        self.assertEqual(upload.blob.file.name, f"resumes/{sha256[:2]}/{sha256}.pdf")
+        self.assertEqual(upload.blob.file.read(), PDF)
+        self.assertFalse(os.path.exists(staging_path(upload)))
+
+    def test_out_of_order_chunk_reports_current_offset(self):
+        upload_id = self.start()
+        self.assertEqual(
+            self.put_chunk(upload_id, PDF[:4096], 0).status_code, status.HTTP_200_OK
+        )
+
+        response = self.put_chunk(upload_id, PDF[:4096], 0)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["offset"], 4096)
+
+        response = self.client.get(reverse("resumeupload-detail", args=[upload_id]))
+        self.assertEqual(response.data["offset"], 4096)
+
+    def test_oversized_chunk_is_refused(self):
+        upload_id = self.start()
+        response = self.put_chunk(upload_id, PDF[:5000], 0)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_content_not_matching_extension_fails(self):
+        upload_id = self.upload(b"MZ not a pdf" * 10)
+        self.assertFalse(process_resume_upload(str(upload_id)))
+
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, ResumeUpload.FAILED)
+        self.assertIn("does not match", upload.error)
+        self.assertFalse(os.path.exists(staging_path(upload)))
+
+    def test_unexpected_error_fails_the_upload(self):
+        upload_id = self.upload()
+        with mock.patch(
+            "jobs.uploads.store_blob", side_effect=OSError("disk full")
+        ), self.assertRaises(OSError):
+            process_resume_upload(str(upload_id))
+
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, ResumeUpload.FAILED)
+        self.assertIn("upload it again", upload.error)
+        self.assertFalse(os.path.exists(staging_path(upload)))
+
+    def test_purge_fails_uploads_stuck_in_processing(self):
+        upload_id = self.upload()
+        fresh_id = self.upload()
+        ResumeUpload.objects.filter(pk=upload_id).update(
+            updated_at=timezone.now() - timedelta(hours=2)
+        )
+        purge_stale_resume_uploads()
+
+        upload = ResumeUpload.objects.get(pk=upload_id)
+        self.assertEqual(upload.status, ResumeUpload.FAILED)
+        self.assertFalse(os.path.exists(staging_path(upload)))
+        fresh = ResumeUpload.objects.get(pk=fresh_id)
+        self.assertEqual(fresh.status, ResumeUpload.PROCESSING)
+        self.assertTrue(os.path.exists(staging_path(fresh)))
+
+    def test_identical_content_is_stored_once(self):
+        first, second = self.upload(), self.upload()
+        process_resume_upload(str(first))
+        process_resume_upload(str(second))
+
+        names = set(ResumeUpload.objects.values_list("blob__file", flat=True))
+        self.assertEqual(len(names), 1)
+        self.assertEqual(
+            len(os.listdir(os.path.dirname(os.path.join(self.media_root, *names)))),
+            1,
+        )
+
+    def test_apply_with_processing_upload_gets_resume_when_ready(self):
+        upload_id = self.upload()
+        response = self.client.post(
+            reverse("application-list"),
+            {"job_id": self.job.id, "resume_upload_id": str(upload_id)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        application = Application.objects.get(pk=response.data["id"])
+        self.assertEqual(application.resume.name, "")
+
+        process_resume_upload(str(upload_id))
+
+        application.refresh_from_db()
+        blob = ResumeUpload.objects.get(pk=upload_id).blob
+        self.assertEqual(application.resume_blob, blob)
+        self.assertEqual(application.resume.name, blob.file.name)
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 1)
+
+    def test_upload_finishing_between_validate_and_create_is_attached(self):
+        upload_id = self.upload()
+        validate = ApplicationSerializer.validate
+
+        def validate_then_finish(serializer, attrs):
+            attrs = validate(serializer, attrs)
+            # The worker finishes while no application is waiting yet.
+            process_resume_upload(str(upload_id))
+            return attrs
+
+        with mock.patch.object(ApplicationSerializer, "validate", validate_then_finish):
+            response = self.client.post(
+                reverse("application-list"),
+                {"job_id": self.job.id, "resume_upload_id": str(upload_id)},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        application = Application.objects.get(pk=response.data["id"])
+        blob = ResumeUpload.objects.get(pk=upload_id).blob
+        self.assertEqual(application.resume_blob, blob)
+        self.assertEqual(application.resume.name, blob.file.name)
+        blob.refresh_from_db()
+        self.assertEqual(blob.ref_count, 1)
+
+    def test_cannot_apply_with_someone_elses_upload(self):
+        upload_id = self.upload()
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            reverse("application-list"),
+            {"job_id": self.job.id, "resume_upload_id": str(upload_id)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("resume_upload_id", response.data)
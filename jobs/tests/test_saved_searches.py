@@ -0,0 +1,130 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from jobs.alerts import match_new_jobs
+from jobs.models import Category, Job, JobAlertMark, Notification, SavedSearch
+from jobs.notifications import get_unread_count
+
+User = get_user_model()
+
+
+@override_settings(JOB_ALERT_SETTLE_SECONDS=0)
+class SavedSearchAlertTest(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="adminuser", email="admin@example.com", password="adminpassword123"
+        )
+        self.alice, self.bob, self.carol = [
+            User.objects.create_user(username=name, password="pass12345")
+            for name in ["alice", "bob", "carol"]
+        ]
+        self.software = Category.objects.create(name="Software")
+        self.design = Category.objects.create(name="Design")
+        self.old_job = self.create_job("Legacy Systems Developer")
+        match_new_jobs()
+
+    def create_job(self, title, category=None, **kwargs):
+        return Job.objects.create(
+            title=title,
+            description="A great job",
+            category=category or self.software,
+            created_by=self.admin,
+            **{"location": "Cairo", "employment_type": "FT", **kwargs},
+        )
+
+    def save_search(self, user, **criteria):
+        self.client.force_authenticate(user)
+        response = self.client.post(
+            reverse("savedsearch-list"), criteria, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return response.data["id"]
+
+    def alerts(self, user):
+        return list(
+            Notification.objects.filter(user=user)
+            .order_by("id")
+            .values_list("message", flat=True)
+        )
+
+    def test_new_jobs_are_matched_against_every_criterion(self):
+        self.save_search(
+            self.alice, name="Remote Django", search="django", location="remote"
+        )
+        self.save_search(self.bob, category=self.software.pk, employment_type="FT")
+        self.save_search(self.carol, search="Product designer")
+
+        self.create_job("Senior Django Developer", location="Remote")
+        self.create_job("Django Developer", location="Cairo")
+        self.create_job("Product Designer", category=self.design, employment_type="PT")
+        self.create_job("Designer, Product", category=self.design, is_active=False)
+
+        self.assertEqual(match_new_jobs(), 4)
+        self.assertEqual(
+            self.alerts(self.alice),
+            ["New job for Remote Django: Senior Django Developer"],
+        )
+        self.assertEqual(len(self.alerts(self.bob)), 2)
+        self.assertEqual(
+            self.alerts(self.carol),
+            ["New job for Product designer: Product Designer"],
+        )
+        self.assertEqual(get_unread_count(self.bob.pk), 2)
+
+        # Jobs are matched once; older jobs never were.
+        self.assertEqual(match_new_jobs(), 0)
+        self.assertNotIn(self.old_job.title, " ".join(self.alerts(self.bob)))
+
+    def test_searches_only_see_jobs_posted_after_them(self):
+        self.create_job("Django Developer")
+        self.save_search(self.alice, search="django")
+        self.assertEqual(match_new_jobs(), 0)
+        self.assertEqual(
+            JobAlertMark.objects.get().last_job_id, Job.objects.latest("pk").pk
+        )
+
+    def test_overlapping_searches_alert_once(self):
+        self.save_search(self.alice, search="django")
+        self.save_search(self.alice, location="Cairo")
+        self.create_job("Django Developer")
+        self.assertEqual(match_new_jobs(), 1)
+
+    @override_settings(JOB_ALERT_SETTLE_SECONDS=3600)
+    def test_unsettled_jobs_wait_for_the_next_run(self):
+        self.save_search(self.alice, search="django")
+        self.create_job("Django Developer")
+        self.assertEqual(match_new_jobs(), 0)
+        self.assertEqual(JobAlertMark.objects.get().last_job_id, self.old_job.pk)
+
+    def test_searches_are_indexed_under_their_most_selective_key(self):
+        search_id = self.save_search(
+            self.alice, search="senior python developer", category=self.software.pk
+        )
+        search = SavedSearch.objects.get(pk=search_id)
+        self.assertEqual(search.anchor, "term:developer")
+        self.assertEqual(
+            search.keys,
+            [
+                "term:developer",
+                "term:python",
+                "term:senior",
+                f"category:{self.software.pk}",
+            ],
+        )
+
+    def test_searches_need_a_criterion_and_belong_to_their_owner(self):
+        self.client.force_authenticate(self.alice)
+        response = self.client.post(
+            reverse("savedsearch-list"),
+            {"name": "Anything", "search": "the"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        search_id = self.save_search(self.bob, search="django")
+        self.client.force_authenticate(self.alice)
+        response = self.client.get(reverse("savedsearch-detail", args=[search_id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
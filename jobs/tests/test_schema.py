@@ -0,0 +1,66 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from jobboard import schema
+from jobboard.schema import schema_cache
+
+
+class SchemaCacheTest(APITestCase):
+    def setUp(self):
+        schema_cache.clear()
+        self.addCleanup(schema_cache.clear)
+
+    def test_schema_is_generated_once(self):
+        with mock.patch.object(
+            schema, "generate_schema", wraps=schema.generate_schema
+        ) as generate:
+            first = self.client.get("/api/docs/schema.json")
+            second = self.client.get("/api/jobs/swagger.json/?format=openapi")
+            self.client.get("/api/docs/schema.yaml")
+
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+        self.assertIn("/jobs/jobs/", json.loads(first.content)["paths"])
+
+    def test_conditional_get_returns_not_modified(self):
+        response = self.client.get("/api/docs/schema.json")
+        self.assertIn("ETag", response)
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+        response = self.client.get(
+            "/api/docs/schema.json", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_schema_is_gzipped(self):
+        response = self.client.get("/api/docs/schema.json", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_generated_file_is_served_without_regenerating(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "openapi.json"
+            call_command("generate_schema", output=str(path), stdout=mock.Mock())
+            spec = json.loads(path.read_text())
+            spec["info"]["title"] = "From disk"
+            path.write_text(json.dumps(spec))
+
+            with override_settings(API_SCHEMA_FILE=str(path)), mock.patch.object(
+                schema, "generate_schema"
+            ) as generate:
+                response = self.client.get("/api/docs/schema.json")
+
+        generate.assert_not_called()
+        self.assertEqual(json.loads(response.content)["info"]["title"], "From disk")
+
+    def test_unfinished_report_duration_is_nullable(self):
+        spec = json.loads(self.client.get("/api/docs/schema.json").content)
+        duration = spec["definitions"]["Report"]["properties"]["duration_ms"]
+        self.assertEqual(duration["type"], "integer")
+        self.assertTrue(duration["x-nullable"])
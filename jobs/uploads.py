@@ -0,0 +1,180 @@
+import hashlib
+import os
+import re
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from .blobs import add_references, store_blob
+from .models import Application, ResumeBlob, ResumeUpload
+
+COPY_BUFFER = 64 * 1024
+
+# Extension -> leading bytes a real file of that type starts with.
+RESUME_SIGNATURES = {
+    ".pdf": (b"%PDF-",),
+    ".doc": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),
+    ".docx": (b"PK\x03\x04",),
+}
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class ResumeRejected(Exception):
+    """The uploaded bytes are not an acceptable resume."""
+
+
+def resume_extension(filename):
+    return os.path.splitext(filename)[1].lower()
+
+
+def staging_path(upload):
+    return os.path.join(settings.RESUME_UPLOAD_STAGING_DIR, f"{upload.pk}.part")
+
+
+def parse_content_range(header):
+    """Parse ``bytes <start>-<end>/<total>`` into ``(start, end, total)``."""
+    match = CONTENT_RANGE_RE.match(header or "")
+    if not match:
+        raise ValueError("Content-Range must look like 'bytes <start>-<end>/<total>'.")
+    start, end, total = (int(value) for value in match.groups())
+    if end < start or end >= total:
+        raise ValueError("Content-Range end must lie between start and total.")
+    return start, end, total
+
+
+def write_chunk(upload, stream, start, length):
+    """
+    Copy ``length`` bytes from ``stream`` into the staging file at ``start``.
+
+    The body is never held in memory as a whole; it is copied in
+    ``COPY_BUFFER`` sized reads. Returns the number of bytes written.
+    """
+    path = staging_path(upload)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = 0
+    with open(path, "r+b" if os.path.exists(path) else "wb") as staged:
+        staged.seek(start)
+        while written < length:
+            data = stream.read(min(COPY_BUFFER, length - written))
+            if not data:
+                break
+            staged.write(data)
+            written += len(data)
+        staged.truncate(start + written)
+    return written
+
+
+def discard_staged(upload):
+    try:
+        os.remove(staging_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def inspect_staged(upload):
+    """Validate the staged file and return its SHA-256 hex digest."""
+    path = staging_path(upload)
+    size = os.path.getsize(path)
+    if size != upload.size:
+        raise ResumeRejected(f"Expected {upload.size} bytes, received {size}.")
+    if size > settings.RESUME_UPLOAD_MAX_SIZE:
+        raise ResumeRejected("File is larger than the allowed resume size.")
+
+    signatures = RESUME_SIGNATURES.get(resume_extension(upload.filename))
+    if signatures is None:
+        raise ResumeRejected("Unsupported resume file type.")
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as staged:
+        head = staged.read(COPY_BUFFER)
+        if not head.startswith(signatures):
+            raise ResumeRejected("File content does not match its extension.")
+        while head:
+            digest.update(head)
+            head = staged.read(COPY_BUFFER)
+    return digest.hexdigest()
+
+
+def store_resume(upload):
+    """Validate a fully received upload and return its ``ResumeBlob``."""
+    sha256 = inspect_staged(upload)
+    if upload.sha256 and upload.sha256 != sha256:
+        raise ResumeRejected("Content does not match the declared SHA-256.")
+    with open(staging_path(upload), "rb") as staged:
+        return store_blob(
+            File(staged), sha256, upload.size, resume_extension(upload.filename)
+        )
+
+
+def fail_upload(upload, error):
+    ResumeUpload.objects.filter(pk=upload.pk).update(
+        status=ResumeUpload.FAILED, error=str(error)[:255]
+    )
+
+
+def finish_upload(upload):
+    """
+    Validate and store ``upload``, then point waiting applications at it.
+
+    The upload never stays ``PROCESSING`` once its bytes are gone: it fails
+    on a rejection, and on any other error too, which is then re-raised
+    for the task to report.
+    """
+    try:
+        with transaction.atomic():
+            blob = store_resume(upload)
+            ResumeUpload.objects.filter(pk=upload.pk).update(
+                status=ResumeUpload.READY, blob=blob, sha256=blob.sha256, error=""
+            )
+            attach_waiting_applications(upload, blob)
+    except ResumeRejected as exc:
+        fail_upload(upload, exc)
+        return False
+    except Exception:
+        fail_upload(upload, "The resume could not be stored; please upload it again.")
+        raise
+    finally:
+        discard_staged(upload)
+    return True
+
+
+def attach_waiting_applications(upload, blob):
+    attached = Application.objects.filter(
+        resume_upload_id=upload.pk, resume_blob=None
+    ).update(resume_blob=blob, resume=blob.file.name)
+    if attached:
+        add_references(blob.sha256, attached)
+
+
+def reuse_known_blob(upload):
+    """
+    Complete ``upload`` without a transfer when its owner already stored the
+    declared content. Returns whether the upload was completed.
+    """
+    if not upload.sha256:
+        return False
+    owned = Exists(
+        Application.objects.filter(
+            resume_blob=OuterRef("pk"), candidate_id=upload.owner_id
+        )
+    ) | Exists(
+        ResumeUpload.objects.filter(
+            blob=OuterRef("pk"), owner_id=upload.owner_id, status=ResumeUpload.READY
+        )
+    )
+    with transaction.atomic():
+        blob = (
+            ResumeBlob.objects.select_for_update()
+            .filter(owned, sha256=upload.sha256, size=upload.size)
+            .first()
+        )
+        if blob is None:
+            return False
+        upload.blob = blob
+        upload.received = upload.size
+        upload.status = ResumeUpload.READY
+        upload.save(update_fields=["blob", "received", "status", "updated_at"])
+    return True
@@ -1,15 +1,18 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 
+from jobboard.schema import schema_view
+
+from . import async_views
 from .views import (
     CategoryViewSet,
     JobViewSet,
     ApplicationViewSet,
     FavoriteJobViewSet,
     NotificationViewSet,
+    ReportViewSet,
+    ResumeUploadViewSet,
+    SavedSearchViewSet,
 )
 
 # -------------------------------
@@ -21,34 +24,35 @@ router.register(r"jobs", JobViewSet, basename="job")
 router.register(r"applications", ApplicationViewSet, basename="application")
 router.register(r"favorite-jobs", FavoriteJobViewSet, basename="favoritejob")
 router.register(r"notifications", NotificationViewSet, basename="notification")
-
-# -------------------------------
-# Swagger Schema
-# -------------------------------
-schema_view = get_schema_view(
-    openapi.Info(
-        title="JobBoard API",
-        default_version="v1",
-        description="API documentation for the JobBoard project",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="support@jobboard.com"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+router.register(r"resume-uploads", ResumeUploadViewSet, basename="resumeupload")
+router.register(r"reports", ReportViewSet, basename="report")
+router.register(r"saved-searches", SavedSearchViewSet, basename="savedsearch")
 
 # -------------------------------
 # URL Patterns
 # -------------------------------
 urlpatterns = [
+    # Declared before the router so "stream" is not taken for a notification id
+    path(
+        "notifications/stream/",
+        async_views.notification_stream,
+        name="notification-stream",
+    ),
     path("", include(router.urls)),
+    # Async read endpoints, served on the event loop under jobboard.asgi
+    path("async/jobs/", async_views.job_list, name="async-job-list"),
+    path("async/jobs/<int:pk>/", async_views.job_detail, name="async-job-detail"),
+    path(
+        "async/notifications/",
+        async_views.notification_list,
+        name="async-notification-list",
+    ),
     # Swagger & Redoc
-    path("swagger.json/", schema_view.without_ui(cache_timeout=0), name="schema-json"),
+    path("swagger.json/", schema_view.without_ui(), name="schema-json"),
     path(
         "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
+        schema_view.with_ui("swagger"),
         name="schema-swagger-ui",
     ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path("redoc/", schema_view.with_ui("redoc"), name="schema-redoc"),
 ]
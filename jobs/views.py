@@ -1,20 +1,64 @@
-from rest_framework import viewsets, permissions, filters, serializers
-from rest_framework.exceptions import NotAuthenticated
+from django.conf import settings
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import mixins, status, viewsets, permissions, filters, serializers
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.decorators import action
+from rest_framework.exceptions import (
+    NotAuthenticated,
+    PermissionDenied,
+    ValidationError,
+)
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import pagination
-from drf_yasg.utils import swagger_auto_schema
+from drf_yasg.utils import no_body, swagger_auto_schema
 from drf_yasg import openapi
 
-from .models import Category, Job, Application, FavoriteJob, Notification
+from .applications import bulk_update_status
+from .cache import AnonymousResponseCacheMixin, job_response_cache
+from .exports import export_response
+from .facets import cached_facet_counts, facet_counts, parse_facets
+from .models import (
+    Category,
+    Job,
+    Application,
+    FavoriteJob,
+    Notification,
+    Report,
+    ResumeUpload,
+    SavedSearch,
+)
+from .notifications import get_unread_count, mark_notifications_read
+from .pagination import JobCursorPagination
+from .projections import ProjectedListMixin
+from .recommendations import get_recommended_job_ids
+from .renderers import FastJSONRenderer
+from .reports import find_reusable_report
+from .search import JobSearchFilter
+from .stats import get_job_stats
 from .serializers import (
     CategorySerializer,
+    CategoryStatsSerializer,
     JobSerializer,
+    JobStatsSerializer,
     ApplicationSerializer,
     ApplicationStatusUpdateSerializer,
+    ApplicationBulkStatusSerializer,
+    ApplicationBulkStatusResponseSerializer,
+    ApplicationExportQuerySerializer,
+    ExportQuerySerializer,
     FavoriteJobSerializer,
     NotificationSerializer,
+    NotificationMarkReadSerializer,
+    NotificationMarkReadResultSerializer,
+    NotificationUnreadCountSerializer,
+    ReportSerializer,
+    ResumeUploadSerializer,
+    SavedSearchSerializer,
 )
-
+from .tasks import generate_report, process_resume_upload
+from .uploads import parse_content_range, reuse_known_blob, write_chunk
 
 # -------------------------------
 # Custom Permissions
@@ -46,11 +90,50 @@ class IsApplicantOrOwnerOrAdmin(permissions.BasePermission):
             return True
 
         if request.method in permissions.SAFE_METHODS:
-            return obj.candidate == request.user
+            return obj.candidate_id == request.user.pk
 
         return False
 
 
+# -------------------------------
+# Query Parameters
+# -------------------------------
+
+
+def parse_field_list(param, raw, allowed):
+    """``"title,id"`` -> ``["title", "id"]``; a 400 on names not in ``allowed``."""
+    names = list(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValidationError(
+            {
+                param: f"Unknown field {', '.join(unknown)}; "
+                f"choose from {', '.join(allowed)}."
+            }
+        )
+    return names
+
+
+# ?fields= and ?expand= as documented on the job read endpoints.
+FIELD_SELECTION_PARAMETERS = [
+    openapi.Parameter(
+        "fields",
+        openapi.IN_QUERY,
+        description=(
+            "Comma-separated job fields to return (for example `id,title`); "
+            "only their columns and joins are loaded. Defaults to all fields."
+        ),
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "expand",
+        openapi.IN_QUERY,
+        description="Comma-separated optional fields to add: `stats` (platform admins).",
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+
 # -------------------------------
 # ViewSets
 # -------------------------------
@@ -61,7 +144,11 @@ class FavoriteJobViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return FavoriteJob.objects.filter(user=self.request.user)
+        if getattr(self, "swagger_fake_view", False):
+            return FavoriteJob.objects.none()
+        return FavoriteJob.objects.filter(user_id=self.request.user.pk).select_related(
+            "job", "user"
+        )
 
     @swagger_auto_schema(
         operation_summary="Add job to favorites",
@@ -77,14 +164,36 @@ class FavoriteJobViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         job_id = self.request.data.get("job_id")
-        if FavoriteJob.objects.filter(user=self.request.user, job_id=job_id).exists():
+        if FavoriteJob.objects.filter(
+            user_id=self.request.user.pk, job_id=job_id
+        ).exists():
             raise serializers.ValidationError("This job is already in your favorites.")
-        serializer.save(user=self.request.user)
+        serializer.save(user_id=self.request.user.pk)
 
 
-class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+class SavedSearchViewSet(viewsets.ModelViewSet):
+    """
+    Saved job searches. Jobs posted later that match every given criterion
+    (all ``search`` words in the title, category, location, employment
+    type) arrive as notifications.
+    """
+
+    serializer_class = SavedSearchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return SavedSearch.objects.none()
+        return SavedSearch.objects.filter(user_id=self.request.user.pk)
+
+    def perform_create(self, serializer):
+        serializer.save(user_id=self.request.user.pk)
+
+
+class NotificationViewSet(ProjectedListMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     @swagger_auto_schema(
         operation_summary="List user notifications",
@@ -95,8 +204,48 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         return super().list(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Notification.objects.filter(user=self.request.user).order_by(
-            "-created_at"
+        if getattr(self, "swagger_fake_view", False):
+            return Notification.objects.none()
+        return (
+            Notification.objects.filter(user_id=self.request.user.pk)
+            .select_related("user")
+            .order_by("-created_at")
+        )
+
+    @swagger_auto_schema(
+        operation_summary="Unread notification count",
+        operation_description="Read the authenticated user's unread counter.",
+        responses={200: NotificationUnreadCountSerializer},
+    )
+    @action(detail=False, methods=["get"], url_path="unread-count")
+    def unread_count(self, request):
+        return Response({"unread_count": get_unread_count(request.user.pk)})
+
+    @swagger_auto_schema(
+        operation_summary="Mark all notifications as read",
+        request_body=no_body,
+        responses={200: NotificationMarkReadResultSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="mark-all-read")
+    def mark_all_read(self, request):
+        return self._mark_read(request.user.pk)
+
+    @swagger_auto_schema(
+        operation_summary="Mark notifications as read",
+        operation_description="Mark the given notification ids as read.",
+        request_body=NotificationMarkReadSerializer,
+        responses={200: NotificationMarkReadResultSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="mark-read")
+    def mark_read(self, request):
+        serializer = NotificationMarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return self._mark_read(request.user.pk, serializer.validated_data["ids"])
+
+    def _mark_read(self, user_id, ids=None):
+        marked_read = mark_notifications_read(user_id, ids)
+        return Response(
+            {"marked_read": marked_read, "unread_count": get_unread_count(user_id)}
         )
 
 
@@ -113,30 +262,186 @@ class CategoryViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
+    @swagger_auto_schema(
+        operation_summary="Category stats",
+        operation_description="Active job postings per category.",
+        responses={200: CategoryStatsSerializer(many=True)},
+    )
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        queryset = Category.objects.select_related("stats").order_by("name")
+        page = self.paginate_queryset(queryset)
+        serializer = CategoryStatsSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(
+    AnonymousResponseCacheMixin, ProjectedListMixin, viewsets.ModelViewSet
+):
     serializer_class = JobSerializer
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    response_cache = job_response_cache
+    export_fields = [
+        "id",
+        "title",
+        "description",
+        "location",
+        "employment_type",
+        "category_id",
+        "category__name",
+        "created_by__username",
+        "is_active",
+        "created_at",
+        "updated_at",
+    ]
     pagination_class = pagination.PageNumberPagination
+    cursor_pagination_class = JobCursorPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        JobSearchFilter,
         filters.OrderingFilter,
     ]
-    search_fields = ["title", "description", "location"]
     ordering_fields = ["created_at", "title"]
     filterset_fields = ["category", "location", "employment_type"]
 
+    # Actions that render only the fields picked with ``?fields=``.
+    sparse_actions = ["list", "retrieve", "recommended"]
+
     def get_queryset(self):
-        queryset = Job.objects.all().select_related("category", "created_by")
+        if getattr(self, "swagger_fake_view", False):
+            return Job.objects.none()
+        fields, expand = self.get_field_selection()
+        queryset = Job.objects.all()
+        if self.action in self.sparse_actions:
+            queryset = self.load_fields(queryset, fields, expand)
+        else:
+            queryset = queryset.select_related("category", "created_by")
+            if self.action == "stats" or "stats" in expand:
+                queryset = queryset.select_related("stats")
         if self.request.user.is_authenticated and self.request.user.is_superuser:
             return queryset
         return queryset.filter(is_active=True)
 
+    def load_fields(self, queryset, fields, expand):
+        """
+        Load just the columns the rendered fields read, joining only the
+        relations among them; ``created_at`` stays for cursor pagination.
+        """
+        sources = JobSerializer.field_sources
+        names = fields or [
+            name for name in sources if name not in JobSerializer.expandable_fields
+        ]
+        paths = ["created_at"]
+        paths += [path for name in [*names, *expand] for path in sources[name]]
+        relations = {
+            path.split("__")[0]
+            for path in paths
+            if Job._meta.get_field(path.split("__")[0]).is_relation
+        }
+        if relations:
+            # A bare select_related() would follow every foreign key.
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*paths)
+
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action in [
+            "create",
+            "update",
+            "partial_update",
+            "destroy",
+            "export",
+            "stats",
+        ]:
             return [IsPlatformAdmin()]
+        if self.action == "recommended":
+            return [permissions.IsAuthenticated()]
         return [permissions.AllowAny()]
 
+    def get_field_selection(self):
+        """
+        ``(fields, expand)`` from ``?fields=`` and ``?expand=``; ``fields`` is
+        ``None`` for every default field. Only platform admins can expand
+        ``stats`` (also spelled ``?include=stats``); others are ignored.
+        """
+        if getattr(self, "swagger_fake_view", False):
+            return None, []
+        if not hasattr(self, "_field_selection"):
+            params = self.request.query_params
+            expandable = JobSerializer.expandable_fields
+            fields = None
+            if self.action in self.sparse_actions and params.get("fields"):
+                fields = parse_field_list(
+                    "fields",
+                    params["fields"],
+                    [
+                        name
+                        for name in JobSerializer.field_sources
+                        if name not in expandable
+                    ],
+                )
+            expand = parse_field_list("expand", params.get("expand", ""), expandable)
+            if "stats" in params.get("include", "").split(","):
+                expand = sorted({*expand, "stats"})
+            if not self.request.user.is_superuser:
+                expand = [name for name in expand if name != "stats"]
+            self._field_selection = fields, expand
+        return self._field_selection
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"], context["expand"] = self.get_field_selection()
+        return context
+
+    @property
+    def paginator(self):
+        # ?pagination=cursor opts into keyset pagination (no COUNT, no OFFSET).
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == "cursor":
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "facets",
+                openapi.IN_QUERY,
+                description=(
+                    "Comma-separated facets (category, location, "
+                    "employment_type) to count over the filtered jobs; the "
+                    "counts are returned under `facets`."
+                ),
+                type=openapi.TYPE_STRING,
+            ),
+            *FIELD_SELECTION_PARAMETERS,
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        try:
+            self.facets = parse_facets(request.query_params.get("facets", ""))
+        except ValueError as exc:
+            raise ValidationError({"facets": str(exc)})
+        return super().list(request, *args, **kwargs)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.action == "list" and getattr(self, "facets", None):
+            response.data["facets"] = self.get_facet_counts()
+        return response
+
+    def get_facet_counts(self):
+        """One grouped query; the unfiltered list is served from the cache."""
+        params = self.request.query_params
+        if any(params.get(name) for name in ["search", *self.filterset_fields]):
+            return facet_counts(self.filter_queryset(self.get_queryset()), self.facets)
+        scope = "all" if self.request.user.is_superuser else "active"
+        return cached_facet_counts(self.get_queryset(), self.facets, scope)
+
+    @swagger_auto_schema(manual_parameters=FIELD_SELECTION_PARAMETERS)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @swagger_auto_schema(
         operation_summary="Create job",
         operation_description="Platform admins can create new jobs.",
@@ -147,13 +452,79 @@ class JobViewSet(viewsets.ModelViewSet):
         return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user)
+        serializer.save(created_by_id=self.request.user.pk)
+
+    @swagger_auto_schema(
+        operation_summary="Export jobs",
+        operation_description=(
+            "Platform admins stream every job matching the list filters as CSV "
+            "or NDJSON."
+        ),
+        query_serializer=ExportQuerySerializer,
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def export(self, request):
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = self.filter_queryset(self.get_queryset())
+        return export_response(
+            request,
+            queryset,
+            self.export_fields,
+            params.validated_data["export_format"],
+            "jobs",
+        )
+
+    @swagger_auto_schema(
+        operation_summary="Job stats",
+        operation_description=(
+            "Platform admins read a job's application counts by status and its "
+            "favorites count from the denormalized counters."
+        ),
+        responses={200: JobStatsSerializer},
+    )
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        return Response(JobStatsSerializer(get_job_stats(self.get_object())).data)
+
+    @swagger_auto_schema(
+        operation_summary="Recommended jobs",
+        operation_description=(
+            "Active jobs picked for the signed-in user from their favorites "
+            "and applications, best first. Lists are precomputed by a "
+            "background task; users without either get the most popular jobs."
+        ),
+        manual_parameters=FIELD_SELECTION_PARAMETERS,
+        responses={200: JobSerializer(many=True)},
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def recommended(self, request):
+        job_ids = get_recommended_job_ids(request.user.pk)
+        jobs = self.get_queryset().filter(is_active=True).in_bulk(job_ids)
+        serializer = self.get_serializer(
+            [jobs[pk] for pk in job_ids if pk in jobs], many=True
+        )
+        return Response(serializer.data)
 
 
 class ApplicationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsApplicantOrOwnerOrAdmin]
+    export_fields = [
+        "id",
+        "job_id",
+        "job__title",
+        "candidate_id",
+        "candidate__username",
+        "candidate__email",
+        "resume",
+        "cover_letter",
+        "status",
+        "applied_at",
+    ]
 
     def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return Application.objects.none()
         user = self.request.user
         queryset = Application.objects.all().select_related("job", "candidate")
 
@@ -163,9 +534,11 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         if user.is_superuser:
             return queryset
 
-        return queryset.filter(candidate=user)
+        return queryset.filter(candidate_id=user.pk)
 
     def get_serializer_class(self):
+        if getattr(self, "swagger_fake_view", False):
+            return ApplicationSerializer
         if (
             self.action in ["update", "partial_update"]
             and self.request.user.is_superuser
@@ -182,10 +555,225 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
+    @swagger_auto_schema(
+        operation_summary="Bulk update application status",
+        operation_description=(
+            "Platform admins move many applications to one status at once, "
+            "selected by ids or by job (optionally narrowed by current status)."
+        ),
+        request_body=ApplicationBulkStatusSerializer,
+        responses={200: ApplicationBulkStatusResponseSerializer},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-status",
+        permission_classes=[IsPlatformAdmin],
+    )
+    def bulk_status(self, request):
+        serializer = ApplicationBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        updated, results = bulk_update_status(
+            data["status"],
+            ids=data.get("ids"),
+            job_id=data.get("job_id"),
+            current_status=data.get("current_status"),
+        )
+        return Response({"updated": updated, "results": results})
+
+    @swagger_auto_schema(
+        operation_summary="Export applications",
+        operation_description=(
+            "Stream applications as CSV or NDJSON. Platform admins may export "
+            "everything; a job's owner may export the applications for that job."
+        ),
+        query_serializer=ApplicationExportQuerySerializer,
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def export(self, request):
+        params = ApplicationExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        job_id = params.validated_data.get("job")
+
+        queryset = Application.objects.all()
+        if job_id is not None:
+            queryset = queryset.filter(job_id=job_id)
+        if not request.user.is_superuser and not (
+            job_id is not None
+            and Job.objects.filter(id=job_id, created_by_id=request.user.pk).exists()
+        ):
+            raise PermissionDenied("Only the job's owner can export its applications.")
+
+        return export_response(
+            request,
+            queryset,
+            self.export_fields,
+            params.validated_data["export_format"],
+            f"applications-job-{job_id}" if job_id else "applications",
+        )
+
     def perform_create(self, serializer):
         job_id = self.request.data.get("job_id")
         if Application.objects.filter(
-            job_id=job_id, candidate=self.request.user
+            job_id=job_id, candidate_id=self.request.user.pk
         ).exists():
             raise serializers.ValidationError("You have already applied for this job.")
-        serializer.save(candidate=self.request.user)
+        serializer.save(candidate_id=self.request.user.pk)
+
+
+class ResumeUploadViewSet(
+    mixins.CreateModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+):
+    """
+    Resumable resume uploads: create the upload, PUT its bytes in chunks to
+    ``chunk/``, then pass its id as ``resume_upload_id`` when applying.
+    """
+
+    serializer_class = ResumeUploadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return ResumeUpload.objects.none()
+        return ResumeUpload.objects.filter(owner_id=self.request.user.pk)
+
+    @swagger_auto_schema(
+        operation_summary="Start a resume upload",
+        operation_description=(
+            "Declare the file name and total size, then send the bytes to "
+            "the upload's chunk endpoint. If `sha256` names a file you "
+            "uploaded before, the upload is returned `READY` straight away "
+            "and no bytes need to be sent."
+        ),
+        request_body=ResumeUploadSerializer,
+        responses={201: ResumeUploadSerializer},
+    )
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        upload = serializer.save(owner_id=self.request.user.pk)
+        reuse_known_blob(upload)
+
+    @swagger_auto_schema(
+        operation_summary="Upload a resume chunk",
+        operation_description=(
+            "Send raw file bytes with `Content-Range: bytes <start>-<end>/<size>`. "
+            "`start` must equal the upload's current `offset`; after an "
+            "interruption, GET the upload and resume from there. The last "
+            "chunk answers 202 and hands the file to a background worker."
+        ),
+        request_body=no_body,
+        manual_parameters=[
+            openapi.Parameter(
+                "Content-Range",
+                openapi.IN_HEADER,
+                type=openapi.TYPE_STRING,
+                required=True,
+            )
+        ],
+        responses={
+            200: ResumeUploadSerializer,
+            202: ResumeUploadSerializer,
+            409: "Chunk does not start at the current offset",
+            413: "Chunk larger than RESUME_UPLOAD_CHUNK_SIZE",
+        },
+    )
+    @action(detail=True, methods=["put"])
+    def chunk(self, request, pk=None):
+        try:
+            start, end, total = parse_content_range(
+                request.headers.get("Content-Range")
+            )
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        length = end - start + 1
+        if length > settings.RESUME_UPLOAD_CHUNK_SIZE:
+            return Response(
+                {"detail": "Chunk is too large."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if int(request.META.get("CONTENT_LENGTH") or 0) != length:
+            return Response(
+                {"detail": "Content-Length does not match Content-Range."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        with transaction.atomic():
+            upload = get_object_or_404(self.get_queryset().select_for_update(), pk=pk)
+            if total != upload.size:
+                return Response(
+                    {"detail": f"Upload size is {upload.size} bytes."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if upload.status != ResumeUpload.UPLOADING or start != upload.received:
+                return Response(
+                    {
+                        "detail": "Chunk does not continue the upload.",
+                        "offset": upload.received,
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            # Read straight from the request stream so the body is never
+            # buffered in memory or parsed by DRF.
+            upload.received = start + write_chunk(upload, request.stream, start, length)
+            complete = upload.received == upload.size
+            if complete:
+                upload.status = ResumeUpload.PROCESSING
+                transaction.on_commit(
+                    lambda: process_resume_upload.delay(str(upload.pk)), robust=True
+                )
+            upload.save(update_fields=["received", "status", "updated_at"])
+
+        return Response(
+            self.get_serializer(upload).data,
+            status=status.HTTP_202_ACCEPTED if complete else status.HTTP_200_OK,
+        )
+
+
+class ReportViewSet(
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Platform analytics reports. POST the parameters, then GET the report
+    until its status is ``READY``.
+    """
+
+    queryset = Report.objects.all()
+    serializer_class = ReportSerializer
+    permission_classes = [IsPlatformAdmin]
+
+    @swagger_auto_schema(
+        operation_summary="Request a report",
+        operation_description=(
+            "Starts computing the report in the background and answers 202 "
+            "with its id. If an identical report was requested within "
+            "`REPORT_REUSE_SECONDS`, that report is returned with 200 "
+            "instead; pass `refresh: true` to force a new one."
+        ),
+        request_body=ReportSerializer,
+        responses={200: ReportSerializer, 202: ReportSerializer},
+    )
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        params = dict(serializer.validated_data)
+        refresh = params.pop("refresh")
+
+        report = None if refresh else find_reusable_report(**params)
+        if report is not None:
+            return Response(self.get_serializer(report).data)
+
+        with transaction.atomic():
+            report = Report.objects.create(requested_by_id=request.user.pk, **params)
+            transaction.on_commit(
+                lambda: generate_report.delay(str(report.pk)), robust=True
+            )
+        return Response(
+            self.get_serializer(report).data, status=status.HTTP_202_ACCEPTED
+        )
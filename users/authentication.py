@@ -0,0 +1,176 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import (
+    JWTAuthentication,
+    JWTStatelessUserAuthentication,
+)
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from jobboard.metrics import observe_cache
+
+User = get_user_model()
+
+TOKEN_VERSION_CLAIM = "ver"
+# Claims copied from the user into every token; changing any of them (or the
+# password) bumps ``token_version`` and so revokes tokens issued before.
+USER_CLAIMS = ("username", "role", "is_staff", "is_superuser")
+REVOKING_FIELDS = USER_CLAIMS + ("is_active", "password")
+
+
+# -------------------------------
+# Token versions
+# -------------------------------
+
+
+def _token_version_key(user_id):
+    return f"users:token_version:{user_id}"
+
+
+def get_token_version(user_id):
+    """Current ``token_version`` of a user, or ``None`` if the user is gone."""
+    key = _token_version_key(user_id)
+    version = cache.get(key)
+    observe_cache("token_version", version is not None)
+    if version is None:
+        version = (
+            User.objects.filter(pk=user_id, is_active=True)
+            .values_list("token_version", flat=True)
+            .first()
+        )
+        if version is not None:
+            cache.set(key, version, timeout=settings.TOKEN_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+def forget_token_version(user_id):
+    cache.delete(_token_version_key(user_id))
+
+
+def check_token_version(token):
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    version = get_token_version(user_id)
+    if version is None or version != token.get(TOKEN_VERSION_CLAIM):
+        raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+
+
+# -------------------------------
+# Tokens
+# -------------------------------
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """Refresh token whose access tokens carry the user's role and flags."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ClaimsRefreshToken
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if TOKEN_VERSION_CLAIM in refresh:
+            check_token_version(refresh)
+        return super().validate(attrs)
+
+
+# -------------------------------
+# Users
+# -------------------------------
+
+
+class _UserCache:
+    """Tiny per-process TTL cache of full user rows, keyed by id."""
+
+    max_size = 1024
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        user = User.objects.get(pk=user_id)
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                self._entries.clear()
+            self._entries[user_id] = (now + settings.JWT_USER_CACHE_TTL, user)
+        return user
+
+    def discard(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = _UserCache()
+
+
+class ClaimsTokenUser(TokenUser):
+    """
+    Request user built from token claims alone.
+
+    ``id``, ``role``, ``is_staff`` and ``is_superuser`` need no query; anything
+    else should go through :meth:`get_instance`, which loads the full row and
+    keeps it for ``JWT_USER_CACHE_TTL`` seconds.
+    """
+
+    @cached_property
+    def role(self):
+        return self.token.get("role", "candidate")
+
+    def get_instance(self):
+        return user_cache.get(self.id)
+
+
+def get_user_instance(user):
+    """Return a ``CustomUser`` row for any authenticated ``request.user``."""
+    if isinstance(user, ClaimsTokenUser):
+        return user.get_instance()
+    return user
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Authenticate from the access token's claims instead of loading the user.
+
+    The only lookup left is the user's ``token_version``, which is served from
+    the Django cache. Tokens issued without claims fall back to the regular
+    database lookup.
+    """
+
+    def get_user(self, validated_token):
+        if TOKEN_VERSION_CLAIM not in validated_token:
+            return JWTAuthentication.get_user(self, validated_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        check_token_version(validated_token)
+        return ClaimsTokenUser(validated_token)
@@ -10,6 +10,8 @@ class CustomUser(AbstractUser):
     )
 
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default="candidate")
+    # Bumped whenever claims embedded in issued JWTs go stale; see users.authentication
+    token_version = models.PositiveIntegerField(default=0, editable=False)
 
 def is_admin_role(self):
     return self.role == "admin" or self.is_staff 
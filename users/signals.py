@@ -0,0 +1,39 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .authentication import REVOKING_FIELDS, forget_token_version, user_cache
+
+User = get_user_model()
+
+
+@receiver(pre_save, sender=User)
+def bump_token_version(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Revoke issued tokens when a claim they carry (or the password) changes."""
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not set(update_fields) & set(REVOKING_FIELDS):
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk)
+        .values("token_version", *REVOKING_FIELDS)
+        .first()
+    )
+    if previous and any(
+        previous[field] != getattr(instance, field) for field in REVOKING_FIELDS
+    ):
+        # Written directly so saves with ``update_fields`` persist it too.
+        instance.token_version = previous["token_version"] + 1
+        sender.objects.filter(pk=instance.pk).update(
+            token_version=instance.token_version
+        )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    user_cache.discard(instance.pk)
+    forget_token_version(instance.pk)
+    # Again after commit, in case a concurrent request re-cached the old row.
+    transaction.on_commit(lambda: forget_token_version(instance.pk))
@@ -1,6 +1,7 @@
 from rest_framework import generics, permissions
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
+from .authentication import get_user_instance
 from .serializers import UserSerializer, RegisterSerializer
 
 User = get_user_model()
@@ -23,4 +24,4 @@ class ProfileView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
-        return self.request.user
+        return get_user_instance(self.request.user)